@@ -6,16 +6,24 @@ Provides a single source of truth for all configurable parameters.
 """
 
 import os
-import toml
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+import sys
+import functools
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Optional, Mapping, Tuple, Union, get_args, get_origin
+from dataclasses import dataclass, field, fields
 from dotenv import load_dotenv
 import logging
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AccountConfig:
     """IBKR account configuration."""
     account_number: str
@@ -25,7 +33,7 @@ class AccountConfig:
     read_only: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SymbolConfig:
     """Per-symbol trading configuration."""
     symbol: str
@@ -53,8 +61,15 @@ class SymbolConfig:
     # Risk limits
     max_position_size_percent: float = 10.0  # % of portfolio
 
+    # Derived: roll_when_pnl_percent as a fraction, so strategies can compare
+    # P&L ratios without scaling to percent first
+    roll_when_pnl_ratio: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'roll_when_pnl_ratio', self.roll_when_pnl_percent / 100.0)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class RiskConfig:
     """Risk management configuration."""
     # Portfolio limits
@@ -73,8 +88,11 @@ class RiskConfig:
     # Position limits
     max_total_positions: Optional[int] = None
 
+    # Stop checking a trade at its first violation (False reports every reason)
+    fail_fast: bool = True
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StrategyConfig:
     """Strategy-specific configuration."""
     strategy_name: str = "wheel"
@@ -88,7 +106,7 @@ class StrategyConfig:
     strangle_enabled: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataConfig:
     """Data provider configuration."""
     primary_provider: str = "ibkr"
@@ -101,8 +119,12 @@ class DataConfig:
     avoid_earnings: bool = True
     earnings_buffer_days: int = 7
 
+    # Directory for cached daily bars (relative to the working directory);
+    # None disables the cache
+    bar_cache_dir: Optional[str] = None
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ScheduleConfig:
     """Scheduling configuration."""
     # Run schedule
@@ -114,10 +136,10 @@ class ScheduleConfig:
     trading_end_hour: int = 20    # 4:00 PM ET
 
     # Days of week (0 = Monday, 6 = Sunday)
-    trading_days: List[int] = field(default_factory=lambda: [0, 1, 2, 3, 4])
+    trading_days: Tuple[int, ...] = (0, 1, 2, 3, 4)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -136,11 +158,11 @@ class LoggingConfig:
     slack_webhook_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Main configuration object."""
     account: AccountConfig
-    symbols: Dict[str, SymbolConfig]
+    symbols: Mapping[str, SymbolConfig]  # Read-only view
     risk: RiskConfig
     strategy: StrategyConfig
     data: DataConfig
@@ -151,6 +173,117 @@ class Config:
     dry_run: bool = True
 
 
+def _field_coercer(field_type: Any) -> Optional[Callable[[Any], Any]]:
+    """
+    Return the function that coerces raw TOML values for a dataclass field.
+
+    Numeric fields (optionally wrapped in Optional) are cast so that e.g. an
+    integer written in TOML still loads into a float field; tuple fields are
+    built from TOML arrays. Everything else is used as-is (None).
+    """
+    if field_type in (int, float):
+        return field_type
+
+    origin = get_origin(field_type)
+    if origin is Union:
+        args = [arg for arg in get_args(field_type) if arg is not type(None)]
+        if len(args) == 1 and args[0] in (int, float):
+            inner = args[0]
+            return lambda value: None if value is None else inner(value)
+    elif origin is tuple:
+        return tuple
+
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _field_coercers(cls: type) -> Dict[str, Optional[Callable[[Any], Any]]]:
+    """Map each init field of a config dataclass to its coercer."""
+    return {f.name: _field_coercer(f.type) for f in fields(cls) if f.init}
+
+
+def _coerce_fields(cls: type, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the keys of a TOML table that are fields of cls, coerced to type."""
+    coercers = _field_coercers(cls)
+    coerced = {}
+    for key, value in data.items():
+        if key in coercers:
+            coerce = coercers[key]
+            coerced[key] = coerce(value) if coerce else value
+    return coerced
+
+
+def _build(cls: type, data: Dict[str, Any]) -> Any:
+    """Build a config dataclass from a TOML table; missing keys use defaults."""
+    return cls(**_coerce_fields(cls, data))
+
+
+# SymbolConfig defaults, used as the base every ticker's settings merge onto
+_SYMBOL_DEFAULTS = {
+    f.name: f.default
+    for f in fields(SymbolConfig)
+    if f.init and f.name != 'symbol'
+}
+
+
+# Environment variables that override TOML settings, per config section.
+# Credentials live in .env so they never have to be committed in the TOML.
+_ENV_OVERRIDES = {
+    'account': {
+        'account_number': 'IBKR_ACCOUNT_NUMBER',
+    },
+    'data': {
+        'polygon_api_key': 'POLYGON_API_KEY',
+    },
+    'logging': {
+        'email_to': 'EMAIL_TO',
+        'email_from': 'EMAIL_FROM',
+        'smtp_server': 'SMTP_SERVER',
+        'slack_webhook_url': 'SLACK_WEBHOOK_URL',
+    },
+}
+
+
+def _apply_env_overrides(section: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a section's TOML data with any set environment overrides applied."""
+    environ = os.environ
+    overrides = {
+        key: environ[var]
+        for key, var in _ENV_OVERRIDES.get(section, {}).items()
+        if var in environ
+    }
+    return data | overrides if overrides else data
+
+
+def _env_override_values() -> Tuple[Optional[str], ...]:
+    """Current value of every override variable, for the load cache key."""
+    environ = os.environ
+    return tuple(
+        environ.get(var)
+        for section in _ENV_OVERRIDES.values()
+        for var in section.values()
+    )
+
+
+# Validation rules as (predicate, error message) pairs, built once at import
+# and shared by every ConfigLoader. A rule fails when its predicate is False.
+_SYMBOL_RULES = (
+    (lambda s: 0 < s.target_delta < 1,
+     "Invalid target_delta for {symbol}: must be between 0 and 1"),
+    (lambda s: s.dte_min <= s.dte_max,
+     "Invalid DTE range for {symbol}: min > max"),
+    (lambda s: s.roll_when_dte <= s.dte_min,
+     "Invalid roll DTE for {symbol}: roll_when_dte > dte_min"),
+)
+
+_RISK_RULES = (
+    (lambda r: 0 < r.max_portfolio_margin_usage <= 1,
+     "max_portfolio_margin_usage must be between 0 and 1"),
+    (lambda r: 0 < r.max_concentration_per_symbol <= 1,
+     "max_concentration_per_symbol must be between 0 and 1"),
+)
+
+
 class ConfigLoader:
     """Loads and validates configuration from TOML and environment variables."""
 
@@ -169,6 +302,10 @@ class ConfigLoader:
         """
         Load configuration from files and environment.
 
+        Parsed configs are memoized on the modification times of the TOML
+        and .env files and on the environment overrides, so repeated loads
+        of unchanged files and environment are free.
+
         Returns:
             Config object with all settings
 
@@ -176,43 +313,51 @@ class ConfigLoader:
             ValueError: If configuration is invalid
             FileNotFoundError: If config files don't exist
         """
-        # Load environment variables
-        load_dotenv(self.env_path)
-
-        # Load TOML config
         if not os.path.exists(self.config_path):
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
-        with open(self.config_path, 'r') as f:
-            config_data = toml.load(f)
-
-        # Parse account config (from env + toml)
-        account_config = self._load_account_config(config_data.get('account', {}))
-
-        # Parse symbols
-        symbols_config = self._load_symbols_config(config_data.get('symbols', {}))
+        return _load_cached(
+            self.config_path,
+            _mtime_ns(self.config_path),
+            self.env_path,
+            _mtime_ns(self.env_path),
+            _env_override_values()
+        )
 
-        # Parse risk config
-        risk_config = self._load_risk_config(config_data.get('risk', {}))
+    def _load_uncached(self) -> Config:
+        """Parse, build and validate configuration without memoization."""
+        # Load environment variables
+        load_dotenv(self.env_path)
 
-        # Parse strategy config
-        strategy_config = self._load_strategy_config(config_data.get('strategy', {}))
+        # Load TOML config (read in one call, then parse from memory)
+        config_data = tomllib.loads(Path(self.config_path).read_text(encoding='utf-8'))
 
-        # Parse data config (from env + toml)
-        data_config = self._load_data_config(config_data.get('data', {}))
+        # Parse account config (from env + toml); the account number is
+        # required by the dataclass but validated below, so default it
+        account_config = _build(
+            AccountConfig,
+            {'account_number': ''} | _apply_env_overrides('account', config_data.get('account', {}))
+        )
 
-        # Parse schedule config
-        schedule_config = self._load_schedule_config(config_data.get('schedule', {}))
+        # Parse symbols
+        symbols_config = self._load_symbols_config(config_data.get('symbols', {}))
 
-        # Parse logging config (from env + toml)
-        logging_config = self._load_logging_config(config_data.get('logging', {}))
+        # Parse remaining sections (data and logging from env + toml)
+        risk_config = _build(RiskConfig, config_data.get('risk', {}))
+        strategy_config = _build(StrategyConfig, config_data.get('strategy', {}))
+        data_config = _build(DataConfig, _apply_env_overrides('data', config_data.get('data', {})))
+        schedule_config = _build(ScheduleConfig, config_data.get('schedule', {}))
+        logging_config = _build(
+            LoggingConfig,
+            _apply_env_overrides('logging', config_data.get('logging', {}))
+        )
 
         # Global settings
         dry_run = config_data.get('dry_run', True)
 
         config = Config(
             account=account_config,
-            symbols=symbols_config,
+            symbols=MappingProxyType(symbols_config),
             risk=risk_config,
             strategy=strategy_config,
             data=data_config,
@@ -230,105 +375,35 @@ class ConfigLoader:
 
         return config
 
-    def _load_account_config(self, account_data: Dict[str, Any]) -> AccountConfig:
-        """Load account configuration from env and TOML."""
-        return AccountConfig(
-            account_number=os.getenv('IBKR_ACCOUNT_NUMBER', account_data.get('account_number', '')),
-            host=account_data.get('host', '127.0.0.1'),
-            port=int(account_data.get('port', 7497)),
-            client_id=int(account_data.get('client_id', 1)),
-            read_only=account_data.get('read_only', False)
-        )
-
     def _load_symbols_config(self, symbols_data: Dict[str, Any]) -> Dict[str, SymbolConfig]:
-        """Load per-symbol configuration."""
+        """
+        Load per-symbol configuration.
+
+        Disabled tickers are skipped without building a SymbolConfig, since
+        nothing downstream trades them.
+        """
         symbols = {}
 
-        # Get global defaults
-        defaults = symbols_data.get('defaults', {})
+        # Overlay the TOML defaults on the dataclass defaults once; each
+        # ticker then only needs a single dict merge
+        base = _SYMBOL_DEFAULTS | _coerce_fields(SymbolConfig, symbols_data.get('defaults', {}))
 
         # Get per-symbol overrides
         tickers = symbols_data.get('tickers', {})
 
         for symbol, symbol_data in tickers.items():
             # Merge defaults with symbol-specific settings
-            merged = {**defaults, **symbol_data}
-
-            symbols[symbol] = SymbolConfig(
-                symbol=symbol,
-                enabled=merged.get('enabled', True),
-                max_positions=int(merged.get('max_positions', 1)),
-                target_delta=float(merged.get('target_delta', 0.30)),
-                min_premium=float(merged.get('min_premium', 0.0)),
-                min_premium_percent=float(merged.get('min_premium_percent', 0.0)),
-                dte_min=int(merged.get('dte_min', 30)),
-                dte_max=int(merged.get('dte_max', 45)),
-                roll_when_dte=int(merged.get('roll_when_dte', 21)),
-                roll_when_pnl_percent=float(merged.get('roll_when_pnl_percent', 50.0)),
-                write_calls_on_assignment=merged.get('write_calls_on_assignment', True),
-                max_position_size_percent=float(merged.get('max_position_size_percent', 10.0))
-            )
+            merged = base | _coerce_fields(SymbolConfig, symbol_data)
 
-        return symbols
+            if not merged['enabled']:
+                logger.debug(f"Skipping disabled symbol {symbol}")
+                continue
 
-    def _load_risk_config(self, risk_data: Dict[str, Any]) -> RiskConfig:
-        """Load risk management configuration."""
-        return RiskConfig(
-            max_portfolio_margin_usage=float(risk_data.get('max_portfolio_margin_usage', 0.5)),
-            max_concentration_per_symbol=float(risk_data.get('max_concentration_per_symbol', 0.25)),
-            max_vix_for_new_positions=risk_data.get('max_vix_for_new_positions'),
-            reduce_size_when_vix_above=risk_data.get('reduce_size_when_vix_above', 30.0),
-            vix_size_reduction_factor=float(risk_data.get('vix_size_reduction_factor', 0.5)),
-            enable_stop_loss=risk_data.get('enable_stop_loss', False),
-            stop_loss_percent=float(risk_data.get('stop_loss_percent', 50.0)),
-            max_total_positions=risk_data.get('max_total_positions')
-        )
-
-    def _load_strategy_config(self, strategy_data: Dict[str, Any]) -> StrategyConfig:
-        """Load strategy configuration."""
-        return StrategyConfig(
-            strategy_name=strategy_data.get('strategy_name', 'wheel'),
-            wheel_enabled=strategy_data.get('wheel_enabled', True),
-            prefer_cash_secured_puts=strategy_data.get('prefer_cash_secured_puts', True),
-            iron_condor_enabled=strategy_data.get('iron_condor_enabled', False),
-            strangle_enabled=strategy_data.get('strangle_enabled', False)
-        )
-
-    def _load_data_config(self, data_config: Dict[str, Any]) -> DataConfig:
-        """Load data provider configuration."""
-        return DataConfig(
-            primary_provider=data_config.get('primary_provider', 'ibkr'),
-            polygon_api_key=os.getenv('POLYGON_API_KEY', data_config.get('polygon_api_key')),
-            use_polygon_for_greeks=data_config.get('use_polygon_for_greeks', False),
-            avoid_earnings=data_config.get('avoid_earnings', True),
-            earnings_buffer_days=int(data_config.get('earnings_buffer_days', 7))
-        )
-
-    def _load_schedule_config(self, schedule_data: Dict[str, Any]) -> ScheduleConfig:
-        """Load scheduling configuration."""
-        return ScheduleConfig(
-            run_on_startup=schedule_data.get('run_on_startup', True),
-            run_every_minutes=int(schedule_data.get('run_every_minutes', 60)),
-            trading_start_hour=int(schedule_data.get('trading_start_hour', 14)),
-            trading_end_hour=int(schedule_data.get('trading_end_hour', 20)),
-            trading_days=schedule_data.get('trading_days', [0, 1, 2, 3, 4])
-        )
+            # Interned to match the symbols on fetched positions
+            symbol = sys.intern(symbol)
+            symbols[symbol] = SymbolConfig(**(merged | {'symbol': symbol}))
 
-    def _load_logging_config(self, logging_data: Dict[str, Any]) -> LoggingConfig:
-        """Load logging and alerting configuration."""
-        return LoggingConfig(
-            level=logging_data.get('level', 'INFO'),
-            log_to_file=logging_data.get('log_to_file', True),
-            log_dir=logging_data.get('log_dir', 'logs'),
-            log_format=logging_data.get('log_format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
-            enable_email_alerts=logging_data.get('enable_email_alerts', False),
-            email_to=os.getenv('EMAIL_TO', logging_data.get('email_to')),
-            email_from=os.getenv('EMAIL_FROM', logging_data.get('email_from')),
-            smtp_server=os.getenv('SMTP_SERVER', logging_data.get('smtp_server')),
-            smtp_port=int(logging_data.get('smtp_port', 587)),
-            enable_slack_alerts=logging_data.get('enable_slack_alerts', False),
-            slack_webhook_url=os.getenv('SLACK_WEBHOOK_URL', logging_data.get('slack_webhook_url'))
-        )
+        return symbols
 
     def _validate_config(self, config: Config) -> None:
         """
@@ -343,24 +418,17 @@ class ConfigLoader:
 
         # Validate symbols
         if not config.symbols:
-            raise ValueError("At least one symbol must be configured")
+            raise ValueError("At least one enabled symbol must be configured")
 
         for symbol, symbol_config in config.symbols.items():
-            if symbol_config.target_delta <= 0 or symbol_config.target_delta >= 1:
-                raise ValueError(f"Invalid target_delta for {symbol}: must be between 0 and 1")
-
-            if symbol_config.dte_min > symbol_config.dte_max:
-                raise ValueError(f"Invalid DTE range for {symbol}: min > max")
-
-            if symbol_config.roll_when_dte > symbol_config.dte_min:
-                raise ValueError(f"Invalid roll DTE for {symbol}: roll_when_dte > dte_min")
+            for check, message in _SYMBOL_RULES:
+                if not check(symbol_config):
+                    raise ValueError(message.format(symbol=symbol))
 
         # Validate risk
-        if config.risk.max_portfolio_margin_usage <= 0 or config.risk.max_portfolio_margin_usage > 1:
-            raise ValueError("max_portfolio_margin_usage must be between 0 and 1")
-
-        if config.risk.max_concentration_per_symbol <= 0 or config.risk.max_concentration_per_symbol > 1:
-            raise ValueError("max_concentration_per_symbol must be between 0 and 1")
+        for check, message in _RISK_RULES:
+            if not check(config.risk):
+                raise ValueError(message)
 
         # Validate strategy
         if not any([config.strategy.wheel_enabled, config.strategy.iron_condor_enabled,
@@ -370,6 +438,33 @@ class ConfigLoader:
         logger.info("Configuration validation passed")
 
 
+def _mtime_ns(path: str) -> Optional[int]:
+    """Return a file's modification time in nanoseconds, or None if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(
+    config_path: str,
+    config_mtime: Optional[int],
+    env_path: str,
+    env_mtime: Optional[int],
+    env_values: Tuple[Optional[str], ...]
+) -> Config:
+    """
+    Load configuration, memoized on file paths, modification times and
+    environment overrides.
+
+    The mtime and env_values arguments are only part of the cache key:
+    editing either file or changing an override variable changes the key
+    and forces a fresh parse.
+    """
+    return ConfigLoader(config_path, env_path)._load_uncached()
+
+
 def load_config(config_path: str = "configs/thetagang.toml", env_path: str = ".env") -> Config:
     """
     Convenience function to load configuration.
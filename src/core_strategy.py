@@ -13,7 +13,9 @@ Returns recommended trades without executing them directly.
 
 import logging
 from typing import List, Optional, Dict, Tuple
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+
+import numpy as np
 
 from src.strategy_base import Strategy, StrategyType, Action, TradeRecommendation
 from src.data_fetcher import OptionChainData, Position, AccountInfo
@@ -69,147 +71,174 @@ class WheelStrategy(Strategy):
 
         # Skip if symbol is disabled
         if not self.config.enabled:
-            logger.debug(f"{self.symbol} is disabled, skipping")
+            logger.debug("%s is disabled, skipping", self.symbol)
             return recommendations
 
-        # Separate stock and option positions
-        stock_positions = [p for p in positions if p.position_type == 'stock']
-        put_positions = [p for p in positions if p.position_type == 'option' and p.right == 'P']
-        call_positions = [p for p in positions if p.position_type == 'option' and p.right == 'C']
+        # Separate stock and option positions and gather the aggregates
+        # needed below in a single pass
+        stock_positions, put_positions, call_positions = [], [], []
+        has_stock = has_short_puts = has_short_calls = False
+        stock_qty = total_short_puts = total_short_calls = 0
+
+        for p in positions:
+            if p.position_type == 'stock':
+                stock_positions.append(p)
+                stock_qty += p.quantity
+                if p.quantity > 0:
+                    has_stock = True
+            elif p.position_type == 'option':
+                if p.right == 'P':
+                    put_positions.append(p)
+                    if p.quantity < 0:
+                        has_short_puts = True
+                        total_short_puts -= p.quantity  # quantity < 0 here
+                elif p.right == 'C':
+                    call_positions.append(p)
+                    if p.quantity < 0:
+                        has_short_calls = True
+                        total_short_calls -= p.quantity  # quantity < 0 here
 
         logger.info(f"{self.symbol}: Stock={len(stock_positions)}, Puts={len(put_positions)}, Calls={len(call_positions)}")
 
-        # Check existing positions for rolling/closing opportunities
-        for put_pos in put_positions:
-            recommendation = self._check_put_position(put_pos, stock_price, options_chain)
+        # Use one reference date for every DTE computed in this call
+        today = date.today()
+
+        # Check existing positions for rolling/closing opportunities.
+        # A vectorized pre-screen skips positions that need no action.
+        for put_pos in self._positions_needing_action(put_positions, today):
+            recommendation = self._check_put_position(put_pos, stock_price, options_chain, today)
             if recommendation:
                 recommendations.append(recommendation)
 
-        for call_pos in call_positions:
-            recommendation = self._check_call_position(call_pos, stock_price, options_chain)
+        for call_pos in self._positions_needing_action(call_positions, today):
+            recommendation = self._check_call_position(call_pos, stock_price, options_chain, today)
             if recommendation:
                 recommendations.append(recommendation)
 
         # Determine if we should open new positions
-        has_stock = any(p.quantity > 0 for p in stock_positions)
-        has_short_puts = any(p.quantity < 0 for p in put_positions)
-        has_short_calls = any(p.quantity < 0 for p in call_positions)
-
-        # Count current option positions
-        total_short_puts = sum(abs(p.quantity) for p in put_positions if p.quantity < 0)
-        total_short_calls = sum(abs(p.quantity) for p in call_positions if p.quantity < 0)
-
         if has_stock and not has_short_calls:
             # We have stock but no covered calls - sell calls
-            stock_qty = sum(p.quantity for p in stock_positions)
             contracts_to_sell = (stock_qty // 100) - total_short_calls
 
             if contracts_to_sell > 0:
                 recommendation = self._find_covered_call(
                     stock_price,
                     options_chain,
-                    contracts_to_sell
+                    contracts_to_sell,
+                    today
                 )
                 if recommendation:
                     recommendations.append(recommendation)
 
         elif not has_stock and not has_short_puts:
             # No stock and no short puts - sell cash-secured puts
-            if total_short_puts < self.config.max_positions:
-                contracts_to_sell = self.config.max_positions - total_short_puts
+            max_positions = self.config.max_positions
+            if total_short_puts < max_positions:
+                contracts_to_sell = max_positions - total_short_puts
                 recommendation = self._find_cash_secured_put(
                     stock_price,
                     options_chain,
                     account_info,
-                    contracts_to_sell
+                    contracts_to_sell,
+                    today
                 )
                 if recommendation:
                     recommendations.append(recommendation)
 
         return recommendations
 
-    def _check_put_position(
+    def _positions_needing_action(
         self,
-        position: Position,
-        stock_price: float,
-        options_chain: List[OptionChainData]
-    ) -> Optional[TradeRecommendation]:
+        positions: List[Position],
+        today: date
+    ) -> List[Position]:
         """
-        Check if an existing put position should be rolled or closed.
+        Pre-screen option positions for close or roll candidates.
+
+        Computes DTE and P&L for all positions at once and keeps only those
+        that hit the profit target or the roll DTE threshold. The per-position
+        checks still decide the final action for the survivors.
 
         Args:
-            position: Current put position
-            stock_price: Current stock price
-            options_chain: Available options
+            positions: Option positions of a single right
+            today: Reference date for DTE
 
         Returns:
-            Trade recommendation if action needed, None otherwise
+            Positions that may need to be closed or rolled
         """
-        if not position.expiration:
-            return None
-
-        # Calculate DTE
-        dte = (position.expiration.date() - datetime.now().date()).days
+        if not positions:
+            return []
 
-        # Calculate P&L percentage
-        entry_credit = abs(position.avg_cost)
-        current_value = abs(position.market_value)
-        pnl_percent = ((entry_credit - current_value) / entry_credit * 100) if entry_credit > 0 else 0
-
-        logger.debug(f"{self.symbol} put at ${position.strike}: DTE={dte}, P&L={pnl_percent:.1f}%")
+        n = len(positions)
+        has_expiration = np.fromiter(
+            (p.expiration is not None for p in positions), dtype=bool, count=n
+        )
+        dte = np.fromiter(
+            ((p.expiration_date - today).days if p.expiration else 0 for p in positions),
+            dtype=np.int64,
+            count=n
+        )
+        entry_credit = np.abs(np.fromiter((p.avg_cost for p in positions), dtype=np.float64, count=n))
+        current_value = np.abs(np.fromiter((p.market_value for p in positions), dtype=np.float64, count=n))
 
-        # Check if we should close for profit
-        if pnl_percent >= self.config.roll_when_pnl_percent:
-            return TradeRecommendation(
-                action=Action.CLOSE_PUT,
-                symbol=self.symbol,
-                quantity=abs(position.quantity),
-                strategy_type=StrategyType.WHEEL,
-                existing_position=position,
-                reasoning=f"Close put for {pnl_percent:.1f}% profit (target {self.config.roll_when_pnl_percent}%)"
-            )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pnl_ratio = np.where(entry_credit > 0, 1.0 - current_value / entry_credit, 0.0)
 
-        # Check if we should roll based on DTE
-        if dte <= self.config.roll_when_dte:
-            # Find new put to roll to
-            new_option = self._find_option_by_delta(
-                options_chain,
-                'P',
-                self.config.target_delta,
-                stock_price,
-                self.config.dte_min,
-                self.config.dte_max
-            )
+        cfg = self.config
+        needs_action = has_expiration & (
+            (pnl_ratio >= cfg.roll_when_pnl_ratio) |
+            (dte <= cfg.roll_when_dte)
+        )
 
-            if new_option:
-                return TradeRecommendation(
-                    action=Action.ROLL_PUT,
-                    symbol=self.symbol,
-                    quantity=abs(position.quantity),
-                    strategy_type=StrategyType.WHEEL,
-                    existing_position=position,
-                    new_strike=new_option.strike,
-                    new_expiration=new_option.expiration,
-                    premium=(new_option.bid + new_option.ask) / 2,
-                    delta=new_option.delta,
-                    reasoning=f"Roll put with {dte} DTE (threshold {self.config.roll_when_dte})"
-                )
+        return [positions[i] for i in np.flatnonzero(needs_action)]
 
-        return None
+    def _check_put_position(
+        self,
+        position: Position,
+        stock_price: float,
+        options_chain: List[OptionChainData],
+        today: Optional[date] = None
+    ) -> Optional[TradeRecommendation]:
+        """Check if an existing put position should be rolled or closed."""
+        return self._check_option_position(
+            position, stock_price, options_chain,
+            'P', Action.CLOSE_PUT, Action.ROLL_PUT, today
+        )
 
     def _check_call_position(
         self,
         position: Position,
         stock_price: float,
-        options_chain: List[OptionChainData]
+        options_chain: List[OptionChainData],
+        today: Optional[date] = None
+    ) -> Optional[TradeRecommendation]:
+        """Check if an existing call position should be rolled or closed."""
+        return self._check_option_position(
+            position, stock_price, options_chain,
+            'C', Action.CLOSE_CALL, Action.ROLL_CALL, today
+        )
+
+    def _check_option_position(
+        self,
+        position: Position,
+        stock_price: float,
+        options_chain: List[OptionChainData],
+        right: str,
+        close_action: Action,
+        roll_action: Action,
+        today: Optional[date] = None
     ) -> Optional[TradeRecommendation]:
         """
-        Check if an existing call position should be rolled or closed.
+        Check if an existing short option position should be rolled or closed.
 
         Args:
-            position: Current call position
+            position: Current option position
             stock_price: Current stock price
             options_chain: Available options
+            right: 'P' for put, 'C' for call
+            close_action: Action to recommend when closing for profit
+            roll_action: Action to recommend when rolling on DTE
+            today: Reference date for DTE (defaults to the current date)
 
         Returns:
             Trade recommendation if action needed, None otherwise
@@ -217,51 +246,60 @@ class WheelStrategy(Strategy):
         if not position.expiration:
             return None
 
+        if today is None:
+            today = date.today()
+
+        cfg = self.config
+        roll_dte = cfg.roll_when_dte
+        kind = 'put' if right == 'P' else 'call'
+
         # Calculate DTE
-        dte = (position.expiration.date() - datetime.now().date()).days
+        dte = (position.expiration_date - today).days
 
-        # Calculate P&L percentage
+        # Calculate P&L as a fraction of the credit received
         entry_credit = abs(position.avg_cost)
-        current_value = abs(position.market_value)
-        pnl_percent = ((entry_credit - current_value) / entry_credit * 100) if entry_credit > 0 else 0
+        pnl_ratio = (1.0 - abs(position.market_value) / entry_credit) if entry_credit else 0.0
 
-        logger.debug(f"{self.symbol} call at ${position.strike}: DTE={dte}, P&L={pnl_percent:.1f}%")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s %s at $%s: DTE=%d, P&L=%.1f%%",
+                         self.symbol, kind, position.strike, dte, pnl_ratio * 100)
 
         # Check if we should close for profit
-        if pnl_percent >= self.config.roll_when_pnl_percent:
+        if pnl_ratio >= cfg.roll_when_pnl_ratio:
             return TradeRecommendation(
-                action=Action.CLOSE_CALL,
+                action=close_action,
                 symbol=self.symbol,
                 quantity=abs(position.quantity),
                 strategy_type=StrategyType.WHEEL,
                 existing_position=position,
-                reasoning=f"Close call for {pnl_percent:.1f}% profit (target {self.config.roll_when_pnl_percent}%)"
+                reasoning=f"Close {kind} for {pnl_ratio:.1%} profit (target {cfg.roll_when_pnl_percent}%)"
             )
 
         # Check if we should roll based on DTE
-        if dte <= self.config.roll_when_dte:
-            # Find new call to roll to
+        if dte <= roll_dte:
+            # Find new option to roll to
             new_option = self._find_option_by_delta(
                 options_chain,
-                'C',
-                self.config.target_delta,
+                right,
+                cfg.target_delta,
                 stock_price,
-                self.config.dte_min,
-                self.config.dte_max
+                cfg.dte_min,
+                cfg.dte_max,
+                today
             )
 
             if new_option:
                 return TradeRecommendation(
-                    action=Action.ROLL_CALL,
+                    action=roll_action,
                     symbol=self.symbol,
                     quantity=abs(position.quantity),
                     strategy_type=StrategyType.WHEEL,
                     existing_position=position,
                     new_strike=new_option.strike,
                     new_expiration=new_option.expiration,
-                    premium=(new_option.bid + new_option.ask) / 2,
+                    premium=(new_option.bid + new_option.ask) * 0.5,
                     delta=new_option.delta,
-                    reasoning=f"Roll call with {dte} DTE (threshold {self.config.roll_when_dte})"
+                    reasoning=f"Roll {kind} with {dte} DTE (threshold {roll_dte})"
                 )
 
         return None
@@ -271,7 +309,8 @@ class WheelStrategy(Strategy):
         stock_price: float,
         options_chain: List[OptionChainData],
         account_info: AccountInfo,
-        quantity: int
+        quantity: int,
+        today: Optional[date] = None
     ) -> Optional[TradeRecommendation]:
         """
         Find a suitable cash-secured put to sell.
@@ -281,37 +320,44 @@ class WheelStrategy(Strategy):
             options_chain: Available options
             account_info: Account information
             quantity: Number of contracts to sell
+            today: Reference date for DTE (defaults to the current date)
 
         Returns:
             Trade recommendation if suitable option found
         """
+        cfg = self.config
+        min_premium = cfg.min_premium
+        min_premium_percent = cfg.min_premium_percent
+
         # Find put option near target delta
         option = self._find_option_by_delta(
             options_chain,
             'P',
-            self.config.target_delta,
+            cfg.target_delta,
             stock_price,
-            self.config.dte_min,
-            self.config.dte_max
+            cfg.dte_min,
+            cfg.dte_max,
+            today
         )
 
         if not option:
-            logger.debug(f"{self.symbol}: No suitable put found")
+            logger.debug("%s: No suitable put found", self.symbol)
             return None
 
         # Calculate premium
-        mid_price = (option.bid + option.ask) / 2
+        bid_ask_sum = option.bid + option.ask
+        mid_price = bid_ask_sum * 0.5
 
-        # Check minimum premium requirements
-        if self.config.min_premium > 0 and mid_price < self.config.min_premium:
-            logger.debug(f"{self.symbol}: Premium ${mid_price:.2f} below minimum ${self.config.min_premium:.2f}")
+        # Check minimum premium requirements against the bid/ask sum
+        # (twice the mid) so neither test needs a division
+        if min_premium > 0 and bid_ask_sum < min_premium * 2:
+            logger.debug("%s: Premium $%.2f below minimum $%.2f", self.symbol, mid_price, min_premium)
             return None
 
-        if self.config.min_premium_percent > 0:
-            premium_percent = (mid_price / stock_price) * 100
-            if premium_percent < self.config.min_premium_percent:
-                logger.debug(f"{self.symbol}: Premium {premium_percent:.2f}% below minimum {self.config.min_premium_percent}%")
-                return None
+        if min_premium_percent > 0 and bid_ask_sum * 50.0 < min_premium_percent * stock_price:
+            logger.debug("%s: Premium %.2f%% below minimum %s%%",
+                         self.symbol, mid_price / stock_price * 100, min_premium_percent)
+            return None
 
         # Check if we have enough buying power
         buying_power_required = option.strike * 100 * quantity
@@ -336,7 +382,8 @@ class WheelStrategy(Strategy):
         self,
         stock_price: float,
         options_chain: List[OptionChainData],
-        quantity: int
+        quantity: int,
+        today: Optional[date] = None
     ) -> Optional[TradeRecommendation]:
         """
         Find a suitable covered call to sell.
@@ -345,37 +392,44 @@ class WheelStrategy(Strategy):
             stock_price: Current stock price
             options_chain: Available options
             quantity: Number of contracts to sell
+            today: Reference date for DTE (defaults to the current date)
 
         Returns:
             Trade recommendation if suitable option found
         """
+        cfg = self.config
+        min_premium = cfg.min_premium
+        min_premium_percent = cfg.min_premium_percent
+
         # Find call option near target delta
         option = self._find_option_by_delta(
             options_chain,
             'C',
-            self.config.target_delta,
+            cfg.target_delta,
             stock_price,
-            self.config.dte_min,
-            self.config.dte_max
+            cfg.dte_min,
+            cfg.dte_max,
+            today
         )
 
         if not option:
-            logger.debug(f"{self.symbol}: No suitable call found")
+            logger.debug("%s: No suitable call found", self.symbol)
             return None
 
         # Calculate premium
-        mid_price = (option.bid + option.ask) / 2
+        bid_ask_sum = option.bid + option.ask
+        mid_price = bid_ask_sum * 0.5
 
-        # Check minimum premium requirements
-        if self.config.min_premium > 0 and mid_price < self.config.min_premium:
-            logger.debug(f"{self.symbol}: Premium ${mid_price:.2f} below minimum ${self.config.min_premium:.2f}")
+        # Check minimum premium requirements against the bid/ask sum
+        # (twice the mid) so neither test needs a division
+        if min_premium > 0 and bid_ask_sum < min_premium * 2:
+            logger.debug("%s: Premium $%.2f below minimum $%.2f", self.symbol, mid_price, min_premium)
             return None
 
-        if self.config.min_premium_percent > 0:
-            premium_percent = (mid_price / stock_price) * 100
-            if premium_percent < self.config.min_premium_percent:
-                logger.debug(f"{self.symbol}: Premium {premium_percent:.2f}% below minimum {self.config.min_premium_percent}%")
-                return None
+        if min_premium_percent > 0 and bid_ask_sum * 50.0 < min_premium_percent * stock_price:
+            logger.debug("%s: Premium %.2f%% below minimum %s%%",
+                         self.symbol, mid_price / stock_price * 100, min_premium_percent)
+            return None
 
         return TradeRecommendation(
             action=Action.SELL_CALL,
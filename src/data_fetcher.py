@@ -5,19 +5,107 @@ Handles all external data retrieval from IBKR and optional Polygon.io.
 Provides normalized data structures for use by strategy and risk modules.
 """
 
+import functools
+import hashlib
+import inspect
+import itertools
 import logging
-from typing import List, Dict, Optional, Tuple
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+import sys
+import time
+import weakref
+from typing import Callable, ClassVar, Iterable, List, Dict, Optional, Tuple
+from datetime import date, datetime, timedelta
+from dataclasses import dataclass, field
+from enum import IntEnum
 import asyncio
+import csv
+from pathlib import Path
 
-from ib_async import IB, Stock, Option, Contract, PortfolioItem, AccountValue
+import numpy as np
+
+from ib_async import IB, Stock, Option, Contract, OptionChain, PortfolioItem, AccountValue, Ticker
 from ib_async import util
 
 logger = logging.getLogger(__name__)
 
+# Minimum spacing between market data requests; IBKR throttles clients that
+# send more than ~50 messages per second
+MKT_DATA_REQUEST_INTERVAL = 1 / 50
 
-@dataclass
+# Bars older than this are dropped when the cache is rewritten
+BAR_CACHE_MAX_DAYS = 400
+
+# Account value tags read into AccountInfo
+ACCOUNT_TAGS = frozenset({
+    'NetLiquidation',
+    'TotalCashValue',
+    'BuyingPower',
+    'AvailableFunds',
+    'ExcessLiquidity',
+    'GrossPositionValue',
+})
+
+# Shared IB connections keyed by (host, port, client_id), refcounted so the
+# last DataFetcher to disconnect closes the socket
+_ib_pool: Dict[Tuple[str, int, int], IB] = {}
+_ib_refcounts: Dict[Tuple[str, int, int], int] = {}
+
+# Lock guarding the pool, one per event loop (an asyncio.Lock is bound to
+# the loop it is first awaited on)
+_pool_locks: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pool_lock() -> asyncio.Lock:
+    """Return the connection pool lock for the running event loop."""
+    loop = asyncio.get_running_loop()
+    lock = _pool_locks.get(loop)
+    if lock is None:
+        lock = _pool_locks[loop] = asyncio.Lock()
+    return lock
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_exp(exp_str: str) -> datetime:
+    """Parse an IBKR 'YYYYMMDD' expiration, memoized per distinct string."""
+    return datetime(int(exp_str[:4]), int(exp_str[4:6]), int(exp_str[6:8]))
+
+
+def _ttl_cache(seconds: float):
+    """
+    Cache an async DataFetcher method's results for a fixed time.
+
+    Entries are stored per instance and keyed on the bound arguments, so
+    f('SPY') and f('SPY', days=30) share an entry. None results are not
+    cached, letting failed fetches retry on the next call. Use
+    DataFetcher.invalidate() to drop entries early.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (method.__name__, *bound.args[1:])
+
+            now = time.monotonic()
+            hit = self._ttl_cache.get(key)
+            if hit is not None and hit[1] > now:
+                return hit[0]
+
+            value = await method(self, *args, **kwargs)
+            if value is not None:
+                self._ttl_cache[key] = (value, now + seconds)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+@dataclass(slots=True)
 class OptionChainData:
     """Normalized options chain data."""
     symbol: str
@@ -43,7 +131,463 @@ class OptionChainData:
     contract: Optional[Contract] = None
 
 
+class OptionRight(IntEnum):
+    """Integer code for an option right, as stored in OptionChainBatch.right."""
+    P = 0
+    C = 1
+
+
+@dataclass
+class OptionChainBatch:
+    """
+    Column-oriented (struct-of-arrays) view of an options chain.
+
+    Built once per chain so strategies can filter and rank options with
+    vectorized NumPy operations instead of per-object attribute access.
+    Index i of every array refers to options[i].
+    """
+    options: List[OptionChainData]
+    strike: np.ndarray
+    strike_cents: np.ndarray  # strike in whole cents, for exact matching
+    expiration_ordinal: np.ndarray  # expiration.toordinal(), for DTE math
+    right: np.ndarray  # OptionRight codes
+    bid: np.ndarray
+    ask: np.ndarray
+    delta: np.ndarray  # NaN where the option has no delta
+
+    # Row indices per (right, expiration ordinal), built on first use
+    _groups: Optional[Dict[Tuple[OptionRight, int], np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Days to expiration with the reference day they were computed for
+    _dte: Optional[Tuple[int, np.ndarray]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Rows with a bid, an ask and a delta, built on first use
+    _has_delta: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Row of the first quoted option per (right, expiration ordinal, strike
+    # in cents), built on first use
+    _by_strike: Optional[Dict[Tuple[int, int, int], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_options(cls, options: List[OptionChainData]) -> 'OptionChainBatch':
+        """Build the column arrays from a list of options."""
+        n = len(options)
+        strike = np.fromiter((o.strike for o in options), dtype=np.float64, count=n)
+        return cls(
+            options=options,
+            strike=strike,
+            strike_cents=np.rint(strike * 100).astype(np.int64),
+            expiration_ordinal=np.fromiter(
+                (o.expiration.toordinal() for o in options), dtype=np.int64, count=n
+            ),
+            right=np.fromiter((o.right == 'C' for o in options), dtype=np.int8, count=n),
+            bid=np.fromiter((o.bid for o in options), dtype=np.float64, count=n),
+            ask=np.fromiter((o.ask for o in options), dtype=np.float64, count=n),
+            delta=np.fromiter(
+                (np.nan if o.delta is None else o.delta for o in options),
+                dtype=np.float64,
+                count=n
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def groups(self) -> Dict[Tuple[OptionRight, int], np.ndarray]:
+        """
+        Partition the chain by (right, expiration ordinal).
+
+        Computed once per batch with a single stable sort, so each group's
+        row indices stay in chain order.
+
+        Returns:
+            Dict mapping (OptionRight, expiration.toordinal()) to row indices
+        """
+        if self._groups is None:
+            key = self.expiration_ordinal * 2 + self.right
+            order = np.argsort(key, kind='stable')
+            keys, starts = np.unique(key[order], return_index=True)
+            self._groups = {
+                (OptionRight(k & 1), k >> 1): rows
+                for k, rows in zip(keys.tolist(), np.split(order, starts[1:]))
+            }
+        return self._groups
+
+    def fingerprint(self) -> bytes:
+        """
+        Digest of the chain's contracts and quotes.
+
+        Hashes the column buffers directly, so the cost is a memory scan
+        rather than building and hashing one tuple per option. Chains with
+        the same contracts, quotes and deltas in the same order match.
+
+        Returns:
+            16-byte BLAKE2b digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for column in (self.strike_cents, self.expiration_ordinal, self.right,
+                       self.bid, self.ask, self.delta):
+            digest.update(column.data)
+        return digest.digest()
+
+    def dte(self, today_ordinal: int) -> np.ndarray:
+        """
+        Days to expiration for every row, computed once per reference day.
+
+        Args:
+            today_ordinal: Reference date as date.toordinal()
+
+        Returns:
+            Days from the reference date to each option's expiration
+        """
+        if self._dte is None or self._dte[0] != today_ordinal:
+            self._dte = (today_ordinal, self.expiration_ordinal - today_ordinal)
+        return self._dte[1]
+
+    def has_delta(self) -> np.ndarray:
+        """
+        Mask of rows that can be picked by delta.
+
+        Computed once per batch; every delta search against the chain
+        combines it with its own right/DTE filter.
+
+        Returns:
+            True where the option has a bid, an ask and a delta
+        """
+        if self._has_delta is None:
+            self._has_delta = (self.bid > 0) & (self.ask > 0) & ~np.isnan(self.delta)
+        return self._has_delta
+
+    def quoted_row(self, right: OptionRight, expiration_ordinal: int, strike_cents: int) -> int:
+        """
+        Look up the quoted option at an exact strike.
+
+        Args:
+            right: Option right
+            expiration_ordinal: Expiration as date.toordinal()
+            strike_cents: Strike price in whole cents
+
+        Returns:
+            Row of the first option with a bid and ask at that strike, or -1
+        """
+        if self._by_strike is None:
+            rows = np.flatnonzero((self.bid > 0) & (self.ask > 0))
+            keys = zip(
+                self.right[rows].tolist(),
+                self.expiration_ordinal[rows].tolist(),
+                self.strike_cents[rows].tolist()
+            )
+            by_strike = {}
+            for key, row in zip(keys, rows.tolist()):
+                by_strike.setdefault(key, row)
+            self._by_strike = by_strike
+        return self._by_strike.get((right, expiration_ordinal, strike_cents), -1)
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF via the Abramowitz-Stegun erf approximation (|err| < 1.5e-7)."""
+    z = np.abs(x) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * z)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741
+                + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-z * z)
+    return 0.5 * (1.0 + np.sign(x) * erf)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / np.sqrt(2.0 * np.pi)
+
+
+def bs_price(S, K, T, r, sigma, is_call) -> np.ndarray:
+    """
+    Black-Scholes price of European options, vectorized over all arguments.
+
+    Args:
+        S: Underlying price
+        K: Strikes
+        T: Years to expiration
+        r: Risk-free rate (continuous)
+        sigma: Volatility
+        is_call: True for calls, False for puts
+
+    Returns:
+        Option prices
+    """
+    sqrt_t = np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    discount = K * np.exp(-r * T)
+    call = S * _norm_cdf(d1) - discount * _norm_cdf(d2)
+    return np.where(is_call, call, call - S + discount)  # put-call parity
+
+
+def implied_vol(price, S, K, T, r, is_call, iterations: int = 60) -> np.ndarray:
+    """
+    Implied volatility by vectorized bisection on bs_price.
+
+    Returns NaN where the price is outside the no-arbitrage range.
+    """
+    price, K, T = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in (price, K, T)))
+    low = np.full(price.shape, 1e-4)
+    high = np.full(price.shape, 5.0)
+
+    for _ in range(iterations):
+        mid = 0.5 * (low + high)
+        too_high = bs_price(S, K, T, r, mid, is_call) > price
+        high = np.where(too_high, mid, high)
+        low = np.where(too_high, low, mid)
+
+    iv = 0.5 * (low + high)
+    solvable = (bs_price(S, K, T, r, 1e-4, is_call) <= price) & (price <= bs_price(S, K, T, r, 5.0, is_call))
+    return np.where(solvable, iv, np.nan)
+
+
+def bs_greeks(S, K, T, r, sigma, is_call) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Black-Scholes greeks, vectorized, in IBKR's conventions.
+
+    Returns:
+        Tuple of (delta, gamma, theta per calendar day, vega per 1 vol point)
+    """
+    sqrt_t = np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    pdf_d1 = _norm_pdf(d1)
+    discount = K * np.exp(-r * T)
+
+    delta = np.where(is_call, _norm_cdf(d1), _norm_cdf(d1) - 1.0)
+    gamma = pdf_d1 / (S * sigma * sqrt_t)
+    decay = -S * pdf_d1 * sigma / (2.0 * sqrt_t)
+    theta = np.where(
+        is_call,
+        decay - r * discount * _norm_cdf(d2),
+        decay + r * discount * _norm_cdf(-d2)
+    ) / 365.0
+    vega = S * pdf_d1 * sqrt_t / 100.0
+    return delta, gamma, theta, vega
+
+
+class _OptionPool:
+    """
+    Free list of OptionChainData instances recycled across chain snapshots.
+
+    A trading loop that snapshots the same chain every cycle otherwise
+    allocates and discards thousands of records per tick.
+    """
+
+    def __init__(self, size: int = 0, max_size: int = 20000):
+        self._free = [OptionChainData.__new__(OptionChainData) for _ in range(size)]
+        self._max_size = max_size
+
+    def make(self, **fields) -> OptionChainData:
+        """Re-initialize a pooled instance, allocating only when the pool is empty."""
+        if not self._free:
+            return OptionChainData(**fields)
+        option = self._free.pop()
+        option.__init__(**fields)
+        return option
+
+    def free(self, options: Iterable[OptionChainData]):
+        """Return instances to the pool, up to max_size."""
+        room = self._max_size - len(self._free)
+        if room > 0:
+            self._free.extend(itertools.islice(options, room))
+
+
+# date.toordinal() of the datetime64 epoch, to turn day counts into ordinals
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def to_float64(col: np.ndarray) -> np.ndarray:
+    """Widen a float32 table column to float64 for precision-sensitive math."""
+    return col.astype(np.float64, copy=False)
+
+
 @dataclass
+class OptionChainTable:
+    """
+    Columnar options chain, one NumPy array per field.
+
+    Lets callers filter a whole chain with vectorized masks, e.g.
+    (table.delta > -0.30) & (table.dte(today) < 45). Missing greeks are
+    NaN. Index i of every array refers to contracts[i].
+    """
+    # Column name -> dtype, in OptionChainData field order. Greeks are
+    # float32: model outputs carry far fewer significant digits, and halving
+    # the width doubles the elements per cache line in scans. Strikes and
+    # quotes stay float64 so prices round-trip exactly at any level.
+    COLUMNS: ClassVar[Dict[str, object]] = {
+        'symbol': str,
+        'strike': np.float64,
+        'expiration': 'datetime64[D]',
+        'right': 'U1',
+        'bid': np.float64,
+        'ask': np.float64,
+        'last': np.float64,
+        'volume': np.int32,
+        'open_interest': np.int32,
+        'delta': np.float32,
+        'gamma': np.float32,
+        'theta': np.float32,
+        'vega': np.float32,
+        'iv': np.float32,
+    }
+
+    symbol: np.ndarray
+    strike: np.ndarray
+    expiration: np.ndarray
+    right: np.ndarray
+    bid: np.ndarray
+    ask: np.ndarray
+    last: np.ndarray
+    volume: np.ndarray
+    open_interest: np.ndarray
+    delta: np.ndarray
+    gamma: np.ndarray
+    theta: np.ndarray
+    vega: np.ndarray
+    iv: np.ndarray
+    contracts: List[Contract]
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: Dict[str, list],
+        contracts: List[Contract]
+    ) -> 'OptionChainTable':
+        """Build the table from per-column value lists (missing columns are empty)."""
+        return cls(
+            **{
+                name: np.asarray(columns.get(name, []), dtype=dtype)
+                for name, dtype in cls.COLUMNS.items()
+            },
+            contracts=contracts
+        )
+
+    def __len__(self) -> int:
+        return len(self.contracts)
+
+    def dte(self, today: date) -> np.ndarray:
+        """Days to expiration of every option, relative to today."""
+        return (self.expiration - np.datetime64(today, 'D')).astype(np.int64)
+
+    def fill_missing_greeks(self, stock_price: float, today: date, rate: float = 0.04) -> int:
+        """
+        Compute Black-Scholes IV and greeks for options IBKR gave no model for.
+
+        Implied volatility is solved from the bid/ask mid; rows without a
+        two-sided quote, or whose mid is outside the arbitrage bounds, stay NaN.
+
+        Args:
+            stock_price: Current underlying price
+            today: Valuation date
+            rate: Risk-free rate (continuous)
+
+        Returns:
+            Number of rows filled
+        """
+        T = self.dte(today) / 365.0
+        missing = np.isnan(self.delta) & (self.bid > 0) & (self.ask > 0) & (T > 0)
+        if not missing.any():
+            return 0
+
+        K = self.strike[missing]
+        T = T[missing]
+        is_call = self.right[missing] == 'C'
+        mid = 0.5 * (self.bid[missing] + self.ask[missing])
+
+        iv = implied_vol(mid, stock_price, K, T, rate, is_call)
+        solved = ~np.isnan(iv)
+        delta, gamma, theta, vega = bs_greeks(
+            stock_price, K[solved], T[solved], rate, iv[solved], is_call[solved]
+        )
+
+        rows = np.flatnonzero(missing)[solved]
+        self.iv[rows] = iv[solved]
+        self.delta[rows] = delta
+        self.gamma[rows] = gamma
+        self.theta[rows] = theta
+        self.vega[rows] = vega
+        return len(rows)
+
+    def to_options(self, pool: Optional[_OptionPool] = None) -> List[OptionChainData]:
+        """
+        Convert to the row-oriented List[OptionChainData] form.
+
+        Args:
+            pool: Pool to draw recycled instances from (new instances if None)
+        """
+        make = OptionChainData if pool is None else pool.make
+        expirations = self.expiration.astype('datetime64[s]').tolist()
+
+        strike, bid, ask, last = (
+            col.tolist() for col in (self.strike, self.bid, self.ask, self.last)
+        )
+        greeks = [
+            [None if g != g else g for g in to_float64(col).tolist()]  # NaN -> None
+            for col in (self.delta, self.gamma, self.theta, self.vega, self.iv)
+        ]
+
+        return [
+            make(
+                symbol=symbol,
+                strike=strike,
+                expiration=exp,
+                right=right,
+                bid=bid,
+                ask=ask,
+                last=last,
+                volume=volume,
+                open_interest=open_interest,
+                delta=delta,
+                gamma=gamma,
+                theta=theta,
+                vega=vega,
+                iv=iv,
+                contract=contract
+            )
+            for (symbol, strike, exp, right, bid, ask, last, volume, open_interest,
+                 delta, gamma, theta, vega, iv, contract) in zip(
+                self.symbol.tolist(), strike, expirations,
+                self.right.tolist(), bid, ask, last,
+                self.volume.tolist(), self.open_interest.tolist(),
+                *greeks, self.contracts
+            )
+        ]
+
+    def to_batch(self, pool: Optional[_OptionPool] = None) -> OptionChainBatch:
+        """
+        Convert to row form together with its columnar OptionChainBatch view.
+
+        The batch columns are taken from the table's arrays rather than read
+        back from each OptionChainData, so strategies get the chain's slabs
+        without a per-option pass. Values match OptionChainBatch.from_options
+        on the returned rows.
+
+        Args:
+            pool: Pool to draw recycled instances from (new instances if None)
+        """
+        return OptionChainBatch(
+            options=self.to_options(pool),
+            strike=self.strike,
+            strike_cents=np.rint(self.strike * 100).astype(np.int64),
+            expiration_ordinal=self.expiration.astype(np.int64) + _EPOCH_ORDINAL,
+            right=(self.right == 'C').astype(np.int8),
+            bid=self.bid,
+            ask=self.ask,
+            delta=to_float64(self.delta)
+        )
+
+
+@dataclass(slots=True)
 class Position:
     """Current portfolio position."""
     symbol: str
@@ -61,8 +605,77 @@ class Position:
 
     contract: Optional[Contract] = None
 
+    # Derived: expiration as a date, computed once for DTE math
+    expiration_date: Optional[date] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.expiration_date = self.expiration.date() if self.expiration else None
+
 
 @dataclass
+class PositionBatch:
+    """
+    Column-oriented (struct-of-arrays) view of a list of positions.
+
+    Index i of every array refers to positions[i]. Option-only columns are
+    zero for stock positions and options without an expiration.
+    """
+    positions: List[Position]
+    is_stock: np.ndarray
+    is_option: np.ndarray  # option position with an expiration
+    expiration_ordinal: np.ndarray  # expiration.toordinal()
+    is_call: np.ndarray
+    quantity: np.ndarray
+    strike: np.ndarray
+    avg_cost: np.ndarray
+    market_value: np.ndarray
+    symbols: np.ndarray  # Distinct symbols, sorted
+    symbol_code: np.ndarray  # Index into symbols
+
+    @classmethod
+    def from_positions(cls, positions: List[Position]) -> 'PositionBatch':
+        """Build the column arrays from a list of positions."""
+        n = len(positions)
+        # Number symbols by first appearance with one dict probe per position
+        # (symbols are interned), then sort only the distinct symbols and
+        # renumber. Much cheaper than np.unique sorting every position's symbol.
+        first_seen: Dict[str, int] = {}
+        code = np.fromiter(
+            (first_seen.setdefault(p.symbol, len(first_seen)) for p in positions),
+            dtype=np.intp,
+            count=n
+        )
+        symbols = sorted(first_seen)
+        rank = np.empty(len(symbols), dtype=np.intp)
+        rank[[first_seen[symbol] for symbol in symbols]] = np.arange(len(symbols))
+        is_option = np.fromiter(
+            (p.position_type == 'option' and p.expiration_date is not None for p in positions),
+            dtype=bool,
+            count=n
+        )
+        return cls(
+            positions=positions,
+            is_stock=np.fromiter((p.position_type == 'stock' for p in positions), dtype=bool, count=n),
+            is_option=is_option,
+            expiration_ordinal=np.fromiter(
+                (p.expiration_date.toordinal() if p.expiration_date else 0 for p in positions),
+                dtype=np.int64,
+                count=n
+            ),
+            is_call=np.fromiter((p.right == 'C' for p in positions), dtype=bool, count=n),
+            quantity=np.fromiter((p.quantity for p in positions), dtype=np.float64, count=n),
+            strike=np.fromiter((p.strike or 0.0 for p in positions), dtype=np.float64, count=n),
+            avg_cost=np.fromiter((p.avg_cost for p in positions), dtype=np.float64, count=n),
+            market_value=np.fromiter((p.market_value for p in positions), dtype=np.float64, count=n),
+            symbols=np.array(symbols, dtype=object),
+            symbol_code=rank[code]
+        )
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+@dataclass(slots=True)
 class AccountInfo:
     """Account balance and buying power information."""
     account_number: str
@@ -81,7 +694,13 @@ class DataFetcher:
     Provides retry logic, error handling, and data normalization.
     """
 
-    def __init__(self, host: str = "127.0.0.1", port: int = 7497, client_id: int = 1):
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 7497,
+        client_id: int = 1,
+        bar_cache_dir: Optional[Path] = None
+    ):
         """
         Initialize data fetcher.
 
@@ -89,17 +708,44 @@ class DataFetcher:
             host: IBKR TWS/Gateway host
             port: IBKR TWS/Gateway port (7497 paper, 7496 live)
             client_id: Unique client ID for this connection
+            bar_cache_dir: Directory where daily closes are persisted, so
+                historical volatility only requests bars newer than the last
+                cached one (None disables it)
         """
         self.host = host
         self.port = port
         self.client_id = client_id
+        self.bar_cache_dir = Path(bar_cache_dir) if bar_cache_dir is not None else None
         self.ib = IB()
         self._connected = False
+        self._connect_lock = asyncio.Lock()
+
+        # Paces reqMktData calls across concurrent fetches
+        self._pacing_lock = asyncio.Lock()
+        self._last_mkt_data_request = 0.0
+
+        # (method name, *args) -> (value, expires_at) for _ttl_cache methods
+        self._ttl_cache: Dict[tuple, Tuple[object, float]] = {}
+
+        # Recycled OptionChainData instances, see release_chain()
+        self._option_pool = _OptionPool()
+
+        # Qualified stock contracts keyed by (symbol, exchange, currency)
+        self._qualified: Dict[Tuple[str, str, str], Contract] = {}
+
+        # Option expirations/strikes per symbol with the day they were fetched;
+        # listings only change overnight
+        self._option_params: Dict[str, Tuple[Optional[OptionChain], date]] = {}
 
     async def connect(self, timeout: int = 30) -> bool:
         """
         Connect to IBKR TWS/Gateway.
 
+        Fetchers with the same host, port and client_id share one IB
+        connection; only the first to connect opens the socket. A dropped
+        connection is reopened on the same IB object, so references to
+        self.ib held elsewhere (e.g. by the order executor) stay valid.
+
         Args:
             timeout: Connection timeout in seconds
 
@@ -109,23 +755,50 @@ class DataFetcher:
         Raises:
             ConnectionError: If connection fails
         """
+        key = (self.host, self.port, self.client_id)
+
         try:
-            logger.info(f"Connecting to IBKR at {self.host}:{self.port} (client_id={self.client_id})")
-            await self.ib.connectAsync(self.host, self.port, self.client_id, timeout=timeout)
-            self._connected = True
-            logger.info("Successfully connected to IBKR")
-            return True
+            async with _pool_lock():
+                ib = _ib_pool.get(key)
+                if ib is None:
+                    ib = _ib_pool[key] = self.ib
+                if not ib.isConnected():
+                    logger.info(f"Connecting to IBKR at {self.host}:{self.port} (client_id={self.client_id})")
+                    await ib.connectAsync(self.host, self.port, self.client_id, timeout=timeout)
+                    logger.info("Successfully connected to IBKR")
+                else:
+                    logger.debug(f"Reusing shared IBKR connection to {self.host}:{self.port}")
+
+                # A reconnect keeps the reference this fetcher already holds
+                if not self._connected:
+                    _ib_refcounts[key] = _ib_refcounts.get(key, 0) + 1
+
+                self.ib = ib
+                self._connected = True
+                return True
 
         except Exception as e:
             logger.error(f"Failed to connect to IBKR: {e}")
-            self._connected = False
             raise ConnectionError(f"Could not connect to IBKR: {e}")
 
     async def disconnect(self):
-        """Disconnect from IBKR."""
-        if self._connected:
-            self.ib.disconnect()
+        """Release this fetcher's connection; the last user closes it."""
+        if not self._connected:
+            return
+
+        key = (self.host, self.port, self.client_id)
+
+        async with _pool_lock():
             self._connected = False
+            remaining = _ib_refcounts.get(key, 1) - 1
+            if remaining > 0:
+                _ib_refcounts[key] = remaining
+                logger.debug(f"IBKR connection still used by {remaining} other fetcher(s)")
+                return
+
+            _ib_refcounts.pop(key, None)
+            _ib_pool.pop(key, None)
+            self.ib.disconnect()
             logger.info("Disconnected from IBKR")
 
     def is_connected(self) -> bool:
@@ -134,9 +807,163 @@ class DataFetcher:
 
     async def _ensure_connected(self):
         """Ensure connection is active, reconnect if needed."""
-        if not self.is_connected():
-            logger.warning("Connection lost, attempting to reconnect...")
-            await self.connect()
+        if self.is_connected():
+            return
+
+        # Concurrent callers share a single reconnect attempt
+        async with self._connect_lock:
+            if not self.is_connected():
+                logger.warning("Connection lost, attempting to reconnect...")
+                await self.connect()
+
+    def invalidate(self, key: Optional[str] = None):
+        """
+        Drop cached account values / historical volatility.
+
+        Args:
+            key: Symbol or account number whose entries to drop; None clears all
+        """
+        if key is None:
+            self._ttl_cache.clear()
+            return
+
+        for cache_key in [k for k in self._ttl_cache if len(k) > 1 and k[1] == key]:
+            del self._ttl_cache[cache_key]
+
+    async def _qualified_stock(
+        self,
+        symbol: str,
+        exchange: str = 'SMART',
+        currency: str = 'USD'
+    ) -> Contract:
+        """
+        Get a qualified stock contract, qualifying it with IBKR only once.
+
+        Args:
+            symbol: Stock ticker symbol
+            exchange: Exchange to route to
+            currency: Contract currency
+
+        Returns:
+            Qualified stock contract
+
+        Raises:
+            ValueError: If IBKR cannot qualify the contract
+        """
+        key = (symbol, exchange, currency)
+        contract = self._qualified.get(key)
+        if contract is not None:
+            return contract
+
+        (contract,) = await self.ib.qualifyContractsAsync(Stock(*key))
+        if contract is None:
+            raise ValueError(f"Could not qualify contract for {symbol}")
+
+        self._qualified[key] = contract
+        return contract
+
+    async def _get_option_params(self, symbol: str) -> Optional[OptionChain]:
+        """
+        Get a symbol's option expirations and strikes, requesting them once a day.
+
+        Args:
+            symbol: Stock ticker symbol
+
+        Returns:
+            First option chain definition IBKR returns, or None if it has none
+        """
+        today = date.today()
+        cached = self._option_params.get(symbol)
+        if cached is not None and cached[1] == today:
+            return cached[0]
+
+        stock = await self._qualified_stock(symbol)
+        chains = await self.ib.reqSecDefOptParamsAsync(
+            stock.symbol, '', stock.secType, stock.conId
+        )
+        chain = chains[0] if chains else None
+
+        self._option_params[symbol] = (chain, today)
+        return chain
+
+    async def preload_option_params(self, symbols: List[str]):
+        """
+        Fetch option expirations and strikes for several symbols concurrently.
+
+        Args:
+            symbols: Stock ticker symbols
+        """
+        await self._ensure_connected()
+        results = await asyncio.gather(
+            *(self._get_option_params(s) for s in symbols), return_exceptions=True
+        )
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Could not load option parameters for {symbol}: {result}")
+
+    async def _req_mkt_data(self, contract: Contract, generic_tick_list: str = '') -> Ticker:
+        """
+        Request streaming market data, paced to respect IBKR's message rate.
+
+        Args:
+            contract: Qualified contract
+            generic_tick_list: Extra tick types (e.g. '106' for option greeks)
+
+        Returns:
+            Ticker that will be filled as data arrives
+        """
+        async with self._pacing_lock:
+            loop = asyncio.get_running_loop()
+            wait = self._last_mkt_data_request + MKT_DATA_REQUEST_INTERVAL - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            ticker = self.ib.reqMktData(contract, generic_tick_list, False, False)
+            self._last_mkt_data_request = loop.time()
+
+        return ticker
+
+    async def _wait_for_tickers(
+        self,
+        tickers: Iterable[Ticker],
+        is_ready: Callable[[Ticker], bool],
+        timeout: float
+    ) -> bool:
+        """
+        Wait until every ticker satisfies is_ready, or the timeout expires.
+
+        Wakes on pendingTickersEvent as updates arrive rather than sleeping
+        for a fixed interval.
+
+        Args:
+            tickers: Tickers to wait on
+            is_ready: Predicate telling whether a ticker has the data we need
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if all tickers became ready, False on timeout
+        """
+        waiting = {id(t) for t in tickers if not is_ready(t)}
+        if not waiting:
+            return True
+
+        done = asyncio.get_running_loop().create_future()
+
+        def on_pending_tickers(updated):
+            for t in updated:
+                if id(t) in waiting and is_ready(t):
+                    waiting.discard(id(t))
+            if not waiting and not done.done():
+                done.set_result(True)
+
+        self.ib.pendingTickersEvent += on_pending_tickers
+        try:
+            return await asyncio.wait_for(done, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.debug(f"Timed out after {timeout}s with {len(waiting)} tickers still pending")
+            return False
+        finally:
+            self.ib.pendingTickersEvent -= on_pending_tickers
 
     async def get_stock_price(self, symbol: str) -> float:
         """
@@ -150,11 +977,10 @@ class DataFetcher:
         """
         await self._ensure_connected()
 
-        stock = Stock(symbol, 'SMART', 'USD')
-        self.ib.qualifyContracts(stock)
+        stock = await self._qualified_stock(symbol)
 
-        ticker = self.ib.reqMktData(stock, '', False, False)
-        await asyncio.sleep(2)  # Wait for data
+        ticker = await self._req_mkt_data(stock)
+        await self._wait_for_tickers([ticker], lambda t: t.marketPrice() > 0, timeout=2)
 
         self.ib.cancelMktData(stock)
 
@@ -172,42 +998,151 @@ class DataFetcher:
 
         raise ValueError(f"Could not get price for {symbol}")
 
+    async def get_stock_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get current prices for several stocks concurrently.
+
+        Args:
+            symbols: Stock ticker symbols
+
+        Returns:
+            Dict mapping symbol to current price
+        """
+        prices = await asyncio.gather(*(self.get_stock_price(s) for s in symbols))
+        return dict(zip(symbols, prices))
+
+    async def get_vix_and_prices(
+        self,
+        symbols: List[str]
+    ) -> Tuple[Optional[float], Dict[str, float]]:
+        """
+        Get VIX and current prices for several stocks concurrently.
+
+        Args:
+            symbols: Stock ticker symbols
+
+        Returns:
+            Tuple of (VIX value or None, dict mapping symbol to price)
+        """
+        vix, prices = await asyncio.gather(self.get_vix(), self.get_stock_prices(symbols))
+        return vix, prices
+
     async def get_options_chain(
         self,
         symbol: str,
         expiration: Optional[datetime] = None,
         min_dte: int = 0,
         max_dte: int = 60,
-        right: Optional[str] = None
+        right: Optional[str] = None,
+        moneyness: Optional[Tuple[float, float]] = (0.7, 1.3),
+        stock_price: Optional[float] = None,
+        recompute_greeks: bool = False
     ) -> List[OptionChainData]:
         """
         Get options chain for a symbol.
 
+        Thin wrapper around get_options_chain_table, which is the preferred
+        interface for filtering large chains.
+
         Args:
             symbol: Stock ticker symbol
             expiration: Specific expiration date (if None, gets all within DTE range)
             min_dte: Minimum days to expiration
             max_dte: Maximum days to expiration
             right: 'C' for calls only, 'P' for puts only, None for both
+            moneyness: (low, high) strike range as multiples of the stock price;
+                strikes outside it are not requested. None requests every strike.
+            stock_price: Current stock price, if already known (fetched otherwise)
+            recompute_greeks: Fill greeks IBKR didn't model with local Black-Scholes
 
         Returns:
             List of option chain data
         """
-        await self._ensure_connected()
+        table = await self.get_options_chain_table(
+            symbol, expiration, min_dte, max_dte, right, moneyness, stock_price,
+            recompute_greeks
+        )
+        return table.to_options(self._option_pool)
+
+    async def get_options_chain_batch(
+        self,
+        symbol: str,
+        expiration: Optional[datetime] = None,
+        min_dte: int = 0,
+        max_dte: int = 60,
+        right: Optional[str] = None,
+        moneyness: Optional[Tuple[float, float]] = (0.7, 1.3),
+        stock_price: Optional[float] = None,
+        recompute_greeks: bool = False
+    ) -> OptionChainBatch:
+        """
+        Get options chain for a symbol with its columnar view prebuilt.
 
-        stock = Stock(symbol, 'SMART', 'USD')
-        self.ib.qualifyContracts(stock)
+        Same arguments as get_options_chain. batch.options is the row form
+        and is released with release_chain like any other chain; handing
+        the batch to Strategy.use_chain_batch saves the strategy rebuilding
+        the arrays from the rows.
 
-        # Get option chain
-        chains = await self.ib.reqSecDefOptParamsAsync(
-            stock.symbol, '', stock.secType, stock.conId
+        Returns:
+            Option chain batch (empty if nothing matched)
+        """
+        table = await self.get_options_chain_table(
+            symbol, expiration, min_dte, max_dte, right, moneyness, stock_price,
+            recompute_greeks
         )
+        return table.to_batch(self._option_pool)
+
+    def release_chain(self, options: List[OptionChainData]):
+        """
+        Hand a chain from get_options_chain back for reuse by later snapshots.
+
+        The instances are overwritten by the next fetch, so callers must not
+        keep references to them (or to the list) after releasing; strategies
+        that analyzed the chain drop theirs with Strategy.release_chain_batch.
+
+        Args:
+            options: Chain previously returned by get_options_chain
+        """
+        self._option_pool.free(options)
+        options.clear()
+
+    async def get_options_chain_table(
+        self,
+        symbol: str,
+        expiration: Optional[datetime] = None,
+        min_dte: int = 0,
+        max_dte: int = 60,
+        right: Optional[str] = None,
+        moneyness: Optional[Tuple[float, float]] = (0.7, 1.3),
+        stock_price: Optional[float] = None,
+        recompute_greeks: bool = False
+    ) -> OptionChainTable:
+        """
+        Get options chain for a symbol as a columnar table.
+
+        Args:
+            symbol: Stock ticker symbol
+            expiration: Specific expiration date (if None, gets all within DTE range)
+            min_dte: Minimum days to expiration
+            max_dte: Maximum days to expiration
+            right: 'C' for calls only, 'P' for puts only, None for both
+            moneyness: (low, high) strike range as multiples of the stock price;
+                strikes outside it are not requested. None requests every strike.
+            stock_price: Current stock price, if already known (fetched otherwise)
+            recompute_greeks: Fill greeks IBKR didn't model with local Black-Scholes
 
-        if not chains:
+        Returns:
+            Option chain table (empty if nothing matched)
+        """
+        await self._ensure_connected()
+
+        # Get option chain
+        chain = await self._get_option_params(symbol)
+
+        if chain is None:
             logger.warning(f"No options chain found for {symbol}")
-            return []
+            return OptionChainTable.from_columns({}, [])
 
-        chain = chains[0]
         logger.debug(f"Found options chain for {symbol} with {len(chain.expirations)} expirations")
 
         # Filter expirations by DTE
@@ -215,7 +1150,7 @@ class DataFetcher:
         valid_expirations = []
 
         for exp_str in chain.expirations:
-            exp_date = datetime.strptime(exp_str, '%Y%m%d').date()
+            exp_date = _parse_exp(exp_str).date()
             dte = (exp_date - today).days
 
             if min_dte <= dte <= max_dte:
@@ -224,79 +1159,120 @@ class DataFetcher:
 
         if not valid_expirations:
             logger.warning(f"No expirations found for {symbol} within DTE range {min_dte}-{max_dte}")
-            return []
+            return OptionChainTable.from_columns({}, [])
 
         logger.info(f"Found {len(valid_expirations)} valid expirations for {symbol}")
 
-        # Get options for these expirations
-        options_data = []
-
-        for exp_str in valid_expirations:
-            for strike in chain.strikes:
-                rights = ['P', 'C'] if right is None else [right]
-
-                for r in rights:
-                    option = Option(symbol, exp_str, strike, r, 'SMART')
-                    self.ib.qualifyContracts(option)
-
-                    # Request market data and greeks
-                    ticker = self.ib.reqMktData(option, '106', False, False)  # 106 = greeks
-
-        # Wait for all data to arrive
-        await asyncio.sleep(3)
-
-        # Process all tickers
-        for ticker in self.ib.tickers():
-            if not isinstance(ticker.contract, Option):
-                continue
-
+        # Skip deep ITM/OTM wings before requesting any market data
+        strikes = chain.strikes
+        if moneyness is not None:
+            if stock_price is None:
+                stock_price = await self.get_stock_price(symbol)
+            low, high = moneyness[0] * stock_price, moneyness[1] * stock_price
+            strikes = [k for k in strikes if low <= k <= high]
+            logger.debug(f"{symbol}: {len(strikes)}/{len(chain.strikes)} strikes within "
+                         f"{moneyness[0]:.2f}-{moneyness[1]:.2f}x of ${stock_price:.2f}")
+
+        # Qualify the whole grid in one batched request instead of one
+        # round-trip per contract
+        rights = ['P', 'C'] if right is None else [right]
+        contracts = [
+            Option(symbol, exp_str, strike, r, 'SMART')
+            for exp_str in valid_expirations
+            for strike in strikes
+            for r in rights
+        ]
+        qualified = await self.ib.qualifyContractsAsync(*contracts)
+
+        # Accumulate raw values per column, converted to arrays once at the end
+        columns = {name: [] for name in OptionChainTable.COLUMNS}
+        option_contracts = []
+
+        def add_row(ticker: Ticker):
             opt = ticker.contract
 
-            # Skip if not our symbol
-            if opt.symbol != symbol:
-                continue
-
             # Parse expiration
-            exp_date = datetime.strptime(opt.lastTradeDateOrContractMonth, '%Y%m%d')
+            exp_date = _parse_exp(opt.lastTradeDateOrContractMonth)
 
             # Get market data
-            bid = ticker.bid if ticker.bid and ticker.bid > 0 else 0.0
-            ask = ticker.ask if ticker.ask and ticker.ask > 0 else 0.0
-            last = ticker.last if ticker.last and ticker.last > 0 else 0.0
-            volume = ticker.volume if ticker.volume else 0
-
-            # Get Greeks
-            delta = ticker.modelGreeks.delta if ticker.modelGreeks else None
-            gamma = ticker.modelGreeks.gamma if ticker.modelGreeks else None
-            theta = ticker.modelGreeks.theta if ticker.modelGreeks else None
-            vega = ticker.modelGreeks.vega if ticker.modelGreeks else None
-            iv = ticker.modelGreeks.impliedVol if ticker.modelGreeks else None
-
-            option_data = OptionChainData(
-                symbol=opt.symbol,
-                strike=opt.strike,
-                expiration=exp_date,
-                right=opt.right,
-                bid=bid,
-                ask=ask,
-                last=last,
-                volume=volume,
-                open_interest=0,  # Not readily available from ticker
-                delta=delta,
-                gamma=gamma,
-                theta=theta,
-                vega=vega,
-                iv=iv,
-                contract=opt
-            )
-
-            options_data.append(option_data)
-
-        # Cancel all market data
-        self.ib.cancelMktData('')
-
-        logger.info(f"Retrieved {len(options_data)} options for {symbol}")
-        return options_data
+            columns['symbol'].append(opt.symbol)
+            columns['strike'].append(opt.strike)
+            columns['expiration'].append(exp_date)
+            columns['right'].append(opt.right)
+            columns['bid'].append(ticker.bid if ticker.bid and ticker.bid > 0 else 0.0)
+            columns['ask'].append(ticker.ask if ticker.ask and ticker.ask > 0 else 0.0)
+            columns['last'].append(ticker.last if ticker.last and ticker.last > 0 else 0.0)
+            columns['volume'].append(ticker.volume if ticker.volume and ticker.volume > 0 else 0)
+            columns['open_interest'].append(0)  # Not readily available from ticker
+
+            # Get Greeks (NaN when the model hasn't produced them)
+            greeks = ticker.modelGreeks
+            columns['delta'].append(greeks.delta if greeks else np.nan)
+            columns['gamma'].append(greeks.gamma if greeks else np.nan)
+            columns['theta'].append(greeks.theta if greeks else np.nan)
+            columns['vega'].append(greeks.vega if greeks else np.nan)
+            columns['iv'].append(greeks.impliedVol if greeks else np.nan)
+
+            option_contracts.append(opt)
+
+        # Each ticker posts itself to this call's completion queue once its
+        # quote and greeks are in, and its stream is cancelled right away to
+        # free the market data line
+        completed: asyncio.Queue = asyncio.Queue()
+        done = set()
+
+        def on_update(ticker: Ticker):
+            if id(ticker) in done:
+                return
+            if ticker.modelGreeks is not None and ticker.bid > 0 and ticker.ask > 0:
+                done.add(id(ticker))
+                self.ib.cancelMktData(ticker.contract)
+                completed.put_nowait(ticker)
+
+        requested = []
+        for option in qualified:
+            if option is None:
+                continue  # Strike/expiration combination not listed
+
+            # Request market data and greeks
+            ticker = await self._req_mkt_data(option, '106')  # 106 = greeks
+            ticker.updateEvent += on_update
+            requested.append(ticker)
+
+        # Process options in completion order until all are in or time runs out
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 3
+        for _ in range(len(requested)):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                add_row(await asyncio.wait_for(completed.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        while not completed.empty():
+            add_row(completed.get_nowait())
+
+        # Stragglers keep whatever arrived (greeks may be missing); cancel only
+        # the streams this call opened, leaving other subscriptions running
+        for ticker in requested:
+            ticker.updateEvent -= on_update
+            if id(ticker) not in done:
+                self.ib.cancelMktData(ticker.contract)
+                add_row(ticker)
+
+        table = OptionChainTable.from_columns(columns, option_contracts)
+
+        if recompute_greeks:
+            if stock_price is None:
+                stock_price = await self.get_stock_price(symbol)
+            filled = table.fill_missing_greeks(stock_price, datetime.now().date())
+            if filled:
+                logger.debug(f"{symbol}: computed greeks locally for {filled} options")
+
+        logger.info(f"Retrieved {len(table)} options for {symbol}")
+        return table
 
     async def get_positions(self) -> List[Position]:
         """
@@ -321,13 +1297,16 @@ class DataFetcher:
             elif isinstance(contract, Option):
                 pos_type = 'option'
                 strike = contract.strike
-                expiration = datetime.strptime(contract.lastTradeDateOrContractMonth, '%Y%m%d')
+                expiration = _parse_exp(contract.lastTradeDateOrContractMonth)
                 right = contract.right
             else:
                 continue  # Skip other types
 
+            # Interned so symbol comparisons and dict lookups against config
+            # keys hit the identity fast path. The type literals and one-letter
+            # rights are already shared string objects.
             position = Position(
-                symbol=contract.symbol,
+                symbol=sys.intern(contract.symbol),
                 position_type=pos_type,
                 quantity=int(item.position),
                 avg_cost=item.averageCost,
@@ -345,10 +1324,13 @@ class DataFetcher:
         logger.info(f"Retrieved {len(positions)} positions")
         return positions
 
+    @_ttl_cache(seconds=60)
     async def get_account_info(self, account_number: str) -> AccountInfo:
         """
         Get account balance and buying power information.
 
+        Cached for 60 seconds; call invalidate(account_number) after fills.
+
         Args:
             account_number: IBKR account number
 
@@ -357,8 +1339,12 @@ class DataFetcher:
         """
         await self._ensure_connected()
 
-        # Get account values
-        account_values = {av.tag: float(av.value) for av in self.ib.accountValues(account_number)}
+        # Get account values, converting only the tags we read
+        account_values = {
+            av.tag: float(av.value)
+            for av in self.ib.accountValues(account_number)
+            if av.tag in ACCOUNT_TAGS
+        }
 
         account_info = AccountInfo(
             account_number=account_number,
@@ -384,11 +1370,10 @@ class DataFetcher:
         try:
             await self._ensure_connected()
 
-            vix = Stock('VIX', 'CBOE', 'USD')
-            self.ib.qualifyContracts(vix)
+            vix = await self._qualified_stock('VIX', 'CBOE')
 
-            ticker = self.ib.reqMktData(vix, '', False, False)
-            await asyncio.sleep(2)
+            ticker = await self._req_mkt_data(vix)
+            await self._wait_for_tickers([ticker], lambda t: t.last > 0 or t.close > 0, timeout=2)
 
             self.ib.cancelMktData(vix)
 
@@ -404,6 +1389,36 @@ class DataFetcher:
             logger.warning(f"Could not fetch VIX: {e}")
             return None
 
+    def _bar_cache_path(self, symbol: str) -> Path:
+        return self.bar_cache_dir / f'{symbol}.csv'
+
+    def _load_bar_cache(self, symbol: str) -> Dict[date, float]:
+        """Load cached daily closes for a symbol (empty if none or unreadable)."""
+        if self.bar_cache_dir is None:
+            return {}
+
+        try:
+            with open(self._bar_cache_path(symbol), newline='', encoding='utf-8') as f:
+                return {date.fromisoformat(d): float(close) for d, close in csv.reader(f)}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable bar cache for {symbol}: {e}")
+            return {}
+
+    def _save_bar_cache(self, symbol: str, closes: Dict[date, float]):
+        """Persist daily closes for a symbol, dropping bars past the retention window."""
+        cutoff = date.today() - timedelta(days=BAR_CACHE_MAX_DAYS)
+        try:
+            self.bar_cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._bar_cache_path(symbol), 'w', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerows(
+                    (d.isoformat(), close) for d, close in sorted(closes.items()) if d >= cutoff
+                )
+        except OSError as e:
+            logger.warning(f"Could not write bar cache for {symbol}: {e}")
+
+    @_ttl_cache(seconds=3600)
     async def get_historical_volatility(
         self,
         symbol: str,
@@ -412,6 +1427,9 @@ class DataFetcher:
         """
         Calculate historical volatility for a symbol.
 
+        Cached for an hour per (symbol, days). Daily closes are also kept in
+        bar_cache_dir, so later calls only request bars since the last one.
+
         Args:
             symbol: Stock ticker symbol
             days: Number of days of history to use
@@ -422,40 +1440,51 @@ class DataFetcher:
         try:
             await self._ensure_connected()
 
-            stock = Stock(symbol, 'SMART', 'USD')
-            self.ib.qualifyContracts(stock)
+            stock = await self._qualified_stock(symbol)
+
+            today = date.today()
+            start = today - timedelta(days=days)
+            # File I/O runs in a worker thread to keep the event loop free
+            cached = await asyncio.to_thread(self._load_bar_cache, symbol)
+
+            # With history back to the window start cached, only bars since the
+            # last cached one are requested (re-requesting it, as it may have
+            # been a partial day). Allow a few days of slack for weekends. A
+            # cache older than the window falls back to a full fetch.
+            if cached and min(cached) <= start + timedelta(days=4):
+                duration = min((today - max(cached)).days + 1, days)
+            else:
+                duration = days
 
             # Request historical data
             bars = await self.ib.reqHistoricalDataAsync(
                 stock,
                 endDateTime='',
-                durationStr=f'{days} D',
+                durationStr=f'{duration} D',
                 barSizeSetting='1 day',
                 whatToShow='TRADES',
                 useRTH=True
             )
 
-            if not bars or len(bars) < 2:
+            merged = cached | {bar.date: bar.close for bar in bars or ()}
+            if bars and self.bar_cache_dir is not None:
+                await asyncio.to_thread(self._save_bar_cache, symbol, merged)
+
+            window = [merged[d] for d in sorted(merged) if d >= start]
+            if len(window) < 2:
                 logger.warning(f"Insufficient historical data for {symbol}")
                 return None
 
-            # Calculate daily returns
-            closes = [bar.close for bar in bars]
-            returns = []
-            for i in range(1, len(closes)):
-                daily_return = (closes[i] - closes[i-1]) / closes[i-1]
-                returns.append(daily_return)
-
-            # Calculate volatility (standard deviation of returns)
-            if not returns:
+            closes = np.fromiter(window, dtype=np.float64, count=len(window))
+            if (closes[:-1] == 0).any():
+                logger.warning(f"Zero close in historical data for {symbol}")
                 return None
 
-            mean_return = sum(returns) / len(returns)
-            variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-            daily_vol = variance ** 0.5
+            # Daily returns and their (population) standard deviation
+            returns = np.diff(closes) / closes[:-1]
 
             # Annualize (assuming 252 trading days)
-            annual_vol = daily_vol * (252 ** 0.5)
+            annual_vol = float(returns.std() * np.sqrt(252))
 
             logger.debug(f"{symbol} {days}-day HV: {annual_vol:.2%}")
             return annual_vol
@@ -477,16 +1506,15 @@ async def main():
         # Connect
         await fetcher.connect()
 
-        # Get stock price
-        spy_price = await fetcher.get_stock_price('SPY')
+        # Fetch independent data concurrently
+        spy_price, account, positions, vix = await asyncio.gather(
+            fetcher.get_stock_price('SPY'),
+            fetcher.get_account_info('DU1234567'),
+            fetcher.get_positions(),
+            fetcher.get_vix()
+        )
         print(f"SPY Price: ${spy_price:.2f}")
-
-        # Get account info
-        account = await fetcher.get_account_info('DU1234567')
         print(f"Net Liquidation: ${account.net_liquidation:,.2f}")
-
-        # Get positions
-        positions = await fetcher.get_positions()
         print(f"Positions: {len(positions)}")
 
         # Get options chain
@@ -499,8 +1527,6 @@ async def main():
             print(f"  {opt.symbol} {opt.expiration.strftime('%Y-%m-%d')} {opt.strike}{opt.right}")
             print(f"  Bid/Ask: ${opt.bid:.2f}/${opt.ask:.2f}, Delta: {opt.delta:.3f}")
 
-        # Get VIX
-        vix = await fetcher.get_vix()
         if vix:
             print(f"VIX: {vix:.2f}")
 
@@ -12,16 +12,106 @@ Ideal for stocks trading in a range with low implied volatility.
 """
 
 import logging
-from typing import List, Optional, Dict, Tuple
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from datetime import date, datetime, timedelta
 
-from src.strategy_base import Strategy, StrategyType, Action, TradeRecommendation
-from src.data_fetcher import OptionChainData, Position, AccountInfo
+import numpy as np
+
+from src.strategy_base import Strategy, StrategyType, Action, TradeRecommendation, _nearest_delta_index
+from src.data_fetcher import (
+    OptionChainData, OptionChainBatch, OptionRight, Position, PositionBatch, AccountInfo
+)
 from src.config_loader import SymbolConfig
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class IronCondorGroup:
+    """The four legs of an iron condor held in the portfolio."""
+    expiration: date
+    long_put: Position
+    short_put: Position
+    short_call: Position
+    long_call: Position
+
+
+def _match_condor_legs(
+    expiration_ordinals: np.ndarray,
+    is_call: np.ndarray,
+    signs: np.ndarray
+) -> np.ndarray:
+    """
+    Find iron condor leg sets among option positions.
+
+    An expiration holds an iron condor when it has exactly four option
+    positions: one short and one long put, one short and one long call.
+
+    Args:
+        expiration_ordinals: (n,) expiration.toordinal() per position
+        is_call: (n,) True for calls, False for puts
+        signs: (n,) sign of each position's quantity
+
+    Returns:
+        (m, 4) row indices ordered long put, short put, short call, long call,
+        one row per iron condor in order of first appearance
+    """
+    # Leg code: 0 long put, 1 short put, 2 short call, 3 long call, 4 flat
+    code = np.where(is_call, 2 + (signs > 0), 1 - (signs > 0))
+    code = np.where(signs == 0, 4, code)
+
+    order = np.lexsort((code, expiration_ordinals))
+    _, starts, counts = np.unique(
+        expiration_ordinals[order], return_index=True, return_counts=True
+    )
+
+    starts = starts[counts == 4]
+    rows = order[starts[:, None] + np.arange(4)]
+    rows = rows[(code[rows] == np.arange(4)).all(axis=1)]
+
+    return rows[np.argsort(rows.min(axis=1), kind='stable')]
+
+
+def _ic_pnl(
+    costs: np.ndarray,
+    market_values: np.ndarray,
+    stock_price: float,
+    short_put_strikes: np.ndarray,
+    short_call_strikes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Numeric core of iron condor management, for many condors at once.
+
+    Args:
+        costs: (n, 4) average costs, columns short put, short call, long put, long call
+        market_values: (n, 4) market values, same column order
+        stock_price: Current stock price
+        short_put_strikes: (n,) short put strikes
+        short_call_strikes: (n,) short call strikes
+
+    Returns:
+        Tuple of arrays (profit as % of entry credit, distance from stock
+        price to the short put strike, distance to the short call strike),
+        distances as fractions of the stock price
+    """
+    abs_costs = np.abs(costs)
+    entry_credit = abs_costs[:, 0] + abs_costs[:, 1] - abs_costs[:, 2] - abs_costs[:, 3]
+    current_value = np.abs(market_values).sum(axis=1)
+
+    profit = entry_credit - current_value
+    profit_pct = np.divide(
+        profit * 100, entry_credit,
+        out=np.zeros_like(profit), where=entry_credit > 0
+    )
+
+    return (
+        profit_pct,
+        np.abs(stock_price - short_put_strikes) / stock_price,
+        np.abs(stock_price - short_call_strikes) / stock_price
+    )
+
+
 class IronCondorStrategy(Strategy):
     """
     Implements the Iron Condor options strategy.
@@ -34,6 +124,10 @@ class IronCondorStrategy(Strategy):
     5. Close or roll when profit target hit or approaching expiration
     """
 
+    # Only open in IV below 30%; a class attribute so compatible_mask can
+    # screen many symbols without an instance
+    max_volatility = 0.30
+
     def __init__(self, config: SymbolConfig):
         """
         Initialize Iron Condor strategy.
@@ -51,6 +145,11 @@ class IronCondorStrategy(Strategy):
         self.max_loss_percent = 200.0  # Close if loss > 200% of credit
         self.adjustment_threshold = 0.10  # Adjust if tested within 10% of strikes
 
+        # Last positions signature seen by _identify_iron_condor_positions and
+        # the leg layout (indices into positions) found for it
+        self._ic_signature: Optional[tuple] = None
+        self._ic_layout: List[Tuple[date, int, int, int, int]] = []
+
     def get_strategy_type(self) -> StrategyType:
         """Return strategy type identifier."""
         return StrategyType.IRON_CONDOR
@@ -74,16 +173,37 @@ class IronCondorStrategy(Strategy):
         """
         # Prefer neutral trends
         if trend and trend != 'neutral':
-            logger.debug(f"{self.symbol}: Iron Condor prefers neutral trends, got {trend}")
+            logger.debug("%s: Iron Condor prefers neutral trends, got %s", self.symbol, trend)
             return False
 
-        # Prefer lower volatility (< 30% IV)
-        if volatility and volatility > 0.30:
-            logger.debug(f"{self.symbol}: Iron Condor prefers low volatility, IV={volatility:.2%}")
+        # Prefer lower volatility
+        if volatility and volatility > self.max_volatility:
+            logger.debug("%s: Iron Condor prefers low volatility, IV=%.2f%%", self.symbol, volatility * 100)
             return False
 
         return True
 
+    @classmethod
+    def compatible_mask(
+        cls,
+        stock_prices: np.ndarray,
+        volatilities: np.ndarray,
+        trends: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized is_compatible_with: neutral (or unknown) trend, low volatility.
+
+        Args:
+            stock_prices: (n,) current stock prices
+            volatilities: (n,) implied volatilities, NaN where unknown
+            trends: (n,) trend strings, '' where unknown
+
+        Returns:
+            (n,) True where conditions are favorable for Iron Condor
+        """
+        # NaN compares False, so unknown volatility passes like it does above
+        return ((trends == '') | (trends == 'neutral')) & ~(volatilities > cls.max_volatility)
+
     def analyze(
         self,
         stock_price: float,
@@ -109,15 +229,21 @@ class IronCondorStrategy(Strategy):
             logger.debug(f"{self.symbol} is disabled, skipping")
             return recommendations
 
+        today = date.today()
+
         # Identify existing iron condor positions
         ic_positions = self._identify_iron_condor_positions(positions)
 
-        # Check existing positions for management
-        for ic_pos in ic_positions:
+        # Check existing positions for management, with the P&L math for
+        # all condors done in one vectorized pass
+        metrics = zip(*self._iron_condor_metrics(ic_positions, stock_price))
+        for ic_pos, ic_metrics in zip(ic_positions, metrics):
             rec = self._check_iron_condor_position(
                 ic_pos,
                 stock_price,
-                options_chain
+                options_chain,
+                ic_metrics,
+                today
             )
             if rec:
                 recommendations.append(rec)
@@ -127,7 +253,8 @@ class IronCondorStrategy(Strategy):
             rec = self._find_new_iron_condor(
                 stock_price,
                 options_chain,
-                account_info
+                account_info,
+                today
             )
             if rec:
                 recommendations.append(rec)
@@ -137,7 +264,7 @@ class IronCondorStrategy(Strategy):
     def _identify_iron_condor_positions(
         self,
         positions: List[Position]
-    ) -> List[Dict]:
+    ) -> List[IronCondorGroup]:
         """
         Identify existing iron condor positions from portfolio.
 
@@ -153,169 +280,203 @@ class IronCondorStrategy(Strategy):
         Returns:
             List of iron condor position groups
         """
-        iron_condors = []
-
-        # Get option positions
-        option_positions = [p for p in positions if p.position_type == 'option']
-
-        # Group by expiration
-        by_expiration = {}
-        for pos in option_positions:
-            if pos.expiration:
-                exp_key = pos.expiration.date()
-                if exp_key not in by_expiration:
-                    by_expiration[exp_key] = []
-                by_expiration[exp_key].append(pos)
-
-        # Look for iron condor pattern in each expiration
-        for exp_date, exp_positions in by_expiration.items():
-            puts = [p for p in exp_positions if p.right == 'P']
-            calls = [p for p in exp_positions if p.right == 'C']
-
-            # Need 2 puts and 2 calls for an iron condor
-            if len(puts) == 2 and len(calls) == 2:
-                # Check for short put + long put spread
-                puts_sorted = sorted(puts, key=lambda p: p.strike)
-                short_put = puts_sorted[1] if puts_sorted[1].quantity < 0 else puts_sorted[0]
-                long_put = puts_sorted[0] if puts_sorted[0].quantity > 0 else puts_sorted[1]
-
-                # Check for short call + long call spread
-                calls_sorted = sorted(calls, key=lambda p: p.strike)
-                short_call = calls_sorted[0] if calls_sorted[0].quantity < 0 else calls_sorted[1]
-                long_call = calls_sorted[1] if calls_sorted[1].quantity > 0 else calls_sorted[0]
-
-                # Verify it's actually an iron condor pattern
-                if (short_put.quantity < 0 and long_put.quantity > 0 and
-                    short_call.quantity < 0 and long_call.quantity > 0):
-
-                    iron_condors.append({
-                        'expiration': exp_date,
-                        'long_put': long_put,
-                        'short_put': short_put,
-                        'short_call': short_call,
-                        'long_call': long_call
-                    })
+        # The grouping depends only on these fields; when none changed since the
+        # last call, reuse its leg layout with the current Position objects
+        signature = tuple(
+            (p.position_type, p.right, p.strike, p.expiration_date, p.quantity)
+            for p in positions
+        )
+        if signature != self._ic_signature:
+            self._ic_signature = signature
+            self._ic_layout = self._group_iron_condor_legs(positions)
+
+        iron_condors = [
+            IronCondorGroup(
+                exp_date,
+                positions[long_put],
+                positions[short_put],
+                positions[short_call],
+                positions[long_call]
+            )
+            for exp_date, long_put, short_put, short_call, long_call in self._ic_layout
+        ]
 
         logger.debug(f"Found {len(iron_condors)} iron condor positions")
         return iron_condors
 
+    def _group_iron_condor_legs(
+        self,
+        positions: List[Position]
+    ) -> List[Tuple[date, int, int, int, int]]:
+        """
+        Find iron condor patterns among positions.
+
+        Args:
+            positions: Current positions
+
+        Returns:
+            (expiration, long put, short put, short call, long call) per iron
+            condor, legs given as indices into positions
+        """
+        batch = PositionBatch.from_positions(positions)
+        option_rows = np.flatnonzero(batch.is_option)
+
+        legs = option_rows[_match_condor_legs(
+            batch.expiration_ordinal[option_rows],
+            batch.is_call[option_rows],
+            np.sign(batch.quantity[option_rows])
+        )]
+
+        iron_condors = []
+        for long_put, short_put, short_call, long_call in legs.tolist():
+            iron_condors.append((
+                positions[long_put].expiration_date,
+                long_put,
+                short_put,
+                short_call,
+                long_call
+            ))
+
+        return iron_condors
+
+    def _iron_condor_metrics(
+        self,
+        ic_positions: List[IronCondorGroup],
+        stock_price: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute P&L % and short-strike distances for every iron condor.
+
+        Args:
+            ic_positions: Iron condor position groups
+            stock_price: Current stock price
+
+        Returns:
+            Arrays (profit_pct, put_distance, call_distance), one entry per condor
+        """
+        legs = [
+            (ic.short_put, ic.short_call, ic.long_put, ic.long_call)
+            for ic in ic_positions
+        ]
+        costs = np.array([[p.avg_cost for p in leg] for leg in legs], dtype=np.float64).reshape(-1, 4)
+        market_values = np.array(
+            [[p.market_value for p in leg] for leg in legs], dtype=np.float64
+        ).reshape(-1, 4)
+
+        return _ic_pnl(
+            costs,
+            market_values,
+            stock_price,
+            np.array([leg[0].strike for leg in legs], dtype=np.float64),
+            np.array([leg[1].strike for leg in legs], dtype=np.float64)
+        )
+
     def _check_iron_condor_position(
         self,
-        ic_position: Dict,
+        ic_position: IronCondorGroup,
         stock_price: float,
-        options_chain: List[OptionChainData]
+        options_chain: List[OptionChainData],
+        metrics: Optional[Tuple[float, float, float]] = None,
+        today: Optional[date] = None
     ) -> Optional[TradeRecommendation]:
         """
         Check if an existing iron condor should be managed.
 
         Args:
-            ic_position: Iron condor position dict
+            ic_position: Iron condor position group
             stock_price: Current stock price
             options_chain: Available options
+            metrics: Precomputed (profit_pct, put_distance, call_distance) from
+                _iron_condor_metrics; computed here if omitted
+            today: Reference date for DTE (defaults to today)
 
         Returns:
             Trade recommendation if action needed
         """
-        exp_date = ic_position['expiration']
-        dte = (exp_date - datetime.now().date()).days
+        exp_date = ic_position.expiration
+        dte = (exp_date - (today or date.today())).days
 
-        # Calculate P&L
-        total_credit = (
-            abs(ic_position['short_put'].avg_cost) +
-            abs(ic_position['short_call'].avg_cost)
-        )
-        total_debit = (
-            abs(ic_position['long_put'].avg_cost) +
-            abs(ic_position['long_call'].avg_cost)
-        )
-        entry_credit = total_credit - total_debit
-
-        current_value = (
-            abs(ic_position['short_put'].market_value) +
-            abs(ic_position['short_call'].market_value) +
-            abs(ic_position['long_put'].market_value) +
-            abs(ic_position['long_call'].market_value)
-        )
+        short_put = ic_position.short_put
+        short_call = ic_position.short_call
 
-        profit = entry_credit - current_value
-        profit_pct = (profit / entry_credit * 100) if entry_credit > 0 else 0
+        if metrics is None:
+            metrics = next(zip(*self._iron_condor_metrics([ic_position], stock_price)))
+        profit_pct, put_distance, call_distance = (float(m) for m in metrics)
 
         logger.debug(f"{self.symbol} Iron Condor: DTE={dte}, P&L={profit_pct:.1f}%")
 
         # Close for profit
         if profit_pct >= self.profit_target_percent:
-            return TradeRecommendation(
-                action=Action.CLOSE_IRON_CONDOR,
-                symbol=self.symbol,
-                quantity=abs(ic_position['short_put'].quantity),
-                strategy_type=StrategyType.IRON_CONDOR,
-                long_put_strike=ic_position['long_put'].strike,
-                short_put_strike=ic_position['short_put'].strike,
-                short_call_strike=ic_position['short_call'].strike,
-                long_call_strike=ic_position['long_call'].strike,
-                expiration=datetime.combine(exp_date, datetime.min.time()),
-                reasoning=f"Close iron condor for {profit_pct:.1f}% profit (target {self.profit_target_percent}%)"
+            return self._ic_rec(
+                Action.CLOSE_IRON_CONDOR,
+                ic_position,
+                f"Close iron condor for {profit_pct:.1f}% profit (target {self.profit_target_percent}%)"
             )
 
         # Close for loss
-        loss_pct = abs(profit_pct) if profit_pct < 0 else 0
+        loss_pct = -profit_pct if profit_pct < 0 else 0
         if loss_pct >= self.max_loss_percent:
-            return TradeRecommendation(
-                action=Action.CLOSE_IRON_CONDOR,
-                symbol=self.symbol,
-                quantity=abs(ic_position['short_put'].quantity),
-                strategy_type=StrategyType.IRON_CONDOR,
-                long_put_strike=ic_position['long_put'].strike,
-                short_put_strike=ic_position['short_put'].strike,
-                short_call_strike=ic_position['short_call'].strike,
-                long_call_strike=ic_position['long_call'].strike,
-                expiration=datetime.combine(exp_date, datetime.min.time()),
-                reasoning=f"Close iron condor for loss: {profit_pct:.1f}% (max loss {self.max_loss_percent}%)"
+            return self._ic_rec(
+                Action.CLOSE_IRON_CONDOR,
+                ic_position,
+                f"Close iron condor for loss: {profit_pct:.1f}% (max loss {self.max_loss_percent}%)"
             )
 
         # Roll if close to expiration
         if dte <= self.config.roll_when_dte:
-            return TradeRecommendation(
-                action=Action.ROLL_IRON_CONDOR,
-                symbol=self.symbol,
-                quantity=abs(ic_position['short_put'].quantity),
-                strategy_type=StrategyType.IRON_CONDOR,
-                long_put_strike=ic_position['long_put'].strike,
-                short_put_strike=ic_position['short_put'].strike,
-                short_call_strike=ic_position['short_call'].strike,
-                long_call_strike=ic_position['long_call'].strike,
-                expiration=datetime.combine(exp_date, datetime.min.time()),
-                reasoning=f"Roll iron condor with {dte} DTE"
+            return self._ic_rec(
+                Action.ROLL_IRON_CONDOR,
+                ic_position,
+                f"Roll iron condor with {dte} DTE"
             )
 
         # Check if price is testing strikes (needs adjustment)
-        short_put_strike = ic_position['short_put'].strike
-        short_call_strike = ic_position['short_call'].strike
-
-        put_distance = abs(stock_price - short_put_strike) / stock_price
-        call_distance = abs(stock_price - short_call_strike) / stock_price
-
         if put_distance < self.adjustment_threshold or call_distance < self.adjustment_threshold:
-            return TradeRecommendation(
-                action=Action.ADJUST_IRON_CONDOR,
-                symbol=self.symbol,
-                quantity=abs(ic_position['short_put'].quantity),
-                strategy_type=StrategyType.IRON_CONDOR,
-                long_put_strike=ic_position['long_put'].strike,
-                short_put_strike=ic_position['short_put'].strike,
-                short_call_strike=ic_position['short_call'].strike,
-                long_call_strike=ic_position['long_call'].strike,
-                expiration=datetime.combine(exp_date, datetime.min.time()),
-                reasoning=f"Price testing strikes: ${stock_price:.2f} near ${short_put_strike:.2f} or ${short_call_strike:.2f}"
+            return self._ic_rec(
+                Action.ADJUST_IRON_CONDOR,
+                ic_position,
+                f"Price testing strikes: ${stock_price:.2f} near ${short_put.strike:.2f} or ${short_call.strike:.2f}"
             )
 
         return None
 
+    def _ic_rec(
+        self,
+        action: Action,
+        ic_position: IronCondorGroup,
+        reasoning: str
+    ) -> TradeRecommendation:
+        """
+        Build a recommendation that acts on an existing iron condor.
+
+        Args:
+            action: Action to take on the condor
+            ic_position: Iron condor position group
+            reasoning: Explanation for the recommendation
+
+        Returns:
+            Trade recommendation covering all four legs
+        """
+        short_put = ic_position.short_put
+        return TradeRecommendation(
+            action=action,
+            symbol=self.symbol,
+            quantity=abs(short_put.quantity),
+            strategy_type=StrategyType.IRON_CONDOR,
+            long_put_strike=ic_position.long_put.strike,
+            short_put_strike=short_put.strike,
+            short_call_strike=ic_position.short_call.strike,
+            long_call_strike=ic_position.long_call.strike,
+            expiration=datetime.combine(ic_position.expiration, datetime.min.time()),
+            reasoning=reasoning
+        )
+
     def _find_new_iron_condor(
         self,
         stock_price: float,
         options_chain: List[OptionChainData],
-        account_info: AccountInfo
+        account_info: AccountInfo,
+        today: Optional[date] = None
     ) -> Optional[TradeRecommendation]:
         """
         Find a new iron condor to open.
@@ -324,71 +485,46 @@ class IronCondorStrategy(Strategy):
             stock_price: Current stock price
             options_chain: Available options
             account_info: Account information
+            today: Reference date for DTE (defaults to today)
 
         Returns:
             Trade recommendation for new iron condor
         """
-        # Find suitable expiration
-        expirations = self._get_valid_expirations(options_chain)
+        # Use the nearest expiration that meets our criteria
+        target_exp = self._get_target_expiration(options_chain, today)
 
-        if not expirations:
+        if target_exp is None:
             logger.debug(f"{self.symbol}: No valid expirations for iron condor")
             return None
 
-        # Use the first expiration that meets our criteria
-        target_exp = expirations[0]
-
-        # Find the four legs
-        # Short put: ~30 delta OTM put
-        short_put = self._find_option_by_delta(
-            options_chain, 'P', 0.30, stock_price,
-            self.config.dte_min, self.config.dte_max
+        # Select all four legs in one pass over the chain
+        batch = self._get_chain_batch(options_chain)
+        short_put_idx, long_put_idx, short_call_idx, long_call_idx = self._select_condor_legs(
+            batch, target_exp.toordinal()
         )
 
-        if not short_put or short_put.expiration.date() != target_exp.date():
+        if short_put_idx < 0:
             logger.debug(f"{self.symbol}: Could not find suitable short put")
             return None
-
-        # Long put: wing_width below short put
-        long_put_strike = short_put.strike - self.wing_width
-        long_put = self._find_option_at_strike(
-            options_chain, 'P', long_put_strike, target_exp
-        )
-
-        if not long_put:
+        if long_put_idx < 0:
             logger.debug(f"{self.symbol}: Could not find suitable long put")
             return None
-
-        # Short call: ~30 delta OTM call
-        short_call = self._find_option_by_delta(
-            options_chain, 'C', 0.30, stock_price,
-            self.config.dte_min, self.config.dte_max
-        )
-
-        if not short_call or short_call.expiration.date() != target_exp.date():
+        if short_call_idx < 0:
             logger.debug(f"{self.symbol}: Could not find suitable short call")
             return None
-
-        # Long call: wing_width above short call
-        long_call_strike = short_call.strike + self.wing_width
-        long_call = self._find_option_at_strike(
-            options_chain, 'C', long_call_strike, target_exp
-        )
-
-        if not long_call:
+        if long_call_idx < 0:
             logger.debug(f"{self.symbol}: Could not find suitable long call")
             return None
 
-        # Calculate net credit
-        total_credit = (
-            (short_put.bid + short_put.ask) / 2 +
-            (short_call.bid + short_call.ask) / 2
-        )
-        total_debit = (
-            (long_put.bid + long_put.ask) / 2 +
-            (long_call.bid + long_call.ask) / 2
-        )
-        net_credit = total_credit - total_debit
+        short_put = batch.options[short_put_idx]
+        long_put = batch.options[long_put_idx]
+        short_call = batch.options[short_call_idx]
+        long_call = batch.options[long_call_idx]
+
+        # Calculate net credit from the four leg mids in one gather
+        legs = np.array([short_put_idx, short_call_idx, long_put_idx, long_call_idx])
+        mids = ((batch.bid[legs] + batch.ask[legs]) * 0.5).tolist()
+        net_credit = (mids[0] + mids[1]) - (mids[2] + mids[3])
 
         # Check minimum credit
         if net_credit < self.min_credit:
@@ -416,28 +552,117 @@ class IronCondorStrategy(Strategy):
             reasoning=f"Sell iron condor: ${long_put.strike:.0f}/${short_put.strike:.0f}/${short_call.strike:.0f}/${long_call.strike:.0f} for ${net_credit:.2f} credit"
         )
 
+    def _select_condor_legs(
+        self,
+        batch: OptionChainBatch,
+        expiration_ordinal: int
+    ) -> Tuple[int, int, int, int]:
+        """
+        Pick the four iron condor legs for one expiration.
+
+        Short legs are the quoted ~30 delta put and call; long legs sit
+        wing_width further out of the money, found by exact strike lookup.
+        Only the rows of the target expiration's put and call groups are
+        examined.
+
+        Args:
+            batch: Columnar view of the options chain
+            expiration_ordinal: Target expiration as date.toordinal()
+
+        Returns:
+            Indices of (short put, long put, short call, long call) into the
+            batch, -1 for any leg that could not be found
+        """
+        groups = batch.groups()
+        empty = np.empty(0, dtype=np.intp)
+        puts = groups.get((OptionRight.P, expiration_ordinal), empty)
+        calls = groups.get((OptionRight.C, expiration_ordinal), empty)
+
+        # One contiguous pass over the chain columns, shared with the other
+        # delta searches; the per-group work below only gathers from it
+        has_delta = batch.has_delta()
+
+        def short_leg(rows: np.ndarray, target: float) -> int:
+            idx = _nearest_delta_index(batch.delta[rows], has_delta[rows], target)
+            return int(rows[idx]) if idx >= 0 else -1
+
+        # Wing strikes are found in whole cents so float error cannot miss them
+        wing_cents = round(self.wing_width * 100)
+
+        def long_leg(short_idx: int, right: OptionRight, offset: int) -> int:
+            if short_idx < 0:
+                return -1
+            return batch.quoted_row(
+                right, expiration_ordinal, int(batch.strike_cents[short_idx]) + offset
+            )
+
+        short_put = short_leg(puts, -0.30)
+        short_call = short_leg(calls, 0.30)
+
+        return (
+            short_put,
+            long_leg(short_put, OptionRight.P, -wing_cents),
+            short_call,
+            long_leg(short_call, OptionRight.C, wing_cents)
+        )
+
+    def _get_target_expiration(
+        self,
+        options_chain: List[OptionChainData],
+        today: Optional[date] = None
+    ) -> Optional[datetime]:
+        """
+        Get the nearest expiration within DTE range.
+
+        Args:
+            options_chain: Available options
+            today: Reference date for DTE (defaults to today)
+
+        Returns:
+            Nearest valid expiration, or None if there is none
+        """
+        batch = self._get_chain_batch(options_chain)
+        today_ordinal = (today or date.today()).toordinal()
+
+        groups = batch.groups()
+        target = min(
+            (
+                exp_ordinal for _, exp_ordinal in groups
+                if self.config.dte_min <= exp_ordinal - today_ordinal <= self.config.dte_max
+            ),
+            default=None
+        )
+        if target is None:
+            return None
+
+        row = min(rows[0] for (_, exp_ordinal), rows in groups.items() if exp_ordinal == target)
+        return batch.options[row].expiration
+
     def _get_valid_expirations(
         self,
-        options_chain: List[OptionChainData]
+        options_chain: List[OptionChainData],
+        today: Optional[date] = None
     ) -> List[datetime]:
         """
         Get valid expirations within DTE range.
 
         Args:
             options_chain: Available options
+            today: Reference date for DTE (defaults to today)
 
         Returns:
             List of valid expiration dates
         """
-        today = datetime.now().date()
-        expirations = set()
+        batch = self._get_chain_batch(options_chain)
+        today_ordinal = (today or date.today()).toordinal()
 
-        for option in options_chain:
-            dte = (option.expiration.date() - today).days
-            if self.config.dte_min <= dte <= self.config.dte_max:
-                expirations.add(option.expiration)
+        # One representative option per distinct expiration date, in date order
+        first_rows = {}
+        for (_, exp_ordinal), rows in batch.groups().items():
+            if self.config.dte_min <= exp_ordinal - today_ordinal <= self.config.dte_max:
+                first_rows[exp_ordinal] = min(first_rows.get(exp_ordinal, rows[0]), rows[0])
 
-        return sorted(list(expirations))
+        return [batch.options[first_rows[k]].expiration for k in sorted(first_rows)]
 
     def _find_option_at_strike(
         self,
@@ -458,14 +683,10 @@ class IronCondorStrategy(Strategy):
         Returns:
             Matching option or None
         """
-        for option in options_chain:
-            if (option.right == right and
-                option.strike == strike and
-                option.expiration.date() == expiration.date() and
-                option.bid > 0 and option.ask > 0):
-                return option
+        batch = self._get_chain_batch(options_chain)
+        row = batch.quoted_row(OptionRight[right], expiration.toordinal(), round(strike * 100))
 
-        return None
+        return batch.options[row] if row >= 0 else None
 
 
 def main():
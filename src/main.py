@@ -11,34 +11,67 @@ Coordinates all modules to run the automated trading bot:
 - Handles scheduling
 """
 
+import atexit
+import copy
 import logging
 import asyncio
+import queue
 import sys
-from datetime import datetime, time as dt_time
-from typing import List
+import time
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, timedelta, time as dt_time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 import schedule
 
 from ib_async import IB, util
 
-from src.config_loader import load_config, Config
-from src.data_fetcher import DataFetcher
-from src.strategy_base import TradeRecommendation
+try:
+    import uvloop
+except ImportError:  # Optional; falls back to the default asyncio loop
+    uvloop = None
+
+from src.config_loader import load_config, Config, SymbolConfig
+from src.data_fetcher import DataFetcher, OptionChainData, Position, AccountInfo
+from src.strategy_base import Strategy, TradeRecommendation
 from src.strategy_selector import StrategySelector
 from src.risk_manager import RiskManager
-from src.order_executor import OrderExecutor
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/thetagang.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+from src.order_executor import OrderExecutor, OrderJournal
+
+# Configure logging. Log calls only enqueue the record; a listener thread
+# formats it and does the file/console writes off the event loop
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('logs/thetagang.log'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# The queue handler only merges args into the message; the layout above is
+# applied by the listener's handlers
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 
 logger = logging.getLogger(__name__)
 
+# Approved orders submitted to IBKR at the same time
+MAX_CONCURRENT_ORDERS = 8
+
+# Append-only record of every order and status change
+ORDER_JOURNAL_PATH = 'logs/orders.jsonl'
+
+# A symbol's strategy analysis is reused by the next scheduled cycle while its
+# inputs are unchanged; entries live one run interval plus this much slack
+ANALYSIS_CACHE_SLACK_SECONDS = 60
+
 
 class ThetaGangBot:
     """
@@ -67,6 +100,12 @@ class ThetaGangBot:
         self.strategy_selector: Optional[StrategySelector] = None
         self.ib: Optional[IB] = None
 
+        # symbol -> (inputs key, recommendations, expires_at) for _cached_analysis
+        self._analysis_cache: Dict[str, Tuple[tuple, List[TradeRecommendation], float]] = {}
+
+        # [weekday, hour] -> inside trading hours, for should_trade_now
+        self._trading_hours = self._build_trading_hours()
+
         self._setup_logging()
         self._initialize_strategy_selector()
 
@@ -100,16 +139,17 @@ class ThetaGangBot:
         """Connect to IBKR and initialize components."""
         logger.info("Connecting to IBKR...")
 
-        # Initialize IB connection
-        self.ib = IB()
+        # Initialize data fetcher; the order executor shares its connection
+        self.data_fetcher = DataFetcher(
+            host=self.config.account.host,
+            port=self.config.account.port,
+            client_id=self.config.account.client_id,
+            bar_cache_dir=self.config.data.bar_cache_dir
+        )
 
         try:
-            await self.ib.connectAsync(
-                host=self.config.account.host,
-                port=self.config.account.port,
-                clientId=self.config.account.client_id,
-                timeout=30
-            )
+            await self.data_fetcher.connect(timeout=30)
+            self.ib = self.data_fetcher.ib
 
             logger.info(f"Connected to IBKR at {self.config.account.host}:{self.config.account.port}")
 
@@ -117,14 +157,10 @@ class ThetaGangBot:
             logger.error(f"Failed to connect to IBKR: {e}")
             raise
 
-        # Initialize data fetcher
-        self.data_fetcher = DataFetcher(
-            host=self.config.account.host,
-            port=self.config.account.port,
-            client_id=self.config.account.client_id
+        # Option expirations/strikes for every enabled symbol, fetched up front
+        await self.data_fetcher.preload_option_params(
+            [symbol for symbol, cfg in self.config.symbols.items() if cfg.enabled]
         )
-        self.data_fetcher.ib = self.ib
-        self.data_fetcher._connected = True
 
         # Initialize risk manager
         self.risk_manager = RiskManager(
@@ -135,16 +171,19 @@ class ThetaGangBot:
         # Initialize order executor
         self.order_executor = OrderExecutor(
             ib=self.ib,
-            dry_run=self.config.dry_run
+            dry_run=self.config.dry_run,
+            journal=OrderJournal(ORDER_JOURNAL_PATH)
         )
 
         logger.info("All components initialized")
 
     async def disconnect(self):
-        """Disconnect from IBKR."""
-        if self.ib and self.ib.isConnected():
-            self.ib.disconnect()
-            logger.info("Disconnected from IBKR")
+        """Disconnect from IBKR and flush the order journal."""
+        if self.data_fetcher:
+            await self.data_fetcher.disconnect()
+
+        if self.order_executor and self.order_executor.journal:
+            self.order_executor.journal.close()
 
     async def run_once(self):
         """
@@ -162,21 +201,19 @@ class ThetaGangBot:
         logger.info("=" * 60)
 
         try:
-            # Get account info
-            account_info = await self.data_fetcher.get_account_info(
-                self.config.account.account_number
+            # Get account info, all current positions and VIX (for risk
+            # checks) together; they are independent requests
+            account_info, all_positions, vix = await asyncio.gather(
+                self.data_fetcher.get_account_info(self.config.account.account_number),
+                self.data_fetcher.get_positions(),
+                self.data_fetcher.get_vix()
             )
 
             logger.info(f"Account: {account_info.account_number}")
             logger.info(f"Net Liquidation: ${account_info.net_liquidation:,.2f}")
             logger.info(f"Buying Power: ${account_info.buying_power:,.2f}")
-
-            # Get all current positions
-            all_positions = await self.data_fetcher.get_positions()
             logger.info(f"Current positions: {len(all_positions)}")
 
-            # Get VIX for risk checks
-            vix = await self.data_fetcher.get_vix()
             if vix:
                 logger.info(f"VIX: {vix:.2f}")
 
@@ -189,81 +226,51 @@ class ThetaGangBot:
             logger.info(f"Portfolio: {portfolio_risk.total_positions} positions, "
                        f"margin usage: {portfolio_risk.margin_usage_percent:.1%}")
 
-            # Process each enabled symbol
-            all_recommendations = []
-
-            for symbol, symbol_config in self.config.symbols.items():
-                if not symbol_config.enabled:
-                    continue
-
-                logger.info(f"\nAnalyzing {symbol}...")
-
-                try:
-                    # Get current stock price
-                    stock_price = await self.data_fetcher.get_stock_price(symbol)
-                    logger.info(f"{symbol} price: ${stock_price:.2f}")
-
-                    # Get historical volatility for strategy selection
-                    volatility = await self.data_fetcher.get_historical_volatility(symbol, days=30)
-
-                    # Get options chain
-                    options_chain = await self.data_fetcher.get_options_chain(
+            # Analyze all enabled symbols concurrently; their IBKR requests
+            # are independent, so the waits overlap
+            symbols = [
+                (symbol, symbol_config)
+                for symbol, symbol_config in self.config.symbols.items()
+                if symbol_config.enabled
+            ]
+            # Bucket positions by symbol once for all symbols
+            positions_by_symbol: Dict[str, List[Position]] = {}
+            for p in all_positions:
+                positions_by_symbol.setdefault(p.symbol, []).append(p)
+
+            results = await asyncio.gather(
+                *(
+                    self._analyze_symbol(
                         symbol,
-                        min_dte=symbol_config.dte_min,
-                        max_dte=symbol_config.dte_max
-                    )
-
-                    logger.info(f"Retrieved {len(options_chain)} options for {symbol}")
-
-                    # Get positions for this symbol
-                    symbol_positions = [p for p in all_positions if p.symbol == symbol]
-
-                    # Select best strategy for current market conditions
-                    strategy = self.strategy_selector.select_best_strategy(
-                        symbol,
-                        stock_price,
-                        volatility,
-                        trend='neutral',  # Could be enhanced with trend detection
-                        existing_positions=symbol_positions
-                    )
-
-                    if not strategy:
-                        logger.warning(f"{symbol}: No suitable strategy selected")
-                        continue
-
-                    logger.info(f"{symbol}: Using {strategy.get_strategy_type().value} strategy")
-
-                    # Run strategy analysis
-                    recommendations = strategy.analyze(
-                        stock_price,
-                        options_chain,
-                        symbol_positions,
+                        symbol_config,
+                        positions_by_symbol.get(symbol, []),
                         account_info
                     )
+                    for symbol, symbol_config in symbols
+                ),
+                return_exceptions=True
+            )
 
-                    logger.info(f"{symbol}: {len(recommendations)} recommendations")
-
-                    for rec in recommendations:
-                        logger.info(f"  - {rec.action.value} ({rec.strategy_type.value}): {rec.reasoning}")
-
-                    all_recommendations.extend(recommendations)
-
-                except Exception as e:
-                    logger.error(f"Error analyzing {symbol}: {e}", exc_info=True)
+            all_recommendations = []
+            for (symbol, _), result in zip(symbols, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Error analyzing {symbol}: {result}", exc_info=result)
                     continue
+                all_recommendations.extend(result)
 
             # Validate and execute trades
             logger.info(f"\nValidating {len(all_recommendations)} total recommendations")
 
-            for rec in all_recommendations:
-                # Validate with risk manager
-                risk_result = self.risk_manager.validate_trade(
-                    rec,
-                    all_positions,
-                    account_info,
-                    vix
-                )
+            # Validate with risk manager, sharing one summary of the positions
+            risk_results = self.risk_manager.validate_trades_batch(
+                all_recommendations,
+                all_positions,
+                account_info,
+                vix
+            )
 
+            approved = []
+            for rec, risk_result in zip(all_recommendations, risk_results):
                 if risk_result.approved:
                     logger.info(f"✓ Trade approved: {rec.action.value} {rec.symbol}")
 
@@ -272,18 +279,40 @@ class ThetaGangBot:
                         logger.info(f"  Adjusting quantity: {rec.quantity} -> {risk_result.adjusted_quantity}")
                         rec.quantity = risk_result.adjusted_quantity
 
-                    # Execute trade
-                    order = await self.order_executor.execute_recommendation(rec)
-
-                    if order:
-                        logger.info(f"  Order submitted: ID={order.order_id}")
-                    else:
-                        logger.warning(f"  Failed to execute trade")
+                    approved.append(rec)
 
                 else:
                     logger.warning(f"✗ Trade rejected: {rec.action.value} {rec.symbol}")
                     for reason in risk_result.reasons:
-                        logger.warning(f"  - {reason}")
+                        logger.warning("  - %s", reason)
+
+            # Execute approved trades concurrently, a few at a time
+            order_slots = asyncio.Semaphore(MAX_CONCURRENT_ORDERS)
+
+            async def submit(rec: TradeRecommendation):
+                async with order_slots:
+                    return await self.order_executor.execute_recommendation(rec)
+
+            orders = await asyncio.gather(
+                *(submit(rec) for rec in approved),
+                return_exceptions=True
+            )
+
+            for rec, order in zip(approved, orders):
+                if isinstance(order, BaseException):
+                    logger.error(f"  Error executing {rec.action.value} {rec.symbol}: {order}", exc_info=order)
+                elif order:
+                    logger.info(f"  Order submitted for {rec.symbol}: ID={order.order_id}")
+                else:
+                    logger.warning(f"  Failed to execute trade: {rec.action.value} {rec.symbol}")
+
+            if any(order and not isinstance(order, BaseException) for order in orders):
+                # Balances and positions change once the orders work; refetch
+                # and re-analyze next time
+                self.data_fetcher.invalidate(self.config.account.account_number)
+                for rec, order in zip(approved, orders):
+                    if order and not isinstance(order, BaseException):
+                        self._analysis_cache.pop(rec.symbol, None)
 
             # Get order statistics
             stats = self.order_executor.get_order_statistics()
@@ -296,33 +325,175 @@ class ThetaGangBot:
         except Exception as e:
             logger.error(f"Error in trading cycle: {e}", exc_info=True)
 
-    def should_trade_now(self) -> bool:
+    async def _analyze_symbol(
+        self,
+        symbol: str,
+        symbol_config: SymbolConfig,
+        symbol_positions: List[Position],
+        account_info: AccountInfo
+    ) -> List[TradeRecommendation]:
         """
-        Check if we should trade based on current time and schedule.
+        Fetch market data for one symbol and run its selected strategy.
+
+        Args:
+            symbol: Ticker symbol
+            symbol_config: Symbol-specific configuration
+            symbol_positions: Current positions for this symbol
+            account_info: Account balance and buying power
 
         Returns:
-            True if within trading hours and on trading day
+            Trade recommendations for the symbol (empty on error)
         """
-        now = datetime.now()
+        logger.info(f"\nAnalyzing {symbol}...")
 
-        # Check day of week
-        if now.weekday() not in self.config.schedule.trading_days:
-            logger.debug(f"Not a trading day (day {now.weekday()})")
-            return False
+        try:
+            async def price_and_chain():
+                # The chain's strike filter needs the price, so these two run in order
+                stock_price = await self.data_fetcher.get_stock_price(symbol)
+                logger.info(f"{symbol} price: ${stock_price:.2f}")
+
+                chain_batch = await self.data_fetcher.get_options_chain_batch(
+                    symbol,
+                    min_dte=symbol_config.dte_min,
+                    max_dte=symbol_config.dte_max,
+                    stock_price=stock_price
+                )
+                return stock_price, chain_batch
 
-        # Check time of day (UTC)
-        current_hour = now.hour
+            # Historical volatility (for strategy selection) is independent of
+            # the price and chain, so fetch it alongside them
+            (stock_price, chain_batch), volatility = await asyncio.gather(
+                price_and_chain(),
+                self.data_fetcher.get_historical_volatility(symbol, days=30)
+            )
 
-        if current_hour < self.config.schedule.trading_start_hour:
-            logger.debug(f"Before trading hours (current: {current_hour}, start: {self.config.schedule.trading_start_hour})")
-            return False
+            options_chain = chain_batch.options
+            logger.info(f"Retrieved {len(options_chain)} options for {symbol}")
+
+            # Select best strategy for current market conditions
+            strategy = self.strategy_selector.select_best_strategy(
+                symbol,
+                stock_price,
+                volatility,
+                trend='neutral',  # Could be enhanced with trend detection
+                existing_positions=symbol_positions
+            )
+
+            if not strategy:
+                logger.warning(f"{symbol}: No suitable strategy selected")
+                return []
+
+            logger.info(f"{symbol}: Using {strategy.get_strategy_type().value} strategy")
+            strategy.use_chain_batch(chain_batch)
+
+            # Run strategy analysis, unless the inputs match the last run
+            recommendations = self._cached_analysis(
+                symbol, strategy, stock_price, options_chain, symbol_positions, account_info
+            )
+
+            logger.info(f"{symbol}: {len(recommendations)} recommendations")
+
+            for rec in recommendations:
+                logger.info(f"  - {rec.action.value} ({rec.strategy_type.value}): {rec.reasoning}")
+
+            # Recommendations copy what they need; recycle the chain once the
+            # strategy no longer points at its options
+            strategy.release_chain_batch()
+            self.data_fetcher.release_chain(options_chain)
+
+            return recommendations
+
+        except Exception as e:
+            logger.error(f"Error analyzing {symbol}: {e}", exc_info=True)
+            return []
+
+    def _cached_analysis(
+        self,
+        symbol: str,
+        strategy: Strategy,
+        stock_price: float,
+        options_chain: List[OptionChainData],
+        positions: List[Position],
+        account_info: AccountInfo
+    ) -> List[TradeRecommendation]:
+        """
+        Run strategy.analyze, reusing the previous result for unchanged inputs.
+
+        The last result per symbol is kept until the next scheduled cycle
+        (one run interval plus ANALYSIS_CACHE_SLACK_SECONDS) and reused when
+        the strategy, price (to the cent), chain fingerprint, positions
+        (including their marks) and buying power all match. Copies are
+        returned because recommendations are adjusted in place during risk
+        validation.
+
+        Args:
+            symbol: Ticker symbol
+            strategy: Selected strategy
+            stock_price: Current stock price
+            options_chain: Available options
+            positions: Current positions for this symbol
+            account_info: Account balance and buying power
+
+        Returns:
+            Trade recommendations
+        """
+        key = (
+            strategy.get_strategy_type(),
+            round(stock_price, 2),
+            strategy.chain_fingerprint(options_chain),
+            tuple(
+                (p.position_type, p.right, p.strike, p.expiration, p.quantity, p.avg_cost, p.market_value)
+                for p in positions
+            ),
+            account_info.buying_power
+        )
+
+        now = time.monotonic()
+        hit = self._analysis_cache.get(symbol)
+        if hit is not None and hit[0] == key and hit[2] > now:
+            logger.debug(f"{symbol}: Inputs unchanged, reusing previous analysis")
+            recommendations = hit[1]
+        else:
+            recommendations = strategy.analyze(stock_price, options_chain, positions, account_info)
+            ttl = self.config.schedule.run_every_minutes * 60 + ANALYSIS_CACHE_SLACK_SECONDS
+            self._analysis_cache[symbol] = (key, recommendations, now + ttl)
 
-        if current_hour >= self.config.schedule.trading_end_hour:
-            logger.debug(f"After trading hours (current: {current_hour}, end: {self.config.schedule.trading_end_hour})")
+        return [copy.copy(rec) for rec in recommendations]
+
+    def should_trade_now(self, now: Optional[datetime] = None) -> bool:
+        """
+        Check if we should trade based on current time and schedule.
+
+        Args:
+            now: Reference time (defaults to now)
+
+        Returns:
+            True if within trading hours and on trading day
+        """
+        now = now or datetime.now()
+
+        if not self._trading_hours[now.weekday(), now.hour]:
+            logger.debug("Outside trading schedule (day %d, hour %d)", now.weekday(), now.hour)
             return False
 
         return True
 
+    def _build_trading_hours(self) -> np.ndarray:
+        """
+        Build the weekly trading schedule as a lookup table.
+
+        Returns:
+            (7, 24) boolean array indexed by [weekday, hour], True for hours
+            in [trading_start_hour, trading_end_hour) on trading days
+        """
+        schedule_config = self.config.schedule
+        trading_hours = np.zeros((7, 24), dtype=bool)
+        trading_hours[
+            list(schedule_config.trading_days),
+            schedule_config.trading_start_hour:schedule_config.trading_end_hour
+        ] = True
+        return trading_hours
+
     async def run_scheduled(self):
         """Run the bot on a schedule."""
         logger.info("Starting scheduled mode")
@@ -337,11 +508,48 @@ class ThetaGangBot:
 
         # Schedule periodic runs
         while True:
-            if self.should_trade_now():
+            # One clock read decides both whether to run and how long to wait
+            now = datetime.now()
+            if self.should_trade_now(now):
                 await self.run_once()
 
-            # Sleep until next scheduled run
-            await asyncio.sleep(self.config.schedule.run_every_minutes * 60)
+                # Sleep until next scheduled run
+                await asyncio.sleep(self.config.schedule.run_every_minutes * 60)
+            else:
+                # Outside trading hours: sleep straight through to the next window
+                wait = max(self._seconds_until_next_run(now), 1.0)
+                logger.info(f"Outside trading hours, next run in {wait / 3600:.1f}h")
+                await asyncio.sleep(wait)
+
+    def _seconds_until_next_run(self, now: Optional[datetime] = None) -> float:
+        """
+        Get the time until the next trading window opens.
+
+        Args:
+            now: Reference time (defaults to now)
+
+        Returns:
+            Seconds until the next window starts (0 if inside one now); the
+            regular run interval if no trading days are configured
+        """
+        schedule_config = self.config.schedule
+        now = now or datetime.now()
+
+        for days_ahead in range(8):
+            day = now.date() + timedelta(days=days_ahead)
+            if day.weekday() not in schedule_config.trading_days:
+                continue
+
+            midnight = datetime.combine(day, dt_time())
+            start = midnight + timedelta(hours=schedule_config.trading_start_hour)
+            end = midnight + timedelta(hours=schedule_config.trading_end_hour)
+
+            if now < start:
+                return (start - now).total_seconds()
+            if now < end:
+                return 0.0
+
+        return schedule_config.run_every_minutes * 60
 
 
 async def main():
@@ -391,6 +599,11 @@ async def main():
 
 
 if __name__ == '__main__':
-    # Use ib_async's event loop
-    util.startLoop()
-    asyncio.run(main())
+    if uvloop is not None:
+        # util.startLoop() patches asyncio for nested loops, which uvloop's
+        # loop doesn't support; a plain script run doesn't need it
+        uvloop.run(main())
+    else:
+        # Use ib_async's event loop
+        util.startLoop()
+        asyncio.run(main())
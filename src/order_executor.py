@@ -5,14 +5,21 @@ Manages order creation, submission, tracking, and cancellation.
 Translates strategy decisions into specific order objects and submits to IBKR.
 """
 
+import itertools
+import json
 import logging
-from typing import List, Optional, Dict
+import os
+import queue
+import threading
+from collections import Counter, deque
+from pathlib import Path
+from typing import Deque, List, Optional, Dict, Tuple
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
 
-from ib_async import IB, Order, Trade, Stock, Option, Contract
+from ib_async import IB, Order, Trade, Stock, Option, Contract, Bag, ComboLeg
 from ib_async import LimitOrder, MarketOrder
 
 from src.strategy_base import TradeRecommendation, Action
@@ -20,6 +27,12 @@ from src.data_fetcher import Position
 
 logger = logging.getLogger(__name__)
 
+# Order records kept in memory; older ones are dropped from the history
+MAX_ORDER_HISTORY = 10_000
+
+# Most journal entries written (and fsynced) together
+JOURNAL_BATCH_SIZE = 32
+
 
 class OrderStatus(Enum):
     """Order status types."""
@@ -31,6 +44,10 @@ class OrderStatus(Enum):
     REJECTED = "rejected"
 
 
+# Statuses after which an order will not change again
+FINAL_STATUSES = frozenset({OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.REJECTED})
+
+
 @dataclass
 class OrderRecord:
     """Record of an order submission."""
@@ -53,6 +70,71 @@ class OrderRecord:
     # IBKR trade object
     trade: Optional[Trade] = None
 
+    # Resolved with the final status once the order fills, is cancelled or
+    # is rejected; created by the first _wait_for_fill
+    done: Optional[asyncio.Future] = field(default=None, repr=False, compare=False)
+
+
+class OrderJournal:
+    """
+    Append-only JSON-lines log of order submissions and status changes.
+
+    append() only enqueues the entry; a background thread writes queued
+    entries in batches and fsyncs after each batch, so the event loop never
+    waits on disk and entries written before a crash survive it.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open the journal and start its writer thread.
+
+        Args:
+            path: Journal file, appended to if it exists
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name='order-journal', daemon=True)
+        self._thread.start()
+
+    def append(self, entry: Dict):
+        """Queue one entry for writing."""
+        self._queue.put(entry)
+
+    def close(self):
+        """Write everything queued so far and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        """Writer thread: drain the queue in batches until close()."""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            while True:
+                batch = [self._queue.get()]
+                while batch[-1] is not None and len(batch) < JOURNAL_BATCH_SIZE:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                entries = [entry for entry in batch if entry is not None]
+                if entries:
+                    f.write(''.join(json.dumps(entry, default=str) + '\n' for entry in entries))
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                if batch[-1] is None:
+                    return
+
+
+# Order class -> (recorded order type, whether it carries a limit price).
+# ib_async's Order defines lmtPrice on every order type, so it can't be probed.
+ORDER_TYPES: Dict[type, Tuple[str, bool]] = {
+    LimitOrder: ('LIMIT', True),
+    MarketOrder: ('MARKET', False),
+}
+
 
 class OrderExecutor:
     """
@@ -61,21 +143,40 @@ class OrderExecutor:
     Supports:
     - Opening new positions (sell puts/calls)
     - Closing positions (buy to close)
-    - Rolling positions (close + open)
+    - Rolling positions (close + open as one combo order)
     - Dry-run mode for testing
     """
 
-    def __init__(self, ib: IB, dry_run: bool = True):
+    def __init__(
+        self,
+        ib: IB,
+        dry_run: bool = True,
+        max_history: int = MAX_ORDER_HISTORY,
+        journal: Optional[OrderJournal] = None
+    ):
         """
         Initialize order executor.
 
         Args:
             ib: Connected IB instance
             dry_run: If True, log orders but don't actually submit
+            max_history: Most recent order records to keep in memory
+            journal: Journal to record submissions and status changes in
         """
         self.ib = ib
         self.dry_run = dry_run
-        self.order_history: List[OrderRecord] = []
+        self.journal = journal
+        self.order_history: Deque[OrderRecord] = deque(maxlen=max_history)
+
+        # Kept in step by _record_order and _set_status: first retained
+        # record per order ID, and lifetime order counts (total and per
+        # status) that survive records leaving the history
+        self._by_id: Dict[int, OrderRecord] = {}
+        self._status_counts: Counter = Counter()
+        self._total_orders = 0
+
+        # Qualified option contracts by (symbol, expiration, strike, right)
+        self._contract_cache: Dict[Tuple[str, str, float, str], Contract] = {}
 
     async def execute_recommendation(
         self,
@@ -138,18 +239,13 @@ class OrderExecutor:
             logger.error("Missing strike or expiration for sell option order")
             return None
 
-        # Create option contract
+        # Get the qualified option contract
         exp_str = recommendation.expiration.strftime('%Y%m%d')
-        contract = Option(
-            symbol=recommendation.symbol,
-            lastTradeDateOrContractMonth=exp_str,
-            strike=recommendation.strike,
-            right=right,
-            exchange='SMART'
+        contract = await self._qualified_option(
+            recommendation.symbol, exp_str, recommendation.strike, right
         )
-
-        # Qualify contract
-        self.ib.qualifyContracts(contract)
+        if contract is None:
+            return None
 
         # Create limit order to sell
         # Use mid-price from recommendation, or calculate
@@ -164,6 +260,45 @@ class OrderExecutor:
         # Submit order
         return await self._submit_order(contract, order, recommendation)
 
+    async def _qualified_option(
+        self,
+        symbol: str,
+        exp_str: str,
+        strike: float,
+        right: str
+    ) -> Optional[Contract]:
+        """
+        Get a qualified option contract, qualifying it with IBKR only once.
+
+        Args:
+            symbol: Underlying symbol
+            exp_str: Expiration as YYYYMMDD
+            strike: Strike price
+            right: 'C' for call, 'P' for put
+
+        Returns:
+            Qualified option contract, or None if IBKR cannot qualify it
+        """
+        key = (symbol, exp_str, strike, right)
+        contract = self._contract_cache.get(key)
+        if contract is not None:
+            return contract
+
+        # Qualify contract without blocking the event loop
+        (contract,) = await self.ib.qualifyContractsAsync(Option(
+            symbol=symbol,
+            lastTradeDateOrContractMonth=exp_str,
+            strike=strike,
+            right=right,
+            exchange='SMART'
+        ))
+        if contract is None:
+            logger.error(f"Could not qualify {symbol} {exp_str} {strike}{right}")
+            return None
+
+        self._contract_cache[key] = contract
+        return contract
+
     async def _close_option(
         self,
         recommendation: TradeRecommendation,
@@ -209,51 +344,80 @@ class OrderExecutor:
         """
         Roll an option position (close old, open new).
 
+        Both legs go out as a single BAG combo order (buy the old option,
+        sell the new one), so IBKR fills them together and there is no
+        window where only one leg has traded. The combo's limit price is
+        the net debit: the old option's last mark minus the new premium,
+        negative for a credit roll.
+
         Args:
             recommendation: Trade recommendation
             right: 'C' for call, 'P' for put
 
         Returns:
-            Order record for the new position
+            Order record for the roll
         """
         logger.info(f"Rolling {right} option for {recommendation.symbol}")
 
-        # Step 1: Close existing position
-        if recommendation.existing_position:
-            close_rec = TradeRecommendation(
-                action=Action.CLOSE_PUT if right == 'P' else Action.CLOSE_CALL,
+        if not recommendation.new_strike or not recommendation.new_expiration:
+            logger.error("Missing new strike or expiration for roll")
+            return None
+
+        position = recommendation.existing_position
+        if position is None or position.contract is None:
+            # Nothing to close: just open the new position
+            open_rec = TradeRecommendation(
+                action=Action.SELL_PUT if right == 'P' else Action.SELL_CALL,
                 symbol=recommendation.symbol,
                 quantity=recommendation.quantity,
-                existing_position=recommendation.existing_position,
-                reasoning=f"Closing as part of roll"
+                strategy_type=recommendation.strategy_type,
+                strike=recommendation.new_strike,
+                expiration=recommendation.new_expiration,
+                right=right,
+                premium=recommendation.premium,
+                reasoning=f"Opening new position as part of roll"
             )
+            return await self._sell_option(open_rec, right)
 
-            close_result = await self._close_option(close_rec, right)
-
-            if not close_result:
-                logger.error("Failed to close position during roll, aborting")
-                return None
+        if recommendation.premium is None:
+            logger.error("Missing premium for roll, cannot price the combo order")
+            return None
 
-            # Wait for fill
-            await self._wait_for_fill(close_result, timeout=30)
+        # Old option's mark per share, from the position's market value. IBKR
+        # reports 0 when it has no mark; a combo priced off that would demand
+        # the whole new premium as credit and never fill.
+        close_price = abs(position.market_value) / (abs(position.quantity) * 100)
+        if not close_price > 0:
+            logger.error(
+                f"No mark for {recommendation.symbol} {position.strike} {right} position, "
+                f"cannot price the roll combo order"
+            )
+            return None
 
-        # Step 2: Open new position
-        if not recommendation.new_strike or not recommendation.new_expiration:
-            logger.error("Missing new strike or expiration for roll")
+        exp_str = recommendation.new_expiration.strftime('%Y%m%d')
+        new_contract = await self._qualified_option(
+            recommendation.symbol, exp_str, recommendation.new_strike, right
+        )
+        if new_contract is None:
             return None
 
-        open_rec = TradeRecommendation(
-            action=Action.SELL_PUT if right == 'P' else Action.SELL_CALL,
+        combo = Bag(
             symbol=recommendation.symbol,
-            quantity=recommendation.quantity,
-            strike=recommendation.new_strike,
-            expiration=recommendation.new_expiration,
-            right=right,
-            premium=recommendation.premium,
-            reasoning=f"Opening new position as part of roll"
+            exchange='SMART',
+            currency='USD',
+            comboLegs=[
+                ComboLeg(conId=position.contract.conId, ratio=1, action='BUY', exchange='SMART'),
+                ComboLeg(conId=new_contract.conId, ratio=1, action='SELL', exchange='SMART'),
+            ]
         )
 
-        return await self._sell_option(open_rec, right)
+        order = LimitOrder(
+            action='BUY',
+            totalQuantity=recommendation.quantity,
+            lmtPrice=round(close_price - recommendation.premium, 2)
+        )
+
+        return await self._submit_order(combo, order, recommendation)
 
     async def _submit_order(
         self,
@@ -273,9 +437,14 @@ class OrderExecutor:
             Order record
         """
         # Log order details
+        order_type, has_limit = ORDER_TYPES.get(type(order), (order.orderType, False))
+        limit_price = order.lmtPrice if has_limit else None
+
         logger.info(f"Order: {order.action} {order.totalQuantity}x {contract.symbol}")
-        if hasattr(order, 'lmtPrice'):
-            logger.info(f"  Limit price: ${order.lmtPrice:.2f}")
+        if has_limit:
+            logger.info(f"  Limit price: ${limit_price:.2f}")
+
+        submitted_at = datetime.now()
 
         # Dry-run mode: log but don't submit
         if self.dry_run:
@@ -286,18 +455,18 @@ class OrderExecutor:
                 symbol=contract.symbol,
                 action=order.action,
                 quantity=order.totalQuantity,
-                order_type='LIMIT' if hasattr(order, 'lmtPrice') else 'MARKET',
-                limit_price=getattr(order, 'lmtPrice', None),
+                order_type=order_type,
+                limit_price=limit_price,
                 status=OrderStatus.PENDING,
                 filled_quantity=0,
                 avg_fill_price=None,
-                submitted_at=datetime.now(),
+                submitted_at=submitted_at,
                 filled_at=None,
                 commission=None,
                 recommendation=recommendation
             )
 
-            self.order_history.append(order_record)
+            self._record_order(order_record)
             return order_record
 
         # Submit order to IBKR
@@ -311,19 +480,19 @@ class OrderExecutor:
                 symbol=contract.symbol,
                 action=order.action,
                 quantity=order.totalQuantity,
-                order_type='LIMIT' if hasattr(order, 'lmtPrice') else 'MARKET',
-                limit_price=getattr(order, 'lmtPrice', None),
+                order_type=order_type,
+                limit_price=limit_price,
                 status=OrderStatus.SUBMITTED,
                 filled_quantity=0,
                 avg_fill_price=None,
-                submitted_at=datetime.now(),
+                submitted_at=submitted_at,
                 filled_at=None,
                 commission=None,
                 recommendation=recommendation,
                 trade=trade
             )
 
-            self.order_history.append(order_record)
+            self._record_order(order_record)
 
             # Set up callbacks for status updates
             trade.filledEvent += lambda t: self._on_order_filled(order_record, t)
@@ -335,6 +504,53 @@ class OrderExecutor:
             logger.error(f"Failed to submit order: {e}")
             return None
 
+    def _record_order(self, order_record: OrderRecord):
+        """Append an order to the history and its lookup indexes."""
+        history = self.order_history
+        if len(history) == history.maxlen:
+            evicted = history[0]
+            if self._by_id.get(evicted.order_id) is evicted:
+                del self._by_id[evicted.order_id]
+
+        history.append(order_record)
+        self._by_id.setdefault(order_record.order_id, order_record)
+        self._status_counts[order_record.status] += 1
+        self._total_orders += 1
+
+        if self.journal is not None:
+            self.journal.append({
+                'event': 'submitted',
+                'time': order_record.submitted_at.isoformat(),
+                'order_id': order_record.order_id,
+                'symbol': order_record.symbol,
+                'action': order_record.action,
+                'quantity': order_record.quantity,
+                'order_type': order_record.order_type,
+                'limit_price': order_record.limit_price,
+                'status': order_record.status.value,
+                'strategy_action': order_record.recommendation.action.value,
+                'dry_run': self.dry_run
+            })
+
+    def _set_status(self, order_record: OrderRecord, status: OrderStatus):
+        """Change an order's status, keeping the status counts current."""
+        self._status_counts[order_record.status] -= 1
+        self._status_counts[status] += 1
+        order_record.status = status
+
+        if self.journal is not None:
+            self.journal.append({
+                'event': 'status',
+                'time': datetime.now().isoformat(),
+                'order_id': order_record.order_id,
+                'symbol': order_record.symbol,
+                'status': status.value
+            })
+
+        done = order_record.done
+        if status in FINAL_STATUSES and done is not None and not done.done():
+            done.set_result(status)
+
     async def _wait_for_fill(
         self,
         order_record: OrderRecord,
@@ -352,30 +568,32 @@ class OrderExecutor:
         """
         if self.dry_run:
             logger.info("DRY RUN: Simulating immediate fill")
-            order_record.status = OrderStatus.FILLED
+            self._set_status(order_record, OrderStatus.FILLED)
             order_record.filled_quantity = order_record.quantity
             order_record.filled_at = datetime.now()
             return True
 
-        elapsed = 0
-        while elapsed < timeout:
-            if order_record.status == OrderStatus.FILLED:
-                logger.info(f"Order {order_record.order_id} filled")
-                return True
-
-            if order_record.status in [OrderStatus.CANCELLED, OrderStatus.REJECTED]:
-                logger.warning(f"Order {order_record.order_id} {order_record.status.value}")
+        status = order_record.status
+        if status not in FINAL_STATUSES:
+            # Woken by the fill/cancel callbacks through _set_status
+            if order_record.done is None:
+                order_record.done = asyncio.get_running_loop().create_future()
+            try:
+                status = await asyncio.wait_for(asyncio.shield(order_record.done), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"Order {order_record.order_id} timeout after {timeout}s")
                 return False
 
-            await asyncio.sleep(1)
-            elapsed += 1
+        if status == OrderStatus.FILLED:
+            logger.info(f"Order {order_record.order_id} filled")
+            return True
 
-        logger.warning(f"Order {order_record.order_id} timeout after {timeout}s")
+        logger.warning(f"Order {order_record.order_id} {status.value}")
         return False
 
     def _on_order_filled(self, order_record: OrderRecord, trade: Trade):
         """Callback when order is filled."""
-        order_record.status = OrderStatus.FILLED
+        self._set_status(order_record, OrderStatus.FILLED)
         order_record.filled_quantity = trade.orderStatus.filled
         order_record.avg_fill_price = trade.orderStatus.avgFillPrice
         order_record.filled_at = datetime.now()
@@ -385,7 +603,7 @@ class OrderExecutor:
 
     def _on_order_cancelled(self, order_record: OrderRecord, trade: Trade):
         """Callback when order is cancelled."""
-        order_record.status = OrderStatus.CANCELLED
+        self._set_status(order_record, OrderStatus.CANCELLED)
         logger.warning(f"Order {order_record.order_id} CANCELLED")
 
     async def cancel_order(self, order_record: OrderRecord) -> bool:
@@ -400,7 +618,7 @@ class OrderExecutor:
         """
         if self.dry_run:
             logger.info(f"DRY RUN: Cancelling order {order_record.order_id}")
-            order_record.status = OrderStatus.CANCELLED
+            self._set_status(order_record, OrderStatus.CANCELLED)
             return True
 
         if not order_record.trade:
@@ -426,10 +644,7 @@ class OrderExecutor:
         Returns:
             Order record if found
         """
-        for record in self.order_history:
-            if record.order_id == order_id:
-                return record
-        return None
+        return self._by_id.get(order_id)
 
     def get_recent_orders(self, count: int = 10) -> List[OrderRecord]:
         """
@@ -439,9 +654,9 @@ class OrderExecutor:
             count: Number of recent orders to return
 
         Returns:
-            List of order records
+            List of order records, oldest first
         """
-        return self.order_history[-count:] if self.order_history else []
+        return list(itertools.islice(reversed(self.order_history), count))[::-1]
 
     def get_order_statistics(self) -> Dict[str, int]:
         """
@@ -450,18 +665,14 @@ class OrderExecutor:
         Returns:
             Dictionary of statistics
         """
-        total = len(self.order_history)
-        filled = len([o for o in self.order_history if o.status == OrderStatus.FILLED])
-        cancelled = len([o for o in self.order_history if o.status == OrderStatus.CANCELLED])
-        rejected = len([o for o in self.order_history if o.status == OrderStatus.REJECTED])
-        pending = len([o for o in self.order_history if o.status in [OrderStatus.PENDING, OrderStatus.SUBMITTED]])
+        counts = self._status_counts
 
         return {
-            'total': total,
-            'filled': filled,
-            'cancelled': cancelled,
-            'rejected': rejected,
-            'pending': pending
+            'total': self._total_orders,
+            'filled': counts[OrderStatus.FILLED],
+            'cancelled': counts[OrderStatus.CANCELLED],
+            'rejected': counts[OrderStatus.REJECTED],
+            'pending': counts[OrderStatus.PENDING] + counts[OrderStatus.SUBMITTED]
         }
 
 
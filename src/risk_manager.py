@@ -7,38 +7,69 @@ Monitors overall portfolio health.
 """
 
 import logging
-from typing import List, Optional, Dict, Tuple
-from dataclasses import dataclass
-from enum import Enum
+from typing import Callable, List, NamedTuple, Optional, Dict, Sequence, Tuple
+from dataclasses import dataclass, replace
+from enum import IntFlag
 
-from src.data_fetcher import Position, AccountInfo
+import numpy as np
+
+from src.data_fetcher import Position, PositionBatch, AccountInfo
 from src.strategy_base import TradeRecommendation, Action
 from src.config_loader import RiskConfig, SymbolConfig
 
 logger = logging.getLogger(__name__)
 
+# Actions that open a new short option position
+NEW_POSITION_ACTIONS = frozenset({Action.SELL_PUT, Action.SELL_CALL})
 
-class RiskViolation(Enum):
-    """Types of risk violations."""
-    MARGIN_EXCEEDED = "margin_exceeded"
-    CONCENTRATION_EXCEEDED = "concentration_exceeded"
-    POSITION_LIMIT_EXCEEDED = "position_limit_exceeded"
-    VIX_TOO_HIGH = "vix_too_high"
-    BUYING_POWER_INSUFFICIENT = "buying_power_insufficient"
-    PORTFOLIO_OVEREXPOSED = "portfolio_overexposed"
-    STOP_LOSS_TRIGGERED = "stop_loss_triggered"
 
+class RiskViolation(IntFlag):
+    """Types of risk violations, combined into one bitmask per trade."""
+    MARGIN_EXCEEDED = 1 << 0
+    CONCENTRATION_EXCEEDED = 1 << 1
+    POSITION_LIMIT_EXCEEDED = 1 << 2
+    VIX_TOO_HIGH = 1 << 3
+    BUYING_POWER_INSUFFICIENT = 1 << 4
+    PORTFOLIO_OVEREXPOSED = 1 << 5
+    STOP_LOSS_TRIGGERED = 1 << 6
 
-@dataclass
+
+class RiskReason(NamedTuple):
+    """
+    Explanation of a risk decision, formatted only when it is read.
+
+    str() renders template.format(*args), so logging a reason with
+    logger.warning("%s", reason) costs nothing below the log level.
+    """
+    template: str
+    args: tuple = ()
+
+    def __str__(self) -> str:
+        return self.template.format(*self.args)
+
+
+@dataclass(frozen=True, slots=True)
 class RiskCheckResult:
     """Result of a risk check."""
     approved: bool
-    violations: List[RiskViolation]
-    reasons: List[str]
+    violations: RiskViolation  # Bitmask, 0 when approved
+    reasons: Sequence[RiskReason]
     adjusted_quantity: Optional[int] = None  # Adjusted quantity if position size should be reduced
 
+    def violation_list(self) -> List[RiskViolation]:
+        """Individual violations set in the bitmask, in definition order."""
+        return [v for v in RiskViolation if v & self.violations]
 
-@dataclass
+    def reason_messages(self) -> List[str]:
+        """Reasons formatted as strings."""
+        return [str(reason) for reason in self.reasons]
+
+
+# Shared result for a check that finds nothing; never mutate its reasons
+_APPROVED = RiskCheckResult(approved=True, violations=RiskViolation(0), reasons=())
+
+
+@dataclass(frozen=True, slots=True)
 class PortfolioRisk:
     """Portfolio-level risk metrics."""
     total_positions: int
@@ -50,6 +81,47 @@ class PortfolioRisk:
     total_theta: float
 
 
+@dataclass(slots=True)
+class TradeEstimate:
+    """Cost estimates for one proposed trade, computed once per validation."""
+    margin: float  # Additional margin, also the buying power required
+    position_value: float  # Notional value added to the symbol's exposure
+
+
+@dataclass
+class PositionSummary:
+    """Position counts and exposure shared by every check in a validation pass."""
+    open_positions: int  # Positions with non-zero quantity
+    open_by_symbol: Dict[str, int]
+    exposure_by_symbol: Dict[str, float]  # Sum of |market value|, all positions
+    size: int = 0  # Number of positions summarized
+    max_exposure: float = 0.0  # Largest entry in exposure_by_symbol
+
+    @classmethod
+    def from_positions(cls, positions: List[Position]) -> 'PositionSummary':
+        """Summarize positions from their column arrays."""
+        return cls.from_batch(PositionBatch.from_positions(positions))
+
+    @classmethod
+    def from_batch(cls, batch: PositionBatch) -> 'PositionSummary':
+        """Summarize a position batch with per-symbol bincounts."""
+        n_symbols = len(batch.symbols)
+        code = batch.symbol_code
+        is_open = batch.quantity != 0
+
+        exposure = np.bincount(code, weights=np.abs(batch.market_value), minlength=n_symbols)
+        open_count = np.bincount(code[is_open], minlength=n_symbols)
+        symbols = batch.symbols.tolist()
+
+        return cls(
+            open_positions=int(is_open.sum()),
+            open_by_symbol={s: c for s, c in zip(symbols, open_count.tolist()) if c},
+            exposure_by_symbol=dict(zip(symbols, exposure.tolist())),
+            size=len(batch),
+            max_exposure=float(exposure.max()) if n_symbols else 0.0
+        )
+
+
 class RiskManager:
     """
     Manages risk controls and validates trades.
@@ -73,6 +145,34 @@ class RiskManager:
         self.config = risk_config
         self.symbol_configs = symbol_configs
 
+        # Summary of the last positions list validated against, with the list
+        # it was built from; see _get_summary()
+        self._summary: Optional[PositionSummary] = None
+        self._summary_positions: Optional[List[Position]] = None
+
+        # Checks that can fail under this configuration, picked once since
+        # the config is frozen; see _build_checks()
+        self._vix_enabled = (risk_config.max_vix_for_new_positions is not None or
+                             risk_config.reduce_size_when_vix_above is not None)
+        self._checks = self._build_checks()
+
+    def _build_checks(self) -> Tuple[Callable[..., RiskCheckResult], ...]:
+        """
+        Select the trade checks to run, in order, for this configuration.
+
+        Position limits are skipped when there is no total limit and no
+        per-symbol configuration to take a limit from.
+
+        Returns:
+            Check methods taking (recommendation, estimate, summary, account_info)
+        """
+        checks = [self._check_margin_usage]
+        if self.config.max_total_positions is not None or self.symbol_configs:
+            checks.append(self._check_position_limits)
+        checks.append(self._check_concentration)
+        checks.append(self._check_buying_power)
+        return tuple(checks)
+
     def validate_trade(
         self,
         recommendation: TradeRecommendation,
@@ -92,52 +192,171 @@ class RiskManager:
         Returns:
             Risk check result indicating approval status and any violations
         """
-        violations = []
+        return self._validate(
+            recommendation,
+            self._get_summary(positions),
+            account_info,
+            current_vix
+        )
+
+    def validate_trades_batch(
+        self,
+        recommendations: List[TradeRecommendation],
+        positions: List[Position],
+        account_info: AccountInfo,
+        current_vix: Optional[float] = None
+    ) -> List[RiskCheckResult]:
+        """
+        Validate several proposed trades against the same portfolio, in order.
+
+        Position counts and exposure are summarized once. Each approved
+        trade is then counted against the limits of the ones after it: its
+        margin is added to the margin used and taken from buying power, its
+        notional is added to the symbol's exposure, and an opening trade
+        adds an open position. A set of trades that each pass alone but
+        together break a limit is cut off at the first one over it.
+
+        Args:
+            recommendations: Proposed trades
+            positions: Current portfolio positions
+            account_info: Account balance and buying power
+            current_vix: Current VIX value (optional)
+
+        Returns:
+            Risk check results, in the order of recommendations
+        """
+        summary = self._get_summary(positions)
+        results = []
+        for rec in recommendations:
+            result = self._validate(rec, summary, account_info, current_vix)
+            results.append(result)
+            if result.approved:
+                summary, account_info = self._commit_trade(rec, result, summary, account_info)
+        return results
+
+    def _commit_trade(
+        self,
+        recommendation: TradeRecommendation,
+        result: RiskCheckResult,
+        summary: PositionSummary,
+        account_info: AccountInfo
+    ) -> Tuple[PositionSummary, AccountInfo]:
+        """
+        Apply an approved trade to copies of the portfolio state.
+
+        Args:
+            recommendation: Approved trade
+            result: Its risk check result (for a resized quantity)
+            summary: Position summary before the trade
+            account_info: Account information before the trade
+
+        Returns:
+            Tuple of (summary, account info) with the trade included
+        """
+        # Estimates scale with quantity, so a resized trade commits less
+        scale = 1.0
+        if result.adjusted_quantity is not None and recommendation.quantity:
+            scale = result.adjusted_quantity / recommendation.quantity
+        margin = self._estimate_margin_requirement(recommendation) * scale
+        position_value = self._estimate_position_value(recommendation) * scale
+
+        symbol = recommendation.symbol
+        exposure_by_symbol = dict(summary.exposure_by_symbol)
+        exposure_by_symbol[symbol] = exposure_by_symbol.get(symbol, 0.0) + position_value
+
+        open_positions = summary.open_positions
+        open_by_symbol = summary.open_by_symbol
+        if recommendation.action in NEW_POSITION_ACTIONS:
+            open_positions += 1
+            open_by_symbol = dict(open_by_symbol)
+            open_by_symbol[symbol] = open_by_symbol.get(symbol, 0) + 1
+
+        summary = PositionSummary(
+            open_positions=open_positions,
+            open_by_symbol=open_by_symbol,
+            exposure_by_symbol=exposure_by_symbol,
+            size=summary.size,
+            max_exposure=max(summary.max_exposure, exposure_by_symbol[symbol])
+        )
+        account_info = replace(
+            account_info,
+            margin_used=account_info.margin_used + margin,
+            buying_power=account_info.buying_power - margin
+        )
+        return summary, account_info
+
+    def _get_summary(self, positions: List[Position]) -> PositionSummary:
+        """
+        Return the summary of a positions list, building it on first use.
+
+        The summary is reused while the same list is passed in, so a cycle
+        that validates its trades one at a time still scans the positions
+        only once.
+
+        Args:
+            positions: Current portfolio positions
+
+        Returns:
+            Position counts and exposure by symbol
+        """
+        summary = self._summary
+        if (summary is None or self._summary_positions is not positions or
+                summary.size != len(positions)):
+            summary = PositionSummary.from_positions(positions)
+            self._summary = summary
+            self._summary_positions = positions
+        return summary
+
+    def _validate(
+        self,
+        recommendation: TradeRecommendation,
+        summary: PositionSummary,
+        account_info: AccountInfo,
+        current_vix: Optional[float]
+    ) -> RiskCheckResult:
+        """
+        Run the risk checks for one trade against a position summary.
+
+        The VIX check runs first since it may only resize the trade. With
+        fail_fast set, the remaining checks stop at the first violation.
+        """
+        violations = RiskViolation(0)
         reasons = []
         adjusted_quantity = None
 
         # Check VIX limits
-        if current_vix is not None:
+        if current_vix is not None and self._vix_enabled:
             vix_check = self._check_vix_limits(current_vix, recommendation)
             if not vix_check.approved:
-                violations.extend(vix_check.violations)
+                violations |= vix_check.violations
                 reasons.extend(vix_check.reasons)
                 if vix_check.adjusted_quantity is not None:
                     adjusted_quantity = vix_check.adjusted_quantity
 
-        # Check margin usage
-        margin_check = self._check_margin_usage(recommendation, positions, account_info)
-        if not margin_check.approved:
-            violations.extend(margin_check.violations)
-            reasons.extend(margin_check.reasons)
-
-        # Check position limits
-        position_check = self._check_position_limits(recommendation, positions)
-        if not position_check.approved:
-            violations.extend(position_check.violations)
-            reasons.extend(position_check.reasons)
-
-        # Check concentration limits
-        concentration_check = self._check_concentration(recommendation, positions, account_info)
-        if not concentration_check.approved:
-            violations.extend(concentration_check.violations)
-            reasons.extend(concentration_check.reasons)
-
-        # Check buying power
-        bp_check = self._check_buying_power(recommendation, account_info)
-        if not bp_check.approved:
-            violations.extend(bp_check.violations)
-            reasons.extend(bp_check.reasons)
+        # Margin usage, position limits, concentration, buying power
+        fail_fast = self.config.fail_fast
+        if not (fail_fast and violations):
+            estimate = TradeEstimate(
+                margin=self._estimate_margin_requirement(recommendation),
+                position_value=self._estimate_position_value(recommendation)
+            )
+            for check in self._checks:
+                result = check(recommendation, estimate, summary, account_info)
+                if not result.approved:
+                    violations |= result.violations
+                    reasons.extend(result.reasons)
+                    if fail_fast:
+                        break
 
         # Overall approval
-        approved = len(violations) == 0
+        approved = not violations
 
         if approved:
             logger.info(f"Trade approved: {recommendation.action.value} {recommendation.quantity}x {recommendation.symbol}")
         else:
             logger.warning(f"Trade REJECTED: {recommendation.action.value} {recommendation.quantity}x {recommendation.symbol}")
             for reason in reasons:
-                logger.warning(f"  - {reason}")
+                logger.warning("  - %s", reason)
 
         return RiskCheckResult(
             approved=approved,
@@ -161,29 +380,37 @@ class RiskManager:
         Returns:
             Risk check result
         """
-        violations = []
+        violations = RiskViolation(0)
         reasons = []
         adjusted_quantity = None
 
         # Block new positions if VIX too high
         if self.config.max_vix_for_new_positions is not None:
             if vix > self.config.max_vix_for_new_positions:
-                if recommendation.action in [Action.SELL_PUT, Action.SELL_CALL]:
-                    violations.append(RiskViolation.VIX_TOO_HIGH)
-                    reasons.append(f"VIX {vix:.1f} exceeds maximum {self.config.max_vix_for_new_positions} for new positions")
+                if recommendation.action in NEW_POSITION_ACTIONS:
+                    violations |= RiskViolation.VIX_TOO_HIGH
+                    reasons.append(RiskReason(
+                        "VIX {:.1f} exceeds maximum {} for new positions",
+                        (vix, self.config.max_vix_for_new_positions)
+                    ))
 
         # Reduce position size if VIX elevated
         if self.config.reduce_size_when_vix_above is not None:
             if vix > self.config.reduce_size_when_vix_above:
-                if recommendation.action in [Action.SELL_PUT, Action.SELL_CALL]:
+                if recommendation.action in NEW_POSITION_ACTIONS:
                     reduced_qty = int(recommendation.quantity * self.config.vix_size_reduction_factor)
                     if reduced_qty < recommendation.quantity:
                         adjusted_quantity = max(1, reduced_qty)
-                        reasons.append(f"VIX {vix:.1f} above {self.config.reduce_size_when_vix_above}: "
-                                     f"Reducing position size from {recommendation.quantity} to {adjusted_quantity}")
-
+                        reasons.append(RiskReason(
+                            "VIX {:.1f} above {}: Reducing position size from {} to {}",
+                            (vix, self.config.reduce_size_when_vix_above,
+                             recommendation.quantity, adjusted_quantity)
+                        ))
+
+        if not reasons:
+            return _APPROVED
         return RiskCheckResult(
-            approved=len(violations) == 0,
+            approved=not violations,
             violations=violations,
             reasons=reasons,
             adjusted_quantity=adjusted_quantity
@@ -192,7 +419,8 @@ class RiskManager:
     def _check_margin_usage(
         self,
         recommendation: TradeRecommendation,
-        positions: List[Position],
+        estimate: TradeEstimate,
+        summary: PositionSummary,
         account_info: AccountInfo
     ) -> RiskCheckResult:
         """
@@ -200,13 +428,14 @@ class RiskManager:
 
         Args:
             recommendation: Proposed trade
-            positions: Current positions
+            estimate: Cost estimates for the trade
+            summary: Summary of current positions (unused)
             account_info: Account information
 
         Returns:
             Risk check result
         """
-        violations = []
+        violations = RiskViolation(0)
         reasons = []
 
         # Calculate current margin usage
@@ -214,88 +443,90 @@ class RiskManager:
         total_equity = account_info.net_liquidation
 
         if total_equity <= 0:
-            violations.append(RiskViolation.MARGIN_EXCEEDED)
-            reasons.append("Total equity is zero or negative")
+            violations |= RiskViolation.MARGIN_EXCEEDED
+            reasons.append(RiskReason("Total equity is zero or negative"))
             return RiskCheckResult(approved=False, violations=violations, reasons=reasons)
 
-        current_usage_pct = current_margin / total_equity
-
         # Estimate additional margin for proposed trade
-        additional_margin = self._estimate_margin_requirement(recommendation)
+        additional_margin = estimate.margin
 
         # Calculate new margin usage
         new_margin = current_margin + additional_margin
         new_usage_pct = new_margin / total_equity
 
-        logger.debug(f"Margin usage: current={current_usage_pct:.1%}, "
-                    f"after trade={new_usage_pct:.1%}, "
-                    f"limit={self.config.max_portfolio_margin_usage:.1%}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Margin usage: current={current_margin / total_equity:.1%}, "
+                        f"after trade={new_usage_pct:.1%}, "
+                        f"limit={self.config.max_portfolio_margin_usage:.1%}")
 
         # Check against limit
         if new_usage_pct > self.config.max_portfolio_margin_usage:
-            violations.append(RiskViolation.MARGIN_EXCEEDED)
-            reasons.append(f"Trade would increase margin usage to {new_usage_pct:.1%} "
-                         f"(limit: {self.config.max_portfolio_margin_usage:.1%})")
+            violations |= RiskViolation.MARGIN_EXCEEDED
+            reasons.append(RiskReason(
+                "Trade would increase margin usage to {:.1%} (limit: {:.1%})",
+                (new_usage_pct, self.config.max_portfolio_margin_usage)
+            ))
 
-        return RiskCheckResult(
-            approved=len(violations) == 0,
-            violations=violations,
-            reasons=reasons
-        )
+        if not violations:
+            return _APPROVED
+        return RiskCheckResult(approved=False, violations=violations, reasons=reasons)
 
     def _check_position_limits(
         self,
         recommendation: TradeRecommendation,
-        positions: List[Position]
+        estimate: TradeEstimate,
+        summary: PositionSummary,
+        account_info: AccountInfo
     ) -> RiskCheckResult:
         """
         Check if trade would exceed position count limits.
 
         Args:
             recommendation: Proposed trade
-            positions: Current positions
+            estimate: Cost estimates for the trade (unused)
+            summary: Summary of current positions
+            account_info: Account information (unused)
 
         Returns:
             Risk check result
         """
-        violations = []
+        violations = RiskViolation(0)
         reasons = []
 
+        # Count this as new position if opening
+        is_new_position = recommendation.action in NEW_POSITION_ACTIONS
+
         # Check total position limit
         if self.config.max_total_positions is not None:
-            current_positions = len([p for p in positions if p.quantity != 0])
-
-            # Count this as new position if opening
-            is_new_position = recommendation.action in [Action.SELL_PUT, Action.SELL_CALL]
+            current_positions = summary.open_positions
 
             if is_new_position and current_positions >= self.config.max_total_positions:
-                violations.append(RiskViolation.POSITION_LIMIT_EXCEEDED)
-                reasons.append(f"Already at maximum total positions ({self.config.max_total_positions})")
+                violations |= RiskViolation.POSITION_LIMIT_EXCEEDED
+                reasons.append(RiskReason(
+                    "Already at maximum total positions ({})", (self.config.max_total_positions,)
+                ))
 
         # Check per-symbol limits
         symbol_config = self.symbol_configs.get(recommendation.symbol)
         if symbol_config:
-            symbol_positions = [p for p in positions
-                              if p.symbol == recommendation.symbol and p.quantity != 0]
-            current_count = len(symbol_positions)
-
-            is_new_position = recommendation.action in [Action.SELL_PUT, Action.SELL_CALL]
+            current_count = summary.open_by_symbol.get(recommendation.symbol, 0)
 
             if is_new_position and current_count >= symbol_config.max_positions:
-                violations.append(RiskViolation.POSITION_LIMIT_EXCEEDED)
-                reasons.append(f"Already at maximum positions for {recommendation.symbol} "
-                             f"({symbol_config.max_positions})")
+                violations |= RiskViolation.POSITION_LIMIT_EXCEEDED
+                reasons.append(RiskReason(
+                    "Already at maximum positions for {} ({})",
+                    (recommendation.symbol, symbol_config.max_positions)
+                ))
 
-        return RiskCheckResult(
-            approved=len(violations) == 0,
-            violations=violations,
-            reasons=reasons
-        )
+        if not violations:
+            return _APPROVED
+        return RiskCheckResult(approved=False, violations=violations, reasons=reasons)
 
     def _check_concentration(
         self,
         recommendation: TradeRecommendation,
-        positions: List[Position],
+        estimate: TradeEstimate,
+        summary: PositionSummary,
         account_info: AccountInfo
     ) -> RiskCheckResult:
         """
@@ -303,61 +534,66 @@ class RiskManager:
 
         Args:
             recommendation: Proposed trade
-            positions: Current positions
+            estimate: Cost estimates for the trade
+            summary: Summary of current positions
             account_info: Account information
 
         Returns:
             Risk check result
         """
-        violations = []
+        violations = RiskViolation(0)
         reasons = []
 
         total_equity = account_info.net_liquidation
 
         if total_equity <= 0:
-            violations.append(RiskViolation.CONCENTRATION_EXCEEDED)
-            reasons.append("Cannot calculate concentration: total equity is zero")
+            violations |= RiskViolation.CONCENTRATION_EXCEEDED
+            reasons.append(RiskReason("Cannot calculate concentration: total equity is zero"))
             return RiskCheckResult(approved=False, violations=violations, reasons=reasons)
 
         # Calculate current exposure to this symbol
-        symbol_positions = [p for p in positions if p.symbol == recommendation.symbol]
-        current_exposure = sum(abs(p.market_value) for p in symbol_positions)
+        current_exposure = summary.exposure_by_symbol.get(recommendation.symbol, 0.0)
 
         # Estimate additional exposure from this trade
-        additional_exposure = self._estimate_position_value(recommendation)
+        additional_exposure = estimate.position_value
 
         new_exposure = current_exposure + additional_exposure
         concentration_pct = new_exposure / total_equity
 
-        logger.debug(f"{recommendation.symbol} concentration: "
-                    f"current={current_exposure/total_equity:.1%}, "
-                    f"after trade={concentration_pct:.1%}, "
-                    f"limit={self.config.max_concentration_per_symbol:.1%}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{recommendation.symbol} concentration: "
+                        f"current={current_exposure/total_equity:.1%}, "
+                        f"after trade={concentration_pct:.1%}, "
+                        f"limit={self.config.max_concentration_per_symbol:.1%}")
 
         # Check against limit
         if concentration_pct > self.config.max_concentration_per_symbol:
-            violations.append(RiskViolation.CONCENTRATION_EXCEEDED)
-            reasons.append(f"Trade would increase {recommendation.symbol} concentration to {concentration_pct:.1%} "
-                         f"(limit: {self.config.max_concentration_per_symbol:.1%})")
+            violations |= RiskViolation.CONCENTRATION_EXCEEDED
+            reasons.append(RiskReason(
+                "Trade would increase {} concentration to {:.1%} (limit: {:.1%})",
+                (recommendation.symbol, concentration_pct, self.config.max_concentration_per_symbol)
+            ))
 
         # Check symbol-specific limit
         symbol_config = self.symbol_configs.get(recommendation.symbol)
         if symbol_config and symbol_config.max_position_size_percent:
             limit_pct = symbol_config.max_position_size_percent / 100.0
             if concentration_pct > limit_pct:
-                violations.append(RiskViolation.CONCENTRATION_EXCEEDED)
-                reasons.append(f"Trade would increase {recommendation.symbol} concentration to {concentration_pct:.1%} "
-                             f"(symbol limit: {limit_pct:.1%})")
+                violations |= RiskViolation.CONCENTRATION_EXCEEDED
+                reasons.append(RiskReason(
+                    "Trade would increase {} concentration to {:.1%} (symbol limit: {:.1%})",
+                    (recommendation.symbol, concentration_pct, limit_pct)
+                ))
 
-        return RiskCheckResult(
-            approved=len(violations) == 0,
-            violations=violations,
-            reasons=reasons
-        )
+        if not violations:
+            return _APPROVED
+        return RiskCheckResult(approved=False, violations=violations, reasons=reasons)
 
     def _check_buying_power(
         self,
         recommendation: TradeRecommendation,
+        estimate: TradeEstimate,
+        summary: PositionSummary,
         account_info: AccountInfo
     ) -> RiskCheckResult:
         """
@@ -365,32 +601,35 @@ class RiskManager:
 
         Args:
             recommendation: Proposed trade
+            estimate: Cost estimates for the trade
+            summary: Summary of current positions (unused)
             account_info: Account information
 
         Returns:
             Risk check result
         """
-        violations = []
+        violations = RiskViolation(0)
         reasons = []
 
         # Calculate required buying power
-        required_bp = self._estimate_buying_power_requirement(recommendation)
+        required_bp = estimate.margin
 
         available_bp = account_info.buying_power
 
-        logger.debug(f"Buying power: required=${required_bp:,.2f}, "
-                    f"available=${available_bp:,.2f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Buying power: required=${required_bp:,.2f}, "
+                        f"available=${available_bp:,.2f}")
 
         if required_bp > available_bp:
-            violations.append(RiskViolation.BUYING_POWER_INSUFFICIENT)
-            reasons.append(f"Insufficient buying power: need ${required_bp:,.2f}, "
-                         f"have ${available_bp:,.2f}")
+            violations |= RiskViolation.BUYING_POWER_INSUFFICIENT
+            reasons.append(RiskReason(
+                "Insufficient buying power: need ${:,.2f}, have ${:,.2f}",
+                (required_bp, available_bp)
+            ))
 
-        return RiskCheckResult(
-            approved=len(violations) == 0,
-            violations=violations,
-            reasons=reasons
-        )
+        if not violations:
+            return _APPROVED
+        return RiskCheckResult(approved=False, violations=violations, reasons=reasons)
 
     def check_stop_loss(
         self,
@@ -407,24 +646,47 @@ class RiskManager:
         Returns:
             True if stop loss triggered
         """
+        return bool(self.check_stop_losses([position], np.array([current_market_value]))[0])
+
+    def check_stop_losses(
+        self,
+        positions: List[Position],
+        current_market_values: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Check every position for a triggered stop loss at once.
+
+        Args:
+            positions: Current positions
+            current_market_values: Current market value per position
+                (defaults to each position's market_value)
+
+        Returns:
+            Boolean mask, True where the stop loss is triggered
+        """
         if not self.config.enable_stop_loss:
-            return False
+            return np.zeros(len(positions), dtype=bool)
 
-        # For short options, we received a credit and now it has a cost
-        # Loss occurs when current value > entry credit
-        if position.position_type == 'option' and position.quantity < 0:
-            entry_credit = abs(position.avg_cost)
-            current_cost = abs(current_market_value)
+        batch = PositionBatch.from_positions(positions)
+        if current_market_values is None:
+            current_market_values = batch.market_value
 
-            loss = current_cost - entry_credit
-            loss_pct = (loss / entry_credit * 100) if entry_credit > 0 else 0
+        # For short options, we received a credit and now it has a cost
+        # Loss occurs when current value > entry credit; the percentage
+        # test is done multiplied through by the credit
+        entry_credit = np.abs(batch.avg_cost)
+        loss = np.abs(current_market_values) - entry_credit
+        triggered = (
+            batch.is_option & (batch.quantity < 0) & (entry_credit > 0) &
+            (loss * 100 > entry_credit * self.config.stop_loss_percent)
+        )
 
-            if loss_pct > self.config.stop_loss_percent:
-                logger.warning(f"Stop loss triggered for {position.symbol}: "
-                             f"loss={loss_pct:.1f}% exceeds {self.config.stop_loss_percent}%")
-                return True
+        for i in np.flatnonzero(triggered).tolist():
+            logger.warning(f"Stop loss triggered for {positions[i].symbol}: "
+                           f"loss={loss[i] / entry_credit[i] * 100:.1f}% exceeds "
+                           f"{self.config.stop_loss_percent}%")
 
-        return False
+        return triggered
 
     def calculate_portfolio_risk(
         self,
@@ -441,21 +703,27 @@ class RiskManager:
         Returns:
             Portfolio risk metrics
         """
-        total_positions = len([p for p in positions if p.quantity != 0])
+        # Same per-symbol aggregation the trade checks use
+        summary = self._get_summary(positions)
+        net_liquidation = account_info.net_liquidation
+
+        # Every ratio below is a fraction of net liquidation: divide once
+        # and multiply by the reciprocal
+        inv_net_liquidation = 1.0 / net_liquidation if net_liquidation > 0 else 0.0
+
+        total_positions = summary.open_positions
 
         total_margin = account_info.margin_used
-        margin_usage_pct = (total_margin / account_info.net_liquidation
-                           if account_info.net_liquidation > 0 else 0)
+        margin_usage_pct = total_margin * inv_net_liquidation
 
         # Calculate concentration by symbol
         concentration_by_symbol = {}
-        for symbol in set(p.symbol for p in positions):
-            symbol_positions = [p for p in positions if p.symbol == symbol]
-            symbol_exposure = sum(abs(p.market_value) for p in symbol_positions)
-            if account_info.net_liquidation > 0:
-                concentration_by_symbol[symbol] = symbol_exposure / account_info.net_liquidation
-
-        max_concentration = max(concentration_by_symbol.values()) if concentration_by_symbol else 0.0
+        if inv_net_liquidation:
+            concentration_by_symbol = {
+                symbol: exposure * inv_net_liquidation
+                for symbol, exposure in summary.exposure_by_symbol.items()
+            }
+        max_concentration = summary.max_exposure * inv_net_liquidation
 
         # Aggregate Greeks (would need Greeks from positions - simplified here)
         total_delta = 0.0
@@ -479,11 +747,11 @@ class RiskManager:
 
     def _estimate_margin_requirement(self, recommendation: TradeRecommendation) -> float:
         """Estimate margin requirement for a trade."""
-        if recommendation.action in [Action.SELL_PUT]:
+        if recommendation.action is Action.SELL_PUT:
             # Cash-secured put: 100% of strike value
             if recommendation.strike:
                 return recommendation.strike * 100 * recommendation.quantity
-        elif recommendation.action in [Action.SELL_CALL]:
+        elif recommendation.action is Action.SELL_CALL:
             # Covered call: no additional margin (covered by stock)
             return 0.0
 
@@ -495,10 +763,6 @@ class RiskManager:
             return recommendation.strike * 100 * recommendation.quantity
         return 0.0
 
-    def _estimate_buying_power_requirement(self, recommendation: TradeRecommendation) -> float:
-        """Estimate buying power requirement for a trade."""
-        return self._estimate_margin_requirement(recommendation)
-
 
 def main():
     """Example usage of RiskManager."""
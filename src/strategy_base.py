@@ -6,11 +6,14 @@ Enables pluggable strategy architecture and multi-strategy portfolios.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from dataclasses import dataclass
+from datetime import date, datetime
 from enum import Enum
 
-from src.data_fetcher import OptionChainData, Position, AccountInfo
+import numpy as np
+
+from src.data_fetcher import OptionChainData, OptionChainBatch, OptionRight, Position, AccountInfo
 from src.config_loader import SymbolConfig
 
 
@@ -43,12 +46,13 @@ class Action(Enum):
     DO_NOTHING = "do_nothing"
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRecommendation:
     """
     Recommended trade action from a strategy.
 
-    Universal structure that works for all strategy types.
+    Universal structure that works for all strategy types. Not frozen:
+    the quantity is reduced in place when risk checks resize a trade.
     """
     action: Action
     symbol: str
@@ -80,6 +84,28 @@ class TradeRecommendation:
     max_profit: Optional[float] = None
 
 
+def _nearest_delta_index(delta: np.ndarray, mask: np.ndarray, target: float) -> int:
+    """
+    Return the index of the masked entry whose delta is closest to target.
+
+    Runs as one pass over the full arrays (excluded rows are pushed to
+    +inf) rather than gathering the candidates first. Ties resolve to the
+    lowest index, matching a left-to-right min() over the chain.
+
+    Args:
+        delta: Option deltas
+        mask: Rows eligible for selection
+        target: Target delta
+
+    Returns:
+        Index into the arrays, or -1 if no row is eligible
+    """
+    if not mask.any():
+        return -1
+    distance = np.where(mask, np.abs(delta - target), np.inf)
+    return int(np.argmin(distance))
+
+
 class Strategy(ABC):
     """
     Abstract base class for all trading strategies.
@@ -100,6 +126,11 @@ class Strategy(ABC):
         self.config = config
         self.symbol = config.symbol
 
+        # Columnar view of the chain currently being analyzed, and the
+        # _find_option_by_delta results computed against it
+        self._chain_batch: Optional[OptionChainBatch] = None
+        self._delta_picks: Dict[tuple, Optional[OptionChainData]] = {}
+
     @abstractmethod
     def analyze(
         self,
@@ -153,6 +184,28 @@ class Strategy(ABC):
         # Override in specific strategies for more sophisticated logic
         return True
 
+    @classmethod
+    def compatible_mask(
+        cls,
+        stock_prices: np.ndarray,
+        volatilities: np.ndarray,
+        trends: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized is_compatible_with over many symbols' market conditions.
+
+        Override alongside is_compatible_with so both apply the same rules.
+
+        Args:
+            stock_prices: (n,) current stock prices
+            volatilities: (n,) implied volatilities, NaN where unknown
+            trends: (n,) trend strings, '' where unknown
+
+        Returns:
+            (n,) True where the strategy suits the conditions
+        """
+        return np.ones(len(stock_prices), dtype=bool)
+
     def _find_option_by_delta(
         self,
         options_chain: List[OptionChainData],
@@ -160,7 +213,8 @@ class Strategy(ABC):
         target_delta: float,
         stock_price: float,
         min_dte: int,
-        max_dte: int
+        max_dte: int,
+        today: Optional[date] = None
     ) -> Optional[OptionChainData]:
         """
         Find option closest to target delta within DTE range.
@@ -174,38 +228,28 @@ class Strategy(ABC):
             stock_price: Current stock price
             min_dte: Minimum days to expiration
             max_dte: Maximum days to expiration
+            today: Reference date for DTE (defaults to the current date)
 
         Returns:
             Best matching option, or None if not found
         """
-        from datetime import datetime
-
-        # Filter by type and DTE
-        today = datetime.now().date()
-        candidates = []
-
-        for option in options_chain:
-            # Filter by right
-            if option.right != right:
-                continue
+        batch = self._get_chain_batch(options_chain)
+        today_ordinal = (today or date.today()).toordinal()
 
-            # Check DTE
-            dte = (option.expiration.date() - today).days
-            if dte < min_dte or dte > max_dte:
-                continue
+        # Repeated lookups against the same chain (e.g. several positions
+        # rolling to the same target) reuse the first result
+        key = (right, target_delta, min_dte, max_dte, today_ordinal)
+        if key in self._delta_picks:
+            return self._delta_picks[key]
 
-            # Need delta
-            if option.delta is None:
-                continue
+        dte = batch.dte(today_ordinal)
 
-            # Need valid bid/ask
-            if option.bid <= 0 or option.ask <= 0:
-                continue
-
-            candidates.append(option)
-
-        if not candidates:
-            return None
+        # Filter by type, DTE, available delta and valid bid/ask
+        mask = (
+            (batch.right == OptionRight[right]) &
+            (dte >= min_dte) & (dte <= max_dte) &
+            batch.has_delta()
+        )
 
         # For puts, we want delta around -target_delta (e.g., -0.30)
         # For calls, we want delta around +target_delta (e.g., +0.30)
@@ -215,10 +259,76 @@ class Strategy(ABC):
             target = abs(target_delta)
 
         # Find closest to target delta
-        best_option = min(candidates, key=lambda o: abs(o.delta - target))
+        best = _nearest_delta_index(batch.delta, mask, target)
+        best_option = batch.options[best] if best >= 0 else None
 
+        self._delta_picks[key] = best_option
         return best_option
 
+    def _get_chain_batch(self, options_chain: List[OptionChainData]) -> OptionChainBatch:
+        """
+        Return the columnar view of an options chain, building it on first use.
+
+        The batch is reused while the same chain list is passed in, so repeated
+        lookups and analyze() calls against one chain share a single
+        conversion. Chains must therefore not be edited in place between
+        calls; pass a new list instead. Cached delta lookups are dropped
+        whenever the batch is rebuilt.
+
+        Args:
+            options_chain: Available options
+
+        Returns:
+            Struct-of-arrays view of the chain
+        """
+        batch = self._chain_batch
+        if (batch is None or batch.options is not options_chain or
+                len(batch) != len(options_chain)):
+            batch = OptionChainBatch.from_options(options_chain)
+            self._chain_batch = batch
+            self._delta_picks = {}
+        return batch
+
+    def use_chain_batch(self, batch: OptionChainBatch):
+        """
+        Adopt a prebuilt columnar view for the chain in batch.options.
+
+        Lookups against that list then use the batch's arrays instead of
+        converting the chain again.
+
+        Args:
+            batch: Columnar view, e.g. from DataFetcher.get_options_chain_batch
+        """
+        if batch is not self._chain_batch:
+            self._chain_batch = batch
+            self._delta_picks = {}
+
+    def release_chain_batch(self):
+        """
+        Drop the cached chain batch and delta lookups.
+
+        Call before handing the chain back with DataFetcher.release_chain:
+        its OptionChainData instances are overwritten by the next fetch, and
+        must not be read through this strategy afterwards.
+        """
+        self._chain_batch = None
+        self._delta_picks = {}
+
+    def chain_fingerprint(self, options_chain: List[OptionChainData]) -> bytes:
+        """
+        Digest of an options chain's contracts and quotes.
+
+        Uses the same columnar batch analyze() works from, so fingerprinting
+        a chain before analyzing it does not convert it twice.
+
+        Args:
+            options_chain: Available options
+
+        Returns:
+            Digest that changes whenever a contract, quote or delta changes
+        """
+        return self._get_chain_batch(options_chain).fingerprint()
+
     def _find_options_by_strike_range(
         self,
         options_chain: List[OptionChainData],
@@ -227,7 +337,8 @@ class Strategy(ABC):
         max_strike: float,
         expiration: datetime,
         min_dte: int,
-        max_dte: int
+        max_dte: int,
+        today: Optional[date] = None
     ) -> List[OptionChainData]:
         """
         Find all options within a strike range for a specific expiration.
@@ -242,41 +353,29 @@ class Strategy(ABC):
             expiration: Target expiration date
             min_dte: Minimum days to expiration
             max_dte: Maximum days to expiration
+            today: Reference date for DTE (defaults to the current date)
 
         Returns:
             List of matching options
         """
-        from datetime import datetime
-
-        today = datetime.now().date()
-        matching = []
-
-        for option in options_chain:
-            # Filter by right
-            if option.right != right:
-                continue
-
-            # Check strike range
-            if option.strike < min_strike or option.strike > max_strike:
-                continue
-
-            # Check expiration match (same date)
-            if option.expiration.date() != expiration.date():
-                continue
-
-            # Check DTE
-            dte = (option.expiration.date() - today).days
-            if dte < min_dte or dte > max_dte:
-                continue
-
-            # Need valid bid/ask
-            if option.bid <= 0 or option.ask <= 0:
-                continue
-
-            matching.append(option)
-
-        return matching
-
+        # Every match shares the one expiration, so DTE is checked once
+        exp_ordinal = expiration.toordinal()
+        dte = exp_ordinal - (today or date.today()).toordinal()
+        if dte < min_dte or dte > max_dte:
+            return []
+
+        # Rows for this right and expiration, from the chain's prebuilt index
+        batch = self._get_chain_batch(options_chain)
+        rows = batch.groups().get((OptionRight[right], exp_ordinal))
+        if rows is None:
+            return []
+
+        strike = batch.strike[rows]
+        mask = (
+            (strike >= min_strike) & (strike <= max_strike) &
+            (batch.bid[rows] > 0) & (batch.ask[rows] > 0)
+        )
+
+        options = batch.options
+        return [options[i] for i in rows[mask].tolist()]
 
-# Import datetime for type hints
-from datetime import datetime
@@ -5,26 +5,128 @@ Dynamically selects the best strategy based on market conditions.
 Supports multi-strategy portfolios with allocation management.
 """
 
+import functools
+import itertools
 import logging
-from typing import List, Optional, Dict
-from enum import Enum
+from typing import List, Optional, Dict, Tuple, Type, Union
+from enum import IntEnum
+
+import numpy as np
 
 from src.strategy_base import Strategy, StrategyType
 from src.core_strategy import WheelStrategy
 from src.iron_condor_strategy import IronCondorStrategy
 from src.config_loader import SymbolConfig, StrategyConfig
-from src.data_fetcher import Position
+from src.data_fetcher import Position, PositionBatch
 
 logger = logging.getLogger(__name__)
 
+# Strategy class implementing each selectable strategy type
+STRATEGY_CLASSES: Dict[StrategyType, Type[Strategy]] = {
+    StrategyType.WHEEL: WheelStrategy,
+    StrategyType.IRON_CONDOR: IronCondorStrategy,
+}
+
+# Strategy detected from positions, by the codes _detect_strategies returns
+DETECTED_STRATEGIES = (None, StrategyType.WHEEL, StrategyType.IRON_CONDOR)
+
+# Below this volatility a neutral market favours iron condors
+LOW_VOL_THRESHOLD = 0.25
+
+
+class MarketRegime(IntEnum):
+    """
+    Market regime classifications.
+
+    An IntEnum so hashing and comparing a regime (e.g. in the decision
+    table lookup) is plain int work rather than Enum's Python-level hash.
+    """
+    BULLISH = 0
+    BEARISH = 1
+    NEUTRAL = 2
+    HIGH_VOLATILITY = 3
+    LOW_VOLATILITY = 4
+
+
+# Volatility above which the market counts as high volatility, and below
+# which it counts as low volatility, ahead of any trend
+HIGH_VOL_REGIME_THRESHOLD = 0.35
+LOW_VOL_REGIME_THRESHOLD = 0.20
+
+# Regime for each code returned by classify_market_regimes (its value)
+REGIMES = tuple(MarketRegime)
+
+# Members bound once for classify_market_regime, which runs per symbol
+_HIGH_VOLATILITY = MarketRegime.HIGH_VOLATILITY
+_LOW_VOLATILITY = MarketRegime.LOW_VOLATILITY
+_NEUTRAL = MarketRegime.NEUTRAL
+_TREND_REGIMES = {
+    'bullish': MarketRegime.BULLISH,
+    'bearish': MarketRegime.BEARISH,
+    'neutral': MarketRegime.NEUTRAL,
+}
+
+
+def classify_market_regime(
+    volatility: Optional[float],
+    trend: Optional[str]
+) -> MarketRegime:
+    """
+    Classify market regime based on volatility and trend.
+
+    Args:
+        volatility: Implied volatility (e.g., 0.25 = 25%)
+        trend: Trend indicator ('bullish', 'bearish', 'neutral')
+
+    Returns:
+        Market regime classification
+    """
+    # Volatility-based classification
+    if volatility:
+        if volatility > HIGH_VOL_REGIME_THRESHOLD:
+            return _HIGH_VOLATILITY
+        elif volatility < LOW_VOL_REGIME_THRESHOLD:
+            return _LOW_VOLATILITY
+
+    # Trend-based classification; trends normally arrive lowercase, so
+    # only lowercase on a miss
+    if trend:
+        regime = _TREND_REGIMES.get(trend)
+        if regime is None:
+            regime = _TREND_REGIMES.get(trend.lower(), _NEUTRAL)
+        return regime
+
+    # Insufficient data
+    return _NEUTRAL
+
+
+def classify_market_regimes(volatilities: np.ndarray, trends: np.ndarray) -> np.ndarray:
+    """
+    Vectorized classify_market_regime for many symbols.
+
+    Args:
+        volatilities: (n,) implied volatilities, NaN or 0 where unknown
+        trends: (n,) trend strings, '' where unknown
 
-class MarketRegime(Enum):
-    """Market regime classifications."""
-    BULLISH = "bullish"
-    BEARISH = "bearish"
-    NEUTRAL = "neutral"
-    HIGH_VOLATILITY = "high_volatility"
-    LOW_VOLATILITY = "low_volatility"
+    Returns:
+        (n,) indices into REGIMES
+    """
+    trends = np.char.lower(trends)
+    return np.select(
+        [
+            volatilities > HIGH_VOL_REGIME_THRESHOLD,
+            (volatilities < LOW_VOL_REGIME_THRESHOLD) & (volatilities != 0),
+            trends == 'bullish',
+            trends == 'bearish',
+        ],
+        [
+            REGIMES.index(MarketRegime.HIGH_VOLATILITY),
+            REGIMES.index(MarketRegime.LOW_VOLATILITY),
+            REGIMES.index(MarketRegime.BULLISH),
+            REGIMES.index(MarketRegime.BEARISH),
+        ],
+        default=REGIMES.index(MarketRegime.NEUTRAL)
+    )
 
 
 class StrategySelector:
@@ -53,6 +155,54 @@ class StrategySelector:
         self.config = strategy_config
         self.symbol_configs = symbol_configs
 
+        # One strategy instance per (symbol config, strategy type), reused
+        # across calls. Configs are frozen, so identity stands for content;
+        # each cached strategy holds its config, so the id stays unique.
+        self._strategy_cache: Dict[Tuple[int, StrategyType], Strategy] = {}
+        self._configure_selection()
+
+    def reload_configs(
+        self,
+        strategy_config: StrategyConfig,
+        symbol_configs: Dict[str, SymbolConfig]
+    ):
+        """
+        Swap in new configurations and drop strategies built from the old ones.
+
+        Args:
+            strategy_config: Global strategy configuration
+            symbol_configs: Per-symbol configurations
+        """
+        self.config = strategy_config
+        self.symbol_configs = symbol_configs
+        self._strategy_cache.clear()
+        self._configure_selection()
+
+    def _get_strategy(
+        self,
+        symbol_config: SymbolConfig,
+        strategy_type: StrategyType
+    ) -> Strategy:
+        """
+        Return the cached strategy instance for a symbol, creating it on first use.
+
+        A symbol whose config object is replaced gets a new instance built
+        from the new config.
+
+        Args:
+            symbol_config: Configuration of the symbol to trade
+            strategy_type: Strategy to instantiate
+
+        Returns:
+            Strategy instance shared by every call for this config and type
+        """
+        key = (id(symbol_config), strategy_type)
+        strategy = self._strategy_cache.get(key)
+        if strategy is None:
+            strategy = STRATEGY_CLASSES[strategy_type](symbol_config)
+            self._strategy_cache[key] = strategy
+        return strategy
+
     def get_strategies_for_symbol(
         self,
         symbol: str,
@@ -72,32 +222,26 @@ class StrategySelector:
         Returns:
             List of strategy instances to use
         """
-        if symbol not in self.symbol_configs:
-            logger.warning(f"No configuration for {symbol}")
+        symbol_config = self.symbol_configs.get(symbol)
+        if symbol_config is None:
+            logger.warning("No configuration for %s", symbol)
             return []
 
-        symbol_config = self.symbol_configs[symbol]
         strategies = []
 
-        # Check which strategies are enabled
-        if self.config.wheel_enabled:
-            wheel = WheelStrategy(symbol_config)
-            if wheel.is_compatible_with(stock_price, volatility, trend):
-                strategies.append(wheel)
-                logger.debug(f"{symbol}: Wheel strategy is compatible")
-
-        if self.config.iron_condor_enabled:
-            iron_condor = IronCondorStrategy(symbol_config)
-            if iron_condor.is_compatible_with(stock_price, volatility, trend):
-                strategies.append(iron_condor)
-                logger.debug(f"{symbol}: Iron Condor strategy is compatible")
+        # Check which enabled strategies suit the conditions
+        for strategy_type in self._enabled_types:
+            strategy = self._get_strategy(symbol_config, strategy_type)
+            if strategy.is_compatible_with(stock_price, volatility, trend):
+                strategies.append(strategy)
+                logger.debug("%s: %s strategy is compatible", symbol, strategy_type.value)
 
         # Future strategies
         if self.config.strangle_enabled:
-            logger.debug(f"{symbol}: Strangle strategy not yet implemented")
+            logger.debug("%s: Strangle strategy not yet implemented", symbol)
 
         if not strategies:
-            logger.warning(f"{symbol}: No compatible strategies found")
+            logger.warning("%s: No compatible strategies found", symbol)
 
         return strategies
 
@@ -128,52 +272,194 @@ class StrategySelector:
         Returns:
             Best strategy instance
         """
-        if symbol not in self.symbol_configs:
+        symbol_config = self.symbol_configs.get(symbol)
+        if symbol_config is None:
             return None
 
-        symbol_config = self.symbol_configs[symbol]
-
         # Check for existing positions to maintain strategy continuity
         if existing_positions:
             existing_strategy = self._detect_current_strategy(existing_positions)
             if existing_strategy:
-                logger.info(f"{symbol}: Continuing with {existing_strategy.value} strategy")
+                logger.info("%s: Continuing with %s strategy", symbol, existing_strategy.value)
+
+                if existing_strategy in self._enabled_types:
+                    return self._get_strategy(symbol_config, existing_strategy)
+
+        return self._select(symbol, symbol_config, volatility, trend)
+
+    def select_best_strategies(
+        self,
+        market_data: Dict[str, Dict],
+        positions_by_symbol: Optional[Dict[str, List[Position]]] = None
+    ) -> Dict[str, Optional[Strategy]]:
+        """
+        Select the best strategy for many symbols in one pass.
+
+        Same rules as select_best_strategy, but strategy continuity and
+        market regimes are worked out for every symbol with vectorized
+        passes before any strategy is picked.
+
+        Args:
+            market_data: Market data per symbol
+                        {symbol: {'price': float, 'volatility': float, 'trend': str}}
+            positions_by_symbol: Current positions per symbol, for continuity
+
+        Returns:
+            Dictionary mapping each symbol in market_data to its strategy,
+            or None if no strategy applies
+        """
+        selected: Dict[str, Optional[Strategy]] = dict.fromkeys(market_data)
+        symbol_configs = {}
+        for symbol in market_data:
+            symbol_config = self.symbol_configs.get(symbol)
+            if symbol_config is not None:
+                symbol_configs[symbol] = symbol_config
+        symbols = list(symbol_configs)
+
+        # Continue the strategy already held, where it is still enabled
+        positions_by_symbol = positions_by_symbol or {}
+        held = [symbol for symbol in symbols if positions_by_symbol.get(symbol)]
+        codes = _detect_grouped_strategies([positions_by_symbol[symbol] for symbol in held])
+        for symbol, code in zip(held, codes.tolist()):
+            existing_strategy = DETECTED_STRATEGIES[code]
+            if existing_strategy in self._enabled_types:
+                logger.info("%s: Continuing with %s strategy", symbol, existing_strategy.value)
+                selected[symbol] = self._get_strategy(symbol_configs[symbol], existing_strategy)
+
+        symbols = [symbol for symbol in symbols if selected[symbol] is None]
+        if self._select != self._select_by_regime:
+            for symbol in symbols:
+                selected[symbol] = self._select(symbol, symbol_configs[symbol], None, None)
+            return selected
+
+        # Classify every remaining symbol's regime at once
+        data = [market_data[symbol] for symbol in symbols]
+        volatilities = np.array(
+            [np.nan if d.get('volatility') is None else d['volatility'] for d in data],
+            dtype=np.float64
+        )
+        trends = np.array([d.get('trend') or '' for d in data], dtype=str)
+        regimes = classify_market_regimes(volatilities, trends).tolist()
+        low_vols = ((volatilities < LOW_VOL_THRESHOLD) & (volatilities != 0)).tolist()
+
+        for symbol, regime, low_vol in zip(symbols, regimes, low_vols):
+            choice = self._decision_table[(REGIMES[regime], low_vol)]
+            if choice is None:
+                logger.warning("%s: No strategy selected", symbol)
+                continue
+
+            strategy_type, message = choice
+            logger.info("%s: %s", symbol, message)
+            selected[symbol] = self._get_strategy(symbol_configs[symbol], strategy_type)
+
+        return selected
+
+    def _configure_selection(self):
+        """
+        Build the decision table and pick the selection path for the config.
+
+        When every regime leads to the same strategy (e.g. Wheel is the
+        only enabled strategy), selection skips regime classification.
+        """
+        self._enabled_types = tuple(
+            strategy_type
+            for strategy_type, flag in (
+                (StrategyType.WHEEL, self.config.wheel_enabled),
+                (StrategyType.IRON_CONDOR, self.config.iron_condor_enabled),
+            )
+            if flag
+        )
+        self._decision_table = self._build_decision_table()
 
-                if existing_strategy == StrategyType.WHEEL and self.config.wheel_enabled:
-                    return WheelStrategy(symbol_config)
-                elif existing_strategy == StrategyType.IRON_CONDOR and self.config.iron_condor_enabled:
-                    return IronCondorStrategy(symbol_config)
+        outcomes = {choice and choice[0] for choice in self._decision_table.values()}
+        if len(outcomes) == 1:
+            self._select = functools.partial(self._select_fixed, outcomes.pop())
+        else:
+            self._select = self._select_by_regime
 
+    def _select_by_regime(
+        self,
+        symbol: str,
+        symbol_config: SymbolConfig,
+        volatility: Optional[float],
+        trend: Optional[str]
+    ) -> Optional[Strategy]:
+        """Select a strategy from the decision table for the market regime."""
         # Determine market regime
-        regime = self._classify_market_regime(volatility, trend)
-        logger.debug(f"{symbol}: Market regime = {regime.value if regime else 'unknown'}")
+        regime = classify_market_regime(volatility, trend)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s: Market regime = %s", symbol, regime.name.lower())
 
         # Select strategy based on regime
-        if regime == MarketRegime.NEUTRAL and volatility and volatility < 0.25:
-            # Neutral + low vol → Iron Condor
-            if self.config.iron_condor_enabled:
-                logger.info(f"{symbol}: Selected Iron Condor (neutral, low vol)")
-                return IronCondorStrategy(symbol_config)
-
-        if regime in [MarketRegime.BULLISH, MarketRegime.BEARISH]:
-            # Directional trend → Wheel
-            if self.config.wheel_enabled:
-                logger.info(f"{symbol}: Selected Wheel ({regime.value} trend)")
-                return WheelStrategy(symbol_config)
-
-        if regime == MarketRegime.HIGH_VOLATILITY:
-            # High vol → Wheel for premium collection
-            if self.config.wheel_enabled:
-                logger.info(f"{symbol}: Selected Wheel (high volatility)")
-                return WheelStrategy(symbol_config)
-
-        # Default to Wheel if enabled
-        if self.config.wheel_enabled:
-            logger.info(f"{symbol}: Defaulting to Wheel strategy")
-            return WheelStrategy(symbol_config)
-
-        logger.warning(f"{symbol}: No strategy selected")
-        return None
+        low_vol = bool(volatility) and volatility < LOW_VOL_THRESHOLD
+        choice = self._decision_table[(regime, low_vol)]
+        if choice is None:
+            logger.warning("%s: No strategy selected", symbol)
+            return None
+
+        strategy_type, message = choice
+        logger.info("%s: %s", symbol, message)
+        return self._get_strategy(symbol_config, strategy_type)
+
+    def _select_fixed(
+        self,
+        strategy_type: Optional[StrategyType],
+        symbol: str,
+        symbol_config: SymbolConfig,
+        volatility: Optional[float],
+        trend: Optional[str]
+    ) -> Optional[Strategy]:
+        """Select the one strategy every regime leads to."""
+        if strategy_type is None:
+            logger.warning("%s: No strategy selected", symbol)
+            return None
+
+        logger.info("%s: Selected %s (only possible choice)", symbol, strategy_type.value)
+        return self._get_strategy(symbol_config, strategy_type)
+
+    def _build_decision_table(
+        self
+    ) -> Dict[Tuple[MarketRegime, bool], Optional[Tuple[StrategyType, str]]]:
+        """
+        Precompute the regime decision tree for the enabled strategies.
+
+        Every (regime, low volatility) cell is resolved once, so selection
+        is a single lookup. Rebuilt whenever the strategy config changes.
+
+        Returns:
+            Dict mapping (regime, volatility below LOW_VOL_THRESHOLD) to the
+            strategy type and log message, or None if nothing is enabled
+        """
+        wheel_enabled = self.config.wheel_enabled
+        iron_condor_enabled = self.config.iron_condor_enabled
+
+        def decide(regime: MarketRegime, low_vol: bool) -> Optional[Tuple[StrategyType, str]]:
+            if regime == MarketRegime.NEUTRAL and low_vol:
+                # Neutral + low vol → Iron Condor
+                if iron_condor_enabled:
+                    return StrategyType.IRON_CONDOR, "Selected Iron Condor (neutral, low vol)"
+
+            if regime in [MarketRegime.BULLISH, MarketRegime.BEARISH]:
+                # Directional trend → Wheel
+                if wheel_enabled:
+                    return StrategyType.WHEEL, f"Selected Wheel ({regime.name.lower()} trend)"
+
+            if regime == MarketRegime.HIGH_VOLATILITY:
+                # High vol → Wheel for premium collection
+                if wheel_enabled:
+                    return StrategyType.WHEEL, "Selected Wheel (high volatility)"
+
+            # Default to Wheel if enabled
+            if wheel_enabled:
+                return StrategyType.WHEEL, "Defaulting to Wheel strategy"
+
+            return None
+
+        return {
+            (regime, low_vol): decide(regime, low_vol)
+            for regime in MarketRegime
+            for low_vol in (False, True)
+        }
 
     def allocate_strategies(
         self,
@@ -195,131 +481,142 @@ class StrategySelector:
         Returns:
             Dictionary mapping symbols to list of strategies
         """
-        allocation = {}
-
+        configured = {}
         for symbol in symbols:
             if symbol not in market_data:
                 continue
+            symbol_config = self.symbol_configs.get(symbol)
+            if symbol_config is None:
+                logger.warning("No configuration for %s", symbol)
+                continue
+            configured[symbol] = symbol_config
+
+        # Screen every symbol against each enabled strategy in one vectorized
+        # pass, then only build (or fetch cached) instances for the matches
+        data = [market_data[symbol] for symbol in configured]
+        prices = np.array([d.get('price', 0.0) for d in data], dtype=np.float64)
+        volatilities = np.array(
+            [np.nan if d.get('volatility') is None else d['volatility'] for d in data],
+            dtype=np.float64
+        )
+        trends = np.array([d.get('trend') or '' for d in data], dtype=str)
+
+        enabled = self._enabled_types
+        masks = [
+            STRATEGY_CLASSES[strategy_type].compatible_mask(prices, volatilities, trends).tolist()
+            for strategy_type in enabled
+        ]
 
-            data = market_data[symbol]
-            strategies = self.get_strategies_for_symbol(
-                symbol,
-                data.get('price', 0.0),
-                data.get('volatility'),
-                data.get('trend')
-            )
+        allocation = {}
+        for i, (symbol, symbol_config) in enumerate(configured.items()):
+            strategies = [
+                self._get_strategy(symbol_config, strategy_type)
+                for strategy_type, mask in zip(enabled, masks)
+                if mask[i]
+            ]
 
             if strategies:
                 allocation[symbol] = strategies
+            else:
+                logger.warning("%s: No compatible strategies found", symbol)
 
         return allocation
 
     def _detect_current_strategy(
         self,
-        positions: List[Position]
+        positions: Union[List[Position], PositionBatch]
     ) -> Optional[StrategyType]:
         """
         Detect which strategy is currently being used based on positions.
 
         Args:
-            positions: Current positions for a symbol
+            positions: Current positions for a symbol, as a list or a
+                PositionBatch already built from them
 
         Returns:
             Detected strategy type or None
         """
-        # Check for stock position (indicates Wheel)
-        has_stock = any(p.position_type == 'stock' for p in positions)
-        if has_stock:
-            return StrategyType.WHEEL
-
-        # Check for single short put or call (Wheel)
-        option_positions = [p for p in positions if p.position_type == 'option']
-        if len(option_positions) == 1:
-            return StrategyType.WHEEL
-
-        # Check for Iron Condor pattern (4 legs)
-        if len(option_positions) == 4:
-            puts = [p for p in option_positions if p.right == 'P']
-            calls = [p for p in option_positions if p.right == 'C']
-
-            if len(puts) == 2 and len(calls) == 2:
-                # Likely an iron condor
-                return StrategyType.IRON_CONDOR
-
-        return None
-
-    def _classify_market_regime(
-        self,
-        volatility: Optional[float],
-        trend: Optional[str]
-    ) -> Optional[MarketRegime]:
-        """
-        Classify market regime based on volatility and trend.
-
-        Args:
-            volatility: Implied volatility (e.g., 0.25 = 25%)
-            trend: Trend indicator ('bullish', 'bearish', 'neutral')
+        if not isinstance(positions, PositionBatch):
+            positions = PositionBatch.from_positions(positions)
+        if not len(positions):
+            return None
 
-        Returns:
-            Market regime classification
-        """
-        # Volatility-based classification
-        if volatility:
-            if volatility > 0.35:
-                return MarketRegime.HIGH_VOLATILITY
-            elif volatility < 0.20:
-                return MarketRegime.LOW_VOLATILITY
-
-        # Trend-based classification
-        if trend:
-            if trend.lower() == 'bullish':
-                return MarketRegime.BULLISH
-            elif trend.lower() == 'bearish':
-                return MarketRegime.BEARISH
-            elif trend.lower() == 'neutral':
-                return MarketRegime.NEUTRAL
-
-        # Default to neutral if insufficient data
-        return MarketRegime.NEUTRAL
+        # All legs belong to one symbol, so fold them into a single group
+        codes = _detect_strategies(positions, np.zeros(len(positions), dtype=np.intp), 1)
+        return DETECTED_STRATEGIES[codes[0]]
 
     def get_strategy_statistics(
         self,
-        positions: List[Position]
+        positions: Union[List[Position], PositionBatch, Dict[str, List[Position]]]
     ) -> Dict[str, int]:
         """
         Get statistics on which strategies are currently active.
 
         Args:
-            positions: All positions across portfolio
+            positions: All positions across portfolio, as a list, a
+                PositionBatch already built from them, or already grouped
+                by symbol (which skips grouping them again)
 
         Returns:
             Dictionary of strategy counts
         """
-        stats = {
-            'wheel': 0,
-            'iron_condor': 0,
-            'other': 0
+        if isinstance(positions, dict):
+            codes = _detect_grouped_strategies([group for group in positions.values() if group])
+        else:
+            if not isinstance(positions, PositionBatch):
+                positions = PositionBatch.from_positions(positions)
+            codes = _detect_strategies(positions, positions.symbol_code, len(positions.symbols))
+
+        none, wheel, iron_condor = np.bincount(codes, minlength=len(DETECTED_STRATEGIES)).tolist()
+        return {
+            'wheel': wheel,
+            'iron_condor': iron_condor,
+            'other': none
         }
 
-        # Group positions by symbol
-        by_symbol = {}
-        for pos in positions:
-            if pos.symbol not in by_symbol:
-                by_symbol[pos.symbol] = []
-            by_symbol[pos.symbol].append(pos)
-
-        # Detect strategy for each symbol
-        for symbol, symbol_positions in by_symbol.items():
-            strategy_type = self._detect_current_strategy(symbol_positions)
-
-            if strategy_type == StrategyType.WHEEL:
-                stats['wheel'] += 1
-            elif strategy_type == StrategyType.IRON_CONDOR:
-                stats['iron_condor'] += 1
-            else:
-                stats['other'] += 1
 
-        return stats
+def _detect_grouped_strategies(groups: List[List[Position]]) -> np.ndarray:
+    """
+    Detect the strategy of each group in positions already split by symbol.
+
+    Args:
+        groups: Positions of each symbol
+
+    Returns:
+        Index into DETECTED_STRATEGIES for each group
+    """
+    batch = PositionBatch.from_positions(list(itertools.chain.from_iterable(groups)))
+    group = np.repeat(np.arange(len(groups)), [len(g) for g in groups])
+    return _detect_strategies(batch, group, len(groups))
+
+
+def _detect_strategies(
+    batch: PositionBatch,
+    group: np.ndarray,
+    n_groups: int
+) -> np.ndarray:
+    """
+    Detect the strategy of each group of positions from the batch columns.
+
+    A group holding stock or exactly one option leg is a Wheel; four
+    option legs split two puts and two calls is an Iron Condor.
+
+    Args:
+        batch: Position columns
+        group: Group index of each position
+        n_groups: Number of groups
+
+    Returns:
+        Index into DETECTED_STRATEGIES for each group
+    """
+    is_option = ~batch.is_stock
+    has_stock = np.bincount(group[batch.is_stock], minlength=n_groups) > 0
+    options = np.bincount(group[is_option], minlength=n_groups)
+    calls = np.bincount(group[is_option & batch.is_call], minlength=n_groups)
+
+    wheel = has_stock | (options == 1)
+    iron_condor = ~wheel & (options == 4) & (calls == 2)
+    return wheel + 2 * iron_condor
 
 
 def main():
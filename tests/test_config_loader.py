@@ -2,12 +2,25 @@
 Unit tests for config_loader module.
 """
 
-import pytest
-import tempfile
 import os
+
+import pytest
 from src.config_loader import ConfigLoader, SymbolConfig, RiskConfig
 
 
+@pytest.fixture
+def write_config_pair(tmp_path):
+    """Return a helper that writes a TOML config and .env file, returning both paths."""
+    def write(toml: str, env: str):
+        config_path = tmp_path / 'config.toml'
+        env_path = tmp_path / 'config.env'
+        config_path.write_text(toml)
+        env_path.write_text(env)
+        return str(config_path), str(env_path)
+
+    return write
+
+
 def test_symbol_config_defaults():
     """Test SymbolConfig default values."""
     config = SymbolConfig(symbol='SPY')
@@ -44,10 +57,9 @@ def test_risk_config_defaults():
     assert config.enable_stop_loss == False
 
 
-def test_config_validation_invalid_delta():
+def test_config_validation_invalid_delta(write_config_pair):
     """Test configuration validation catches invalid delta."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.toml', delete=False) as f:
-        f.write("""
+    config_path, env_path = write_config_pair("""
 [account]
 account_number = "TEST123"
 
@@ -62,26 +74,16 @@ enabled = true
 [data]
 [schedule]
 [logging]
-        """)
-        config_path = f.name
+""", "IBKR_ACCOUNT_NUMBER=TEST123")
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.env', delete=False) as f:
-        f.write("IBKR_ACCOUNT_NUMBER=TEST123")
-        env_path = f.name
+    loader = ConfigLoader(config_path, env_path)
+    with pytest.raises(ValueError, match="Invalid target_delta"):
+        loader.load()
 
-    try:
-        loader = ConfigLoader(config_path, env_path)
-        with pytest.raises(ValueError, match="Invalid target_delta"):
-            loader.load()
-    finally:
-        os.unlink(config_path)
-        os.unlink(env_path)
 
-
-def test_config_validation_missing_account():
+def test_config_validation_missing_account(write_config_pair):
     """Test configuration validation catches missing account."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.toml', delete=False) as f:
-        f.write("""
+    config_path, env_path = write_config_pair("""
 [account]
 
 [symbols.defaults]
@@ -94,26 +96,16 @@ enabled = true
 [data]
 [schedule]
 [logging]
-        """)
-        config_path = f.name
-
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.env', delete=False) as f:
-        f.write("")
-        env_path = f.name
+""", "")
 
-    try:
-        loader = ConfigLoader(config_path, env_path)
-        with pytest.raises(ValueError, match="account number is required"):
-            loader.load()
-    finally:
-        os.unlink(config_path)
-        os.unlink(env_path)
+    loader = ConfigLoader(config_path, env_path)
+    with pytest.raises(ValueError, match="account number is required"):
+        loader.load()
 
 
-def test_config_loader_env_override():
+def test_config_loader_env_override(write_config_pair):
     """Test that environment variables override TOML values."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.toml', delete=False) as f:
-        f.write("""
+    config_path, env_path = write_config_pair("""
 [account]
 account_number = "WRONG"
 
@@ -127,18 +119,99 @@ enabled = true
 [data]
 [schedule]
 [logging]
-        """)
-        config_path = f.name
+""", "IBKR_ACCOUNT_NUMBER=CORRECT123")
+
+    loader = ConfigLoader(config_path, env_path)
+    config = loader.load()
+
+    assert config.account.account_number == "CORRECT123"
+
+
+def test_config_loader_memoizes_until_file_changes(write_config_pair):
+    """Test that unchanged files return the cached Config and edits invalidate it."""
+    config_path, env_path = write_config_pair("""
+[account]
+account_number = "TEST123"
+
+[symbols.tickers.SPY]
+enabled = true
+""", "")
+
+    loader = ConfigLoader(config_path, env_path)
+    first = loader.load()
+    assert loader.load() is first
+
+    # Bump mtime to simulate an edit
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert loader.load() is not first
+
+
+def test_config_loader_skips_disabled_symbols(write_config_pair):
+    """Test that disabled tickers are not loaded into the symbol map."""
+    config_path, env_path = write_config_pair("""
+[account]
+account_number = "TEST123"
 
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.env', delete=False) as f:
-        f.write("IBKR_ACCOUNT_NUMBER=CORRECT123")
-        env_path = f.name
+[symbols.tickers.SPY]
+enabled = true
+
+[symbols.tickers.TSLA]
+enabled = false
+""", "")
+
+    config = ConfigLoader(config_path, env_path).load()
+
+    assert 'SPY' in config.symbols
+    assert 'TSLA' not in config.symbols
+
+
+def test_config_loader_merges_symbol_defaults(write_config_pair):
+    """Test that ticker settings override TOML defaults and values are coerced."""
+    config_path, env_path = write_config_pair("""
+[account]
+account_number = "TEST123"
+
+[symbols.defaults]
+min_premium = 5
+dte_max = 40
+
+[symbols.tickers.SPY]
+dte_max = 50
+
+[symbols.tickers.QQQ]
+max_positions = 3
+""", "")
+
+    config = ConfigLoader(config_path, env_path).load()
+
+    spy = config.symbols['SPY']
+    qqq = config.symbols['QQQ']
+
+    assert spy.dte_max == 50
+    assert qqq.dte_max == 40
+    assert qqq.max_positions == 3
+    assert spy.max_positions == 1
+    assert isinstance(spy.min_premium, float) and spy.min_premium == 5.0
+
+
+def test_config_loader_reloads_when_env_override_changes(write_config_pair, monkeypatch):
+    """Test that changing an override variable between loads is picked up."""
+    config_path, env_path = write_config_pair("""
+[account]
+account_number = "TEST123"
+
+[symbols.tickers.SPY]
+enabled = true
+""", "")
+    monkeypatch.setenv('IBKR_ACCOUNT_NUMBER', 'DU111')
 
-    try:
-        loader = ConfigLoader(config_path, env_path)
-        config = loader.load()
+    loader = ConfigLoader(config_path, env_path)
+    first = loader.load()
+    monkeypatch.setenv('IBKR_ACCOUNT_NUMBER', 'DU999')
+    second = loader.load()
 
-        assert config.account.account_number == "CORRECT123"
-    finally:
-        os.unlink(config_path)
-        os.unlink(env_path)
+    assert first.account.account_number == 'DU111'
+    assert second.account.account_number == 'DU999'
+    assert loader.load() is second
@@ -3,13 +3,14 @@ Unit tests for core_strategy module.
 """
 
 import pytest
+from dataclasses import replace
 from datetime import datetime, timedelta
 from src.core_strategy import WheelStrategy, Action
 from src.config_loader import SymbolConfig
-from src.data_fetcher import OptionChainData, Position, AccountInfo
+from src.data_fetcher import OptionChainBatch, OptionChainData, Position, AccountInfo
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def symbol_config():
     """Create a test symbol configuration."""
     return SymbolConfig(
@@ -25,7 +26,7 @@ def symbol_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def account_info():
     """Create test account information."""
     return AccountInfo(
@@ -40,7 +41,7 @@ def account_info():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def mock_options_chain():
     """Create a mock options chain."""
     exp_date = datetime.now() + timedelta(days=35)
@@ -190,7 +191,7 @@ def test_analyze_with_stock_no_calls(symbol_config, account_info, mock_options_c
 
 def test_disabled_symbol_returns_empty(symbol_config, account_info, mock_options_chain):
     """Test that disabled symbol returns no recommendations."""
-    symbol_config.enabled = False
+    symbol_config = replace(symbol_config, enabled=False)
     strategy = WheelStrategy(symbol_config)
     stock_price = 450.0
 
@@ -207,7 +208,7 @@ def test_disabled_symbol_returns_empty(symbol_config, account_info, mock_options
 def test_minimum_premium_filtering(symbol_config, account_info, mock_options_chain):
     """Test that minimum premium requirement filters options."""
     # Set a very high minimum premium
-    symbol_config.min_premium = 1000.0
+    symbol_config = replace(symbol_config, min_premium=1000.0)
     strategy = WheelStrategy(symbol_config)
     stock_price = 450.0
 
@@ -220,3 +221,143 @@ def test_minimum_premium_filtering(symbol_config, account_info, mock_options_cha
 
     # Should return empty because no options meet minimum premium
     assert len(recommendations) == 0
+
+
+def test_find_option_by_delta_skips_unquoted(symbol_config, mock_options_chain):
+    """Test that delta lookup ignores options without quotes or Greeks."""
+    strategy = WheelStrategy(symbol_config)
+    exp_date = datetime.now() + timedelta(days=35)
+
+    # Exact delta match, but no bid
+    no_bid = OptionChainData(
+        symbol='SPY', strike=445.0, expiration=exp_date, right='P',
+        bid=0.0, ask=2.60, last=2.50, volume=100, open_interest=500,
+        delta=-0.30
+    )
+    # No delta at all
+    no_delta = OptionChainData(
+        symbol='SPY', strike=447.0, expiration=exp_date, right='P',
+        bid=2.40, ask=2.60, last=2.50, volume=100, open_interest=500
+    )
+    chain = [no_bid, no_delta] + mock_options_chain
+
+    option = strategy._find_option_by_delta(chain, 'P', 0.30, 450.0, 30, 45)
+
+    assert option is not None
+    assert option.strike == 440.0
+    assert option.delta == -0.30
+
+
+def test_find_options_by_strike_range(symbol_config, mock_options_chain):
+    """Test strike range lookup for one right and expiration, in chain order."""
+    strategy = WheelStrategy(symbol_config)
+    expiration = mock_options_chain[0].expiration
+    unquoted = replace(mock_options_chain[1], bid=0.0)
+    later = replace(mock_options_chain[2], expiration=expiration + timedelta(days=7))
+    chain = mock_options_chain + [unquoted, later]
+
+    puts = strategy._find_options_by_strike_range(chain, 'P', 435.0, 445.0, expiration, 30, 45)
+
+    assert [o.strike for o in puts] == [435.0, 440.0, 445.0]
+    assert all(o.right == 'P' and o.expiration == expiration for o in puts)
+    assert strategy._find_options_by_strike_range(chain, 'P', 435.0, 445.0, expiration, 40, 45) == []
+
+
+def test_analyze_closes_only_profitable_puts(symbol_config, account_info, mock_options_chain):
+    """Test that only short puts past the profit target are closed."""
+    strategy = WheelStrategy(symbol_config)
+    exp_date = datetime.now() + timedelta(days=35)
+
+    def short_put(strike, market_value):
+        return Position(
+            symbol='SPY',
+            position_type='option',
+            quantity=-1,
+            avg_cost=250.0,
+            market_value=market_value,
+            unrealized_pnl=0.0,
+            realized_pnl=0.0,
+            strike=strike,
+            expiration=exp_date,
+            right='P'
+        )
+
+    winner = short_put(440.0, -50.0)   # 80% profit
+    holder = short_put(435.0, -200.0)  # 20% profit, far from expiration
+
+    recommendations = strategy.analyze(
+        450.0,
+        mock_options_chain,
+        positions=[winner, holder],
+        account_info=account_info
+    )
+
+    assert len(recommendations) == 1
+    assert recommendations[0].action == Action.CLOSE_PUT
+    assert recommendations[0].existing_position is winner
+
+
+def test_check_call_position_rolls_near_expiration(symbol_config, mock_options_chain):
+    """Test that a short call inside the roll window is rolled to a new call."""
+    strategy = WheelStrategy(symbol_config)
+
+    position = Position(
+        symbol='SPY',
+        position_type='option',
+        quantity=-1,
+        avg_cost=250.0,
+        market_value=-200.0,
+        unrealized_pnl=0.0,
+        realized_pnl=0.0,
+        strike=455.0,
+        expiration=datetime.now() + timedelta(days=10),
+        right='C'
+    )
+
+    recommendation = strategy._check_call_position(position, 450.0, mock_options_chain)
+
+    assert recommendation is not None
+    assert recommendation.action == Action.ROLL_CALL
+    assert recommendation.new_strike == 460.0
+    assert recommendation.quantity == 1
+
+
+def test_find_option_by_delta_uses_given_today(symbol_config, mock_options_chain):
+    """Test that DTE is measured from the reference date passed in."""
+    strategy = WheelStrategy(symbol_config)
+    later = (datetime.now() + timedelta(days=10)).date()
+
+    # The 35 DTE chain is only 25 days out from the later date
+    assert strategy._find_option_by_delta(mock_options_chain, 'P', 0.30, 450.0, 30, 45) is not None
+    assert strategy._find_option_by_delta(
+        mock_options_chain, 'P', 0.30, 450.0, 30, 45, today=later
+    ) is None
+
+
+def test_use_chain_batch_skips_rebuild(symbol_config, mock_options_chain, monkeypatch):
+    """Test that a prebuilt batch serves lookups against its chain."""
+    strategy = WheelStrategy(symbol_config)
+    batch = OptionChainBatch.from_options(mock_options_chain)
+    strategy.use_chain_batch(batch)
+
+    def fail(options):
+        raise AssertionError("chain converted again")
+
+    monkeypatch.setattr(OptionChainBatch, 'from_options', fail)
+
+    option = strategy._find_option_by_delta(mock_options_chain, 'P', 0.30, 450.0, 30, 45)
+
+    assert option is not None
+    assert strategy._get_chain_batch(mock_options_chain) is batch
+
+
+def test_release_chain_batch_drops_chain_references(symbol_config, mock_options_chain):
+    """Test that releasing leaves no references to a chain about to be recycled."""
+    strategy = WheelStrategy(symbol_config)
+    strategy.use_chain_batch(OptionChainBatch.from_options(mock_options_chain))
+    assert strategy._find_option_by_delta(mock_options_chain, 'P', 0.30, 450.0, 30, 45) is not None
+
+    strategy.release_chain_batch()
+
+    assert strategy._chain_batch is None
+    assert strategy._delta_picks == {}
@@ -0,0 +1,645 @@
+"""
+Unit tests for data_fetcher module.
+"""
+
+import asyncio
+import re
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from ib_async import AccountValue, Option, OptionComputation, Stock, Ticker
+
+import src.data_fetcher as data_fetcher
+from src.data_fetcher import (
+    DataFetcher,
+    OptionChainBatch,
+    OptionChainData,
+    OptionChainTable,
+    OptionRight,
+    Position,
+    PositionBatch,
+    MKT_DATA_REQUEST_INTERVAL,
+    _OptionPool,
+    bs_greeks,
+    bs_price,
+)
+
+
+@pytest.fixture
+def fetcher():
+    """Create a data fetcher that is never connected."""
+    return DataFetcher()
+
+
+def test_connection_shared_and_refcounted(monkeypatch):
+    """Test that fetchers for one client share an IB and the last one closes it."""
+    events = []
+
+    class FakeIB:
+        def __init__(self):
+            self.connected = False
+
+        async def connectAsync(self, *args, **kwargs):
+            events.append('connect')
+            self.connected = True
+
+        def isConnected(self):
+            return self.connected
+
+        def disconnect(self):
+            events.append('disconnect')
+            self.connected = False
+
+    monkeypatch.setattr(data_fetcher, 'IB', FakeIB)
+
+    async def run():
+        first, second = DataFetcher(client_id=99), DataFetcher(client_id=99)
+        await first.connect()
+        await second.connect()
+        assert first.ib is second.ib
+
+        await first.disconnect()
+        assert events == ['connect']
+        await second.disconnect()
+
+    asyncio.run(run())
+
+    assert events == ['connect', 'disconnect']
+
+
+def test_reconnect_reuses_ib_object(monkeypatch):
+    """Test that a dropped connection is reopened on the IB others already hold."""
+    class FakeIB:
+        def __init__(self):
+            self.connected = False
+
+        async def connectAsync(self, *args, **kwargs):
+            self.connected = True
+
+        def isConnected(self):
+            return self.connected
+
+        def disconnect(self):
+            self.connected = False
+
+    monkeypatch.setattr(data_fetcher, 'IB', FakeIB)
+    fetcher = DataFetcher(client_id=98)
+    ib = fetcher.ib
+
+    async def connect():
+        await fetcher.connect()
+        return data_fetcher._pool_lock()
+
+    first_lock = asyncio.run(connect())
+    ib.connected = False  # connection drops
+
+    async def reconnect():
+        await fetcher._ensure_connected()
+        return data_fetcher._pool_lock()
+
+    second_lock = asyncio.run(reconnect())
+
+    assert fetcher.ib is ib
+    assert ib.isConnected()
+    assert second_lock is not first_lock
+    asyncio.run(fetcher.disconnect())
+
+
+def test_qualified_stock_is_cached(fetcher, monkeypatch):
+    """Test that a stock contract is qualified with IBKR only once."""
+    calls = []
+
+    async def fake_qualify(*contracts):
+        calls.append(contracts)
+        return [Stock(c.symbol, c.exchange, c.currency, conId=1) for c in contracts]
+
+    monkeypatch.setattr(fetcher.ib, 'qualifyContractsAsync', fake_qualify)
+
+    first = asyncio.run(fetcher._qualified_stock('SPY'))
+    second = asyncio.run(fetcher._qualified_stock('SPY'))
+    vix = asyncio.run(fetcher._qualified_stock('VIX', 'CBOE'))
+
+    assert first is second
+    assert vix.exchange == 'CBOE'
+    assert len(calls) == 2
+
+
+def test_qualified_stock_failure_not_cached(fetcher, monkeypatch):
+    """Test that an unqualifiable symbol raises and is retried next time."""
+    calls = []
+
+    async def fake_qualify(*contracts):
+        calls.append(contracts)
+        return [None for _ in contracts]
+
+    monkeypatch.setattr(fetcher.ib, 'qualifyContractsAsync', fake_qualify)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            asyncio.run(fetcher._qualified_stock('NOPE'))
+
+    assert len(calls) == 2
+
+
+def test_account_info_is_cached_until_invalidated(fetcher, monkeypatch):
+    """Test that account values are reused until invalidated."""
+    calls = []
+
+    async def connected():
+        pass
+
+    def fake_account_values(account):
+        calls.append(account)
+        return [AccountValue(account, 'NetLiquidation', '100000', 'USD', '')]
+
+    monkeypatch.setattr(fetcher, '_ensure_connected', connected)
+    monkeypatch.setattr(fetcher.ib, 'accountValues', fake_account_values)
+
+    first = asyncio.run(fetcher.get_account_info('DU1'))
+    second = asyncio.run(fetcher.get_account_info(account_number='DU1'))
+    assert first is second
+    assert len(calls) == 1
+
+    fetcher.invalidate('DU1')
+    asyncio.run(fetcher.get_account_info('DU1'))
+    assert len(calls) == 2
+
+
+def test_historical_volatility_requests_only_new_bars(tmp_path, monkeypatch):
+    """Test that cached daily bars shrink the follow-up history request."""
+    fetcher = DataFetcher(bar_cache_dir=tmp_path)
+    today = date.today()
+    history = [
+        SimpleNamespace(date=today - timedelta(days=n), close=100.0 + (n % 3))
+        for n in range(30, -1, -1)
+    ]
+    durations = []
+
+    async def connected():
+        pass
+
+    async def fake_qualified_stock(symbol):
+        return Stock(symbol, 'SMART', 'USD', conId=1)
+
+    async def fake_historical(contract, endDateTime, durationStr, **kwargs):
+        durations.append(durationStr)
+        days = int(durationStr.split()[0])
+        return history[-days:]
+
+    monkeypatch.setattr(fetcher, '_ensure_connected', connected)
+    monkeypatch.setattr(fetcher, '_qualified_stock', fake_qualified_stock)
+    monkeypatch.setattr(fetcher.ib, 'reqHistoricalDataAsync', fake_historical)
+
+    first = asyncio.run(fetcher.get_historical_volatility('SPY', days=30))
+    fetcher.invalidate('SPY')
+    second = asyncio.run(fetcher.get_historical_volatility('SPY', days=30))
+
+    assert durations == ['30 D', '1 D']
+    assert (tmp_path / 'SPY.csv').exists()
+    assert second == pytest.approx(first)
+
+
+def test_historical_volatility_request_capped_at_window(tmp_path, monkeypatch):
+    """Test that a cache older than the window triggers one full-window fetch."""
+    fetcher = DataFetcher(bar_cache_dir=tmp_path)
+    today = date.today()
+    (tmp_path / 'SPY.csv').write_text(''.join(
+        f"{(today - timedelta(days=n)).isoformat()},100.0\n" for n in range(400, 360, -1)
+    ))
+    durations = []
+
+    async def connected():
+        pass
+
+    async def fake_qualified_stock(symbol):
+        return Stock(symbol, 'SMART', 'USD', conId=1)
+
+    async def fake_historical(contract, endDateTime, durationStr, **kwargs):
+        durations.append(durationStr)
+        return [SimpleNamespace(date=today - timedelta(days=n), close=100.0 + (n % 3))
+                for n in range(int(durationStr.split()[0]) - 1, -1, -1)]
+
+    monkeypatch.setattr(fetcher, '_ensure_connected', connected)
+    monkeypatch.setattr(fetcher, '_qualified_stock', fake_qualified_stock)
+    monkeypatch.setattr(fetcher.ib, 'reqHistoricalDataAsync', fake_historical)
+
+    assert asyncio.run(fetcher.get_historical_volatility('SPY', days=30)) > 0
+    assert durations == ['30 D']
+    assert DataFetcher().bar_cache_dir is None
+
+
+def test_req_mkt_data_is_paced(fetcher, monkeypatch):
+    """Test that back-to-back market data requests are spaced out."""
+    sent = []
+
+    def fake_req_mkt_data(contract, *args):
+        sent.append(asyncio.get_running_loop().time())
+        return contract
+
+    monkeypatch.setattr(fetcher.ib, 'reqMktData', fake_req_mkt_data)
+
+    async def request_all():
+        await asyncio.gather(*(fetcher._req_mkt_data(Stock(s)) for s in ('A', 'B', 'C')))
+
+    asyncio.run(request_all())
+
+    gaps = [b - a for a, b in zip(sent, sent[1:])]
+    assert len(sent) == 3
+    assert all(gap >= MKT_DATA_REQUEST_INTERVAL * 0.9 for gap in gaps)
+
+
+def test_option_chain_batch_groups_by_right_code():
+    """Test that the batch stores rights as OptionRight codes and groups on them."""
+    expiration = datetime(2024, 2, 16)
+    options = [
+        OptionChainData('SPY', strike, expiration, right, 1.0, 1.2, 0.0, 0, 0)
+        for strike, right in ((440.0, 'P'), (460.0, 'C'), (435.0, 'P'))
+    ]
+    batch = OptionChainBatch.from_options(options)
+
+    assert batch.right.tolist() == [OptionRight.P, OptionRight.C, OptionRight.P]
+    groups = batch.groups()
+    assert groups[(OptionRight.P, expiration.toordinal())].tolist() == [0, 2]
+    assert groups[(OptionRight['C'], expiration.toordinal())].tolist() == [1]
+
+
+def test_option_chain_batch_quoted_row():
+    """Test exact strike lookup in cents skips unquoted rows and float noise."""
+    expiration = datetime(2024, 2, 16)
+    options = [
+        OptionChainData('SPY', 435.0, expiration, 'P', 0.0, 1.2, 0.0, 0, 0),
+        OptionChainData('SPY', 435.0, expiration, 'P', 1.0, 1.2, 0.0, 0, 0),
+        OptionChainData('SPY', 440.1 + 0.2 - 0.3, expiration, 'P', 1.0, 1.2, 0.0, 0, 0),
+    ]
+    batch = OptionChainBatch.from_options(options)
+    ordinal = expiration.toordinal()
+
+    assert batch.strike_cents.tolist() == [43500, 43500, 44000]
+    assert batch.quoted_row(OptionRight.P, ordinal, 43500) == 1
+    assert batch.quoted_row(OptionRight.P, ordinal, 44000) == 2
+    assert batch.quoted_row(OptionRight.C, ordinal, 44000) == -1
+
+
+def test_option_chain_batch_has_delta():
+    """Test the delta-searchable mask needs both quotes and a delta."""
+    expiration = datetime(2024, 2, 16)
+    options = [
+        OptionChainData('SPY', 435.0, expiration, 'P', 0.0, 1.2, 0.0, 0, 0, delta=-0.2),
+        OptionChainData('SPY', 440.0, expiration, 'P', 1.0, 1.2, 0.0, 0, 0),
+        OptionChainData('SPY', 445.0, expiration, 'P', 1.0, 1.2, 0.0, 0, 0, delta=-0.3),
+    ]
+    batch = OptionChainBatch.from_options(options)
+
+    assert batch.has_delta().tolist() == [False, False, True]
+    assert batch.has_delta() is batch.has_delta()
+
+
+def test_option_chain_batch_dte_cached_per_day():
+    """Test that days to expiration are reused until the reference day changes."""
+    expiration = datetime(2024, 2, 16)
+    batch = OptionChainBatch.from_options([
+        OptionChainData('SPY', 440.0, expiration, 'P', 1.0, 1.2, 0.0, 0, 0)
+    ])
+    today = date(2024, 1, 12).toordinal()
+
+    assert batch.dte(today).tolist() == [35]
+    assert batch.dte(today) is batch.dte(today)
+    assert batch.dte(today + 1).tolist() == [34]
+
+
+def test_option_chain_batch_fingerprint_tracks_quotes():
+    """Test that equal chains share a fingerprint and a quote change alters it."""
+    expiration = datetime(2024, 2, 16)
+
+    def chain(bid):
+        return [
+            OptionChainData('SPY', 440.0, expiration, 'P', bid, 1.2, -0.3, 0, 0),
+            OptionChainData('SPY', 460.0, expiration, 'C', 1.0, 1.2, None, 0, 0),
+        ]
+
+    fingerprint = OptionChainBatch.from_options(chain(1.0)).fingerprint()
+
+    assert OptionChainBatch.from_options(chain(1.0)).fingerprint() == fingerprint
+    assert OptionChainBatch.from_options(chain(1.05)).fingerprint() != fingerprint
+
+
+def test_position_batch_columns():
+    """Test that stock positions get zeroed option columns in the batch."""
+    positions = [
+        Position('SPY', 'stock', 100, 450.0, 45000.0, 0.0, 0.0),
+        Position('SPY', 'option', -1, 2.5, -120.0, 0.0, 0.0,
+                 strike=440.0, expiration=datetime(2024, 2, 16), right='P'),
+    ]
+    batch = PositionBatch.from_positions(positions)
+
+    assert len(batch) == 2
+    assert batch.is_option.tolist() == [False, True]
+    assert batch.expiration_ordinal.tolist() == [0, date(2024, 2, 16).toordinal()]
+    assert batch.strike.tolist() == [0.0, 440.0]
+    assert batch.quantity.tolist() == [100.0, -1.0]
+
+
+def test_position_batch_symbol_codes():
+    """Test that each position's symbol code indexes the sorted symbol list."""
+    positions = [
+        Position(symbol, 'stock', 100, 1.0, 100.0, 0.0, 0.0)
+        for symbol in ('SPY', 'IWM', 'SPY', 'QQQ')
+    ]
+    batch = PositionBatch.from_positions(positions)
+
+    assert batch.symbols.tolist() == ['IWM', 'QQQ', 'SPY']
+    assert batch.symbol_code.tolist() == [2, 0, 2, 1]
+
+    empty = PositionBatch.from_positions([])
+    assert (len(empty.symbols), len(empty.symbol_code)) == (0, 0)
+
+
+def test_option_chain_table_round_trip():
+    """Test building a table from columns and converting back to rows."""
+    columns = {
+        'symbol': ['SPY', 'SPY'],
+        'strike': [440.0, 450.0],
+        'expiration': [datetime(2024, 2, 16), datetime(2024, 2, 16)],
+        'right': ['P', 'C'],
+        'bid': [2.40, 3.10],
+        'ask': [2.60, 3.30],
+        'last': [2.50, 0.0],
+        'volume': [10, 0],
+        'open_interest': [0, 0],
+        'delta': [-0.30, np.nan],
+        'gamma': [0.01, np.nan],
+        'theta': [-0.05, np.nan],
+        'vega': [0.20, np.nan],
+        'iv': [0.18, np.nan],
+    }
+    table = OptionChainTable.from_columns(columns, [None, None])
+
+    assert len(table) == 2
+    assert table.delta.dtype == np.float32
+    assert table.volume.dtype == np.int32
+    assert table.dte(date(2024, 1, 12)).tolist() == [35, 35]
+    assert ((table.right == 'P') & (table.delta > -0.35)).tolist() == [True, False]
+
+    put, call = table.to_options()
+    assert put.expiration == datetime(2024, 2, 16)
+    assert put.bid == 2.40
+    assert put.delta == pytest.approx(-0.30)
+    assert call.delta is None
+    assert call.strike == 450.0
+
+
+def test_option_chain_table_prices_round_trip_above_1000():
+    """Test that strikes and quotes of a high-priced underlying come back exact."""
+    table = OptionChainTable.from_columns({
+        'symbol': ['AZO'],
+        'strike': [3105.0],
+        'expiration': [datetime(2024, 2, 16)],
+        'right': ['C'],
+        'bid': [1234.56],
+        'ask': [1240.35],
+        'last': [1237.11],
+        'volume': [0],
+        'open_interest': [0],
+        'delta': [0.5],
+        'gamma': [0.001],
+        'theta': [-1.0],
+        'vega': [2.0],
+        'iv': [0.3],
+    }, [None])
+
+    (option,) = table.to_options()
+    batch = table.to_batch()
+
+    assert (option.strike, option.bid, option.ask, option.last) == (3105.0, 1234.56, 1240.35, 1237.11)
+    assert (batch.bid[0], batch.ask[0]) == (1234.56, 1240.35)
+    assert batch.strike_cents[0] == 310500
+
+
+def test_option_chain_table_to_batch_matches_rows():
+    """Test that the batch built from table columns equals one built from rows."""
+    table = OptionChainTable.from_columns({
+        'symbol': ['SPY'] * 3,
+        'strike': [440.0, 445.5, 450.0],
+        'expiration': [datetime(2024, 2, 16), datetime(2024, 2, 16), datetime(2024, 3, 15)],
+        'right': ['P', 'P', 'C'],
+        'bid': [2.40, 0.0, 3.10],
+        'ask': [2.60, 2.70, 3.30],
+        'last': [2.50, 0.0, 0.0],
+        'volume': [10, 0, 0],
+        'open_interest': [0, 0, 0],
+        'delta': [-0.30, -0.35, np.nan],
+        'gamma': [0.01, 0.01, np.nan],
+        'theta': [-0.05, -0.05, np.nan],
+        'vega': [0.20, 0.20, np.nan],
+        'iv': [0.18, 0.19, np.nan],
+    }, [None] * 3)
+
+    batch = table.to_batch()
+    expected = OptionChainBatch.from_options(batch.options)
+
+    assert len(batch) == 3
+    for name in ('strike', 'strike_cents', 'expiration_ordinal', 'right', 'bid', 'ask', 'delta'):
+        column, want = getattr(batch, name), getattr(expected, name)
+        assert column.dtype == want.dtype
+        np.testing.assert_array_equal(column, want)
+    assert batch.fingerprint() == expected.fingerprint()
+
+def test_fill_missing_greeks_recovers_black_scholes_values():
+    """Test that missing greeks are solved from the quote and modelled ones kept."""
+    today = date(2024, 1, 1)
+    expiration = datetime(2024, 4, 1)
+    years = (expiration.date() - today).days / 365.0
+    strikes = np.array([95.0, 105.0])
+    is_call = np.array([False, True])
+    mids = bs_price(100.0, strikes, years, 0.04, 0.25, is_call)
+
+    columns = {
+        'symbol': ['SPY'] * 3,
+        'strike': [95.0, 105.0, 100.0],
+        'expiration': [expiration] * 3,
+        'right': ['P', 'C', 'P'],
+        'bid': [mids[0] - 0.01, mids[1] - 0.01, 2.0],
+        'ask': [mids[0] + 0.01, mids[1] + 0.01, 2.2],
+        'last': [0.0] * 3,
+        'volume': [0] * 3,
+        'open_interest': [0] * 3,
+        'delta': [np.nan, np.nan, -0.45],
+        'gamma': [np.nan] * 3,
+        'theta': [np.nan] * 3,
+        'vega': [np.nan] * 3,
+        'iv': [np.nan] * 3,
+    }
+    table = OptionChainTable.from_columns(columns, [None] * 3)
+
+    assert table.fill_missing_greeks(100.0, today) == 2
+
+    delta, _, _, _ = bs_greeks(100.0, strikes, years, 0.04, 0.25, is_call)
+    assert table.iv[:2] == pytest.approx([0.25, 0.25], abs=1e-3)
+    assert table.delta[:2] == pytest.approx(delta, abs=1e-3)
+    assert table.delta[2] == pytest.approx(-0.45)
+
+
+def test_option_pool_recycles_instances():
+    """Test that released options are reused by the next conversion."""
+    columns = {
+        'symbol': ['SPY'],
+        'strike': [440.0],
+        'expiration': [datetime(2024, 2, 16)],
+        'right': ['P'],
+        'bid': [2.40],
+        'ask': [2.60],
+        'last': [2.50],
+        'volume': [10],
+        'open_interest': [0],
+        'delta': [-0.30],
+        'gamma': [np.nan],
+        'theta': [-0.05],
+        'vega': [0.20],
+        'iv': [0.18],
+    }
+    table = OptionChainTable.from_columns(columns, [None])
+    pool = _OptionPool()
+
+    first = table.to_options(pool)
+    option = first[0]
+    pool.free(first)
+
+    second = table.to_options(pool)
+    assert second[0] is option
+    assert second[0].strike == 440.0
+    assert second[0].gamma is None
+
+
+def test_option_chain_table_empty():
+    """Test that an empty table converts to an empty list."""
+    table = OptionChainTable.from_columns({}, [])
+
+    assert len(table) == 0
+    assert table.to_options() == []
+
+
+def test_no_blocking_qualify_calls():
+    """Test that async code never calls the blocking qualifyContracts."""
+    src_dir = Path(__file__).resolve().parent.parent / 'src'
+
+    offenders = [
+        path.name
+        for path in src_dir.glob('*.py')
+        if re.search(r'\.qualifyContracts\(', path.read_text(encoding='utf-8'))
+    ]
+
+    assert offenders == []
+
+
+def test_options_chain_table_processes_tickers_as_they_complete(fetcher, monkeypatch):
+    """Test that quoted options are collected and every stream is cancelled."""
+    expiration = (date.today() + timedelta(days=35)).strftime('%Y%m%d')
+    chain = SimpleNamespace(expirations=[expiration], strikes=[440.0, 450.0, 460.0])
+    tickers = {}
+    cancelled = []
+
+    async def connected():
+        pass
+
+    async def fake_qualified_stock(symbol):
+        return Stock(symbol, 'SMART', 'USD', conId=1)
+
+    async def fake_sec_def(*args):
+        return [chain]
+
+    async def fake_qualify(*contracts):
+        return list(contracts)
+
+    def fake_req_mkt_data(contract, *args):
+        ticker = Ticker(contract=contract)
+        tickers[contract.strike] = ticker
+        return ticker
+
+    monkeypatch.setattr(fetcher, '_ensure_connected', connected)
+    monkeypatch.setattr(fetcher, '_qualified_stock', fake_qualified_stock)
+    monkeypatch.setattr(fetcher.ib, 'reqSecDefOptParamsAsync', fake_sec_def)
+    monkeypatch.setattr(fetcher.ib, 'qualifyContractsAsync', fake_qualify)
+    monkeypatch.setattr(fetcher.ib, 'reqMktData', fake_req_mkt_data)
+    monkeypatch.setattr(fetcher.ib, 'cancelMktData', lambda c: cancelled.append(c.strike))
+
+    async def fetch():
+        task = asyncio.ensure_future(fetcher.get_options_chain_table(
+            'SPY', right='P', moneyness=(0.9, 1.1), stock_price=450.0
+        ))
+        while len(tickers) < 3:
+            await asyncio.sleep(0.01)
+
+        # 450 and 440 quote fully, 460 never gets greeks
+        for strike, delta in ((450.0, -0.50), (440.0, -0.30)):
+            ticker = tickers[strike]
+            ticker.bid, ticker.ask = 2.40, 2.60
+            ticker.modelGreeks = OptionComputation(0, 0.2, delta, 0, 0.01, 0.2, -0.05, 0)
+            ticker.updateEvent.emit(ticker)
+
+        return await task
+
+    table = asyncio.run(fetch())
+
+    assert table.strike.tolist() == [450.0, 440.0, 460.0]
+    assert np.isnan(table.delta[2])
+    assert sorted(cancelled) == [440.0, 450.0, 460.0]
+
+
+def test_option_params_requested_once_per_day(fetcher, monkeypatch):
+    """Test that option expirations/strikes are fetched once per symbol per day."""
+    requests = []
+
+    async def connected():
+        pass
+
+    async def fake_qualified_stock(symbol):
+        return Stock(symbol, 'SMART', 'USD', conId=1)
+
+    async def fake_sec_def(symbol, *args):
+        requests.append(symbol)
+        return [] if symbol == 'XYZ' else [SimpleNamespace(expirations=[], strikes=[])]
+
+    monkeypatch.setattr(fetcher, '_ensure_connected', connected)
+    monkeypatch.setattr(fetcher, '_qualified_stock', fake_qualified_stock)
+    monkeypatch.setattr(fetcher.ib, 'reqSecDefOptParamsAsync', fake_sec_def)
+
+    async def run():
+        await fetcher.preload_option_params(['SPY', 'XYZ'])
+        return await fetcher._get_option_params('SPY'), await fetcher._get_option_params('XYZ')
+
+    spy, xyz = asyncio.run(run())
+
+    assert spy is not None and xyz is None
+    assert sorted(requests) == ['SPY', 'XYZ']
+
+    # A new trading day refreshes the listing
+    fetcher._option_params['SPY'] = (spy, date.today() - timedelta(days=1))
+    asyncio.run(fetcher._get_option_params('SPY'))
+    assert requests.count('SPY') == 2
+
+
+def test_position_symbols_are_interned(fetcher, monkeypatch):
+    """Test that fetched positions share one string object per symbol."""
+    async def connected():
+        pass
+
+    expiration = (date.today() + timedelta(days=30)).strftime('%Y%m%d')
+    items = [
+        SimpleNamespace(contract=contract, position=qty, averageCost=1.0, marketValue=1.0,
+                        unrealizedPNL=0.0, realizedPNL=0.0)
+        for contract, qty in (
+            (Stock(''.join(['S', 'PY']), 'SMART', 'USD'), 100),
+            (Option(''.join(['S', 'PY']), expiration, 440.0, 'P', 'SMART'), -1),
+        )
+    ]
+    monkeypatch.setattr(fetcher, '_ensure_connected', connected)
+    monkeypatch.setattr(fetcher.ib, 'portfolio', lambda: items)
+
+    stock, put = asyncio.run(fetcher.get_positions())
+
+    assert (stock.position_type, put.position_type, put.right) == ('stock', 'option', 'P')
+    assert stock.symbol is put.symbol is sys.intern('SPY')
@@ -2,15 +2,17 @@
 Unit tests for Iron Condor strategy module.
 """
 
+import numpy as np
 import pytest
-from datetime import datetime, timedelta
-from src.iron_condor_strategy import IronCondorStrategy
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from src.iron_condor_strategy import IronCondorGroup, IronCondorStrategy, _match_condor_legs
 from src.strategy_base import StrategyType, Action
 from src.config_loader import SymbolConfig
 from src.data_fetcher import OptionChainData, Position, AccountInfo
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def symbol_config():
     """Create a test symbol configuration."""
     return SymbolConfig(
@@ -24,7 +26,7 @@ def symbol_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def account_info():
     """Create test account information."""
     return AccountInfo(
@@ -39,36 +41,10 @@ def account_info():
     )
 
 
-def test_strategy_initialization(symbol_config):
-    """Test Iron Condor strategy initialization."""
-    strategy = IronCondorStrategy(symbol_config)
-
-    assert strategy.symbol == 'SPY'
-    assert strategy.get_strategy_type() == StrategyType.IRON_CONDOR
-    assert strategy.wing_width == 5.0
-
-
-def test_compatibility_with_neutral_low_vol(symbol_config):
-    """Test that Iron Condor is compatible with neutral, low volatility."""
-    strategy = IronCondorStrategy(symbol_config)
-
-    # Should be compatible
-    assert strategy.is_compatible_with(450.0, volatility=0.18, trend='neutral')
-
-    # Should not be compatible with trending markets
-    assert not strategy.is_compatible_with(450.0, volatility=0.18, trend='bullish')
-    assert not strategy.is_compatible_with(450.0, volatility=0.18, trend='bearish')
-
-    # Should not be compatible with high volatility
-    assert not strategy.is_compatible_with(450.0, volatility=0.40, trend='neutral')
-
-
-def test_find_new_iron_condor(symbol_config, account_info):
-    """Test finding a new iron condor to open."""
-    strategy = IronCondorStrategy(symbol_config)
+@pytest.fixture(scope='module')
+def ic_options_chain():
+    """Create puts and calls at every strike from 430 to 470, 35 days out."""
     stock_price = 450.0
-
-    # Create a comprehensive mock options chain
     exp_date = datetime.now() + timedelta(days=35)
     options_chain = []
 
@@ -114,10 +90,42 @@ def test_find_new_iron_condor(symbol_config, account_info):
         )
         options_chain.append(call)
 
+    return options_chain
+
+
+def test_strategy_initialization(symbol_config):
+    """Test Iron Condor strategy initialization."""
+    strategy = IronCondorStrategy(symbol_config)
+
+    assert strategy.symbol == 'SPY'
+    assert strategy.get_strategy_type() == StrategyType.IRON_CONDOR
+    assert strategy.wing_width == 5.0
+
+
+def test_compatibility_with_neutral_low_vol(symbol_config):
+    """Test that Iron Condor is compatible with neutral, low volatility."""
+    strategy = IronCondorStrategy(symbol_config)
+
+    # Should be compatible
+    assert strategy.is_compatible_with(450.0, volatility=0.18, trend='neutral')
+
+    # Should not be compatible with trending markets
+    assert not strategy.is_compatible_with(450.0, volatility=0.18, trend='bullish')
+    assert not strategy.is_compatible_with(450.0, volatility=0.18, trend='bearish')
+
+    # Should not be compatible with high volatility
+    assert not strategy.is_compatible_with(450.0, volatility=0.40, trend='neutral')
+
+
+def test_find_new_iron_condor(symbol_config, account_info, ic_options_chain):
+    """Test finding a new iron condor to open."""
+    strategy = IronCondorStrategy(symbol_config)
+    stock_price = 450.0
+
     # Try to find a new iron condor
     recommendation = strategy._find_new_iron_condor(
         stock_price,
-        options_chain,
+        ic_options_chain,
         account_info
     )
 
@@ -187,10 +195,25 @@ def test_identify_iron_condor_positions(symbol_config):
     iron_condors = strategy._identify_iron_condor_positions(positions)
 
     assert len(iron_condors) == 1
-    assert iron_condors[0]['long_put'].strike == 435.0
-    assert iron_condors[0]['short_put'].strike == 440.0
-    assert iron_condors[0]['short_call'].strike == 460.0
-    assert iron_condors[0]['long_call'].strike == 465.0
+    assert iron_condors[0].long_put.strike == 435.0
+    assert iron_condors[0].short_put.strike == 440.0
+    assert iron_condors[0].short_call.strike == 460.0
+    assert iron_condors[0].long_call.strike == 465.0
+
+
+def test_match_condor_legs():
+    """Test leg matching across expirations, in order of first appearance."""
+    expirations = np.array([20, 20, 10, 10, 20, 10, 10, 20, 30, 30, 30])
+    is_call = np.array([1, 0, 0, 1, 1, 1, 0, 0, 0, 0, 1], dtype=bool)
+    signs = np.array([-1, 1, -1, -1, 1, 1, 1, -1, -1, 1, -1])
+
+    legs = _match_condor_legs(expirations, is_call, signs)
+
+    # Expiration 30 has three legs, so only 20 and 10 are condors
+    assert legs.tolist() == [[1, 7, 0, 4], [6, 2, 3, 5]]
+
+    empty = np.array([], dtype=np.int64)
+    assert _match_condor_legs(empty, empty.astype(bool), empty).shape == (0, 4)
 
 
 def test_analyze_no_positions(symbol_config, account_info):
@@ -212,7 +235,7 @@ def test_analyze_no_positions(symbol_config, account_info):
 
 def test_disabled_symbol_returns_empty(symbol_config, account_info):
     """Test that disabled symbol returns no recommendations."""
-    symbol_config.enabled = False
+    symbol_config = replace(symbol_config, enabled=False)
     strategy = IronCondorStrategy(symbol_config)
     stock_price = 450.0
 
@@ -224,3 +247,175 @@ def test_disabled_symbol_returns_empty(symbol_config, account_info):
     )
 
     assert len(recommendations) == 0
+
+
+def _option(strike, right, mid, delta, expiration):
+    """Build a quoted option with a 0.20 wide market around mid."""
+    return OptionChainData(
+        symbol='SPY',
+        strike=strike,
+        expiration=expiration,
+        right=right,
+        bid=mid - 0.10,
+        ask=mid + 0.10,
+        last=mid,
+        volume=100,
+        open_interest=500,
+        delta=delta
+    )
+
+
+def test_valid_expirations_and_option_at_strike(symbol_config):
+    """Test expiration filtering and exact strike lookup."""
+    strategy = IronCondorStrategy(symbol_config)
+    near = datetime.now() + timedelta(days=10)
+    first = datetime.now() + timedelta(days=35)
+    second = datetime.now() + timedelta(days=42)
+
+    options_chain = [
+        _option(440.0, 'P', 2.5, -0.30, second),
+        _option(440.0, 'P', 2.5, -0.30, first),
+        _option(435.0, 'P', 1.5, -0.20, first),
+        _option(440.0, 'P', 2.5, -0.30, near),
+        _option(445.0, 'P', 0.0, -0.40, first),  # No bid
+    ]
+
+    assert strategy._get_valid_expirations(options_chain) == [first, second]
+    assert strategy._get_target_expiration(options_chain) == first
+
+    assert strategy._find_option_at_strike(options_chain, 'P', 435.0, first) is options_chain[2]
+    assert strategy._find_option_at_strike(options_chain, 'P', 440.0, second) is options_chain[0]
+    assert strategy._find_option_at_strike(options_chain, 'C', 440.0, first) is None
+    assert strategy._find_option_at_strike(options_chain, 'P', 445.0, first) is None
+
+
+def test_valid_expirations_use_given_date(symbol_config):
+    """Test that DTE is measured from the date passed in."""
+    strategy = IronCondorStrategy(symbol_config)
+    expiration = datetime(2024, 2, 16)
+    options_chain = [_option(440.0, 'P', 2.5, -0.30, expiration)]
+
+    assert strategy._get_valid_expirations(options_chain, date(2024, 1, 12)) == [expiration]
+    assert strategy._get_valid_expirations(options_chain, date(2024, 2, 9)) == []
+    assert strategy._get_target_expiration(options_chain, date(2024, 2, 9)) is None
+
+
+def test_find_new_iron_condor_selects_all_legs(symbol_config, account_info):
+    """Test that the ~30 delta shorts and wing_width longs are selected."""
+    strategy = IronCondorStrategy(symbol_config)
+    expiration = datetime.now() + timedelta(days=35)
+
+    options_chain = [
+        _option(430.0, 'P', 0.8, -0.15, expiration),
+        _option(435.0, 'P', 1.2, -0.22, expiration),
+        _option(440.0, 'P', 2.2, -0.31, expiration),
+        _option(445.0, 'P', 3.5, -0.40, expiration),
+        _option(455.0, 'C', 3.4, 0.40, expiration),
+        _option(460.0, 'C', 2.1, 0.29, expiration),
+        _option(465.0, 'C', 1.1, 0.20, expiration),
+        _option(470.0, 'C', 0.7, 0.14, expiration),
+    ]
+
+    rec = strategy._find_new_iron_condor(450.0, options_chain, account_info)
+
+    assert rec.action == Action.SELL_IRON_CONDOR
+    assert (rec.long_put_strike, rec.short_put_strike) == (435.0, 440.0)
+    assert (rec.short_call_strike, rec.long_call_strike) == (460.0, 465.0)
+    assert rec.expected_credit == pytest.approx(200.0)
+
+
+def _leg(strike, right, quantity, expiration, market_value=100.0, avg_cost=1.00):
+    """Build an option position leg."""
+    return Position(
+        symbol='SPY',
+        position_type='option',
+        quantity=quantity,
+        avg_cost=avg_cost,
+        market_value=market_value,
+        unrealized_pnl=0.0,
+        realized_pnl=0.0,
+        strike=strike,
+        expiration=expiration,
+        right=right
+    )
+
+
+def test_identify_iron_condor_positions_reuses_layout(symbol_config, monkeypatch):
+    """Test that unchanged legs skip regrouping but pick up fresh positions."""
+    strategy = IronCondorStrategy(symbol_config)
+    expiration = datetime.now() + timedelta(days=30)
+    calls = []
+    group = strategy._group_iron_condor_legs
+    monkeypatch.setattr(strategy, '_group_iron_condor_legs', lambda p: calls.append(1) or group(p))
+
+    def legs(market_value, short_put_qty=-1):
+        return [
+            _leg(435.0, 'P', 1, expiration),
+            _leg(440.0, 'P', short_put_qty, expiration, market_value),
+            _leg(460.0, 'C', -1, expiration),
+            _leg(465.0, 'C', 1, expiration),
+        ]
+
+    strategy._identify_iron_condor_positions(legs(-250.0))
+    refreshed = legs(-120.0)
+    iron_condors = strategy._identify_iron_condor_positions(refreshed)
+
+    assert len(calls) == 1
+    assert iron_condors[0].short_put is refreshed[1]
+
+    assert strategy._identify_iron_condor_positions(legs(-120.0, short_put_qty=1)) == []
+    assert len(calls) == 2
+
+
+def test_check_iron_condor_position_actions(symbol_config):
+    """Test profit-taking, rolling and adjustment decisions."""
+    strategy = IronCondorStrategy(symbol_config)
+
+    def condor(days, short_mv, long_mv):
+        expiration = datetime.now() + timedelta(days=days)
+        return IronCondorGroup(
+            expiration=expiration.date(),
+            long_put=_leg(435.0, 'P', 1, expiration, long_mv, 1.00),
+            short_put=_leg(440.0, 'P', -1, expiration, short_mv, 2.50),
+            short_call=_leg(460.0, 'C', -1, expiration, short_mv, 2.50),
+            long_call=_leg(465.0, 'C', 1, expiration, long_mv, 1.00),
+        )
+
+    # Entry credit is 2.50 + 2.50 - 1.00 - 1.00 = 3.00; now worth 1.20 (60% profit)
+    rec = strategy._check_iron_condor_position(condor(35, -0.3, 0.3), 450.0, [])
+    assert rec.action == Action.CLOSE_IRON_CONDOR
+
+    # Flat P&L but inside the roll window
+    rec = strategy._check_iron_condor_position(condor(10, -1.0, 0.5), 450.0, [])
+    assert rec.action == Action.ROLL_IRON_CONDOR
+
+    # Flat P&L with the stock near the short put
+    rec = strategy._check_iron_condor_position(condor(35, -1.0, 0.5), 445.0, [])
+    assert rec.action == Action.ADJUST_IRON_CONDOR
+    assert rec.quantity == 1
+
+
+def test_analyze_manages_each_iron_condor(symbol_config, account_info):
+    """Test that analyze() evaluates every condor from the batched metrics."""
+    strategy = IronCondorStrategy(symbol_config)
+    near = datetime.now() + timedelta(days=30)
+    far = datetime.now() + timedelta(days=37)
+
+    positions = [
+        # Worth 1.20 against a 3.00 credit: take profit
+        _leg(435.0, 'P', 1, near, 0.3, 1.00),
+        _leg(440.0, 'P', -1, near, -0.3, 2.50),
+        _leg(460.0, 'C', -1, near, -0.3, 2.50),
+        _leg(465.0, 'C', 1, near, 0.3, 1.00),
+        # Flat, strikes far from the stock: leave alone
+        _leg(395.0, 'P', 1, far, 0.5, 1.00),
+        _leg(400.0, 'P', -1, far, -1.0, 2.50),
+        _leg(500.0, 'C', -1, far, -1.0, 2.50),
+        _leg(505.0, 'C', 1, far, 0.5, 1.00),
+    ]
+
+    recommendations = strategy.analyze(450.0, [], positions, account_info)
+
+    assert len(recommendations) == 1
+    assert recommendations[0].action == Action.CLOSE_IRON_CONDOR
+    assert recommendations[0].short_put_strike == 440.0
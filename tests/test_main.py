@@ -0,0 +1,78 @@
+"""
+Unit tests for main module.
+"""
+
+import importlib
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('schedule')
+
+from src.data_fetcher import AccountInfo, Position
+from src.strategy_base import TradeRecommendation, Action, StrategyType
+
+
+@pytest.fixture
+def main(tmp_path, monkeypatch):
+    """Import src.main from a directory with the logs/ folder it writes to."""
+    (tmp_path / 'logs').mkdir()
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module('src.main')
+
+
+class CountingStrategy:
+    """Strategy stub that counts analyze calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_strategy_type(self):
+        return StrategyType.WHEEL
+
+    def chain_fingerprint(self, options_chain):
+        return b'chain'
+
+    def analyze(self, stock_price, options_chain, positions, account_info):
+        self.calls += 1
+        return [TradeRecommendation(
+            action=Action.SELL_PUT, symbol='SPY', quantity=1, strategy_type=StrategyType.WHEEL,
+            strike=440.0, expiration=datetime.now() + timedelta(days=35), right='P',
+            premium=2.50, reasoning="Test put sale"
+        )]
+
+
+def test_analysis_reused_by_next_cycle_until_inputs_change(main, monkeypatch):
+    """Test that the next scheduled cycle reuses an analysis of unchanged inputs."""
+    bot = main.ThetaGangBot.__new__(main.ThetaGangBot)
+    bot.config = SimpleNamespace(schedule=SimpleNamespace(run_every_minutes=60))
+    bot._analysis_cache = {}
+    strategy = CountingStrategy()
+    account = AccountInfo('DU1', 100000.0, 50000.0, 50000.0, 50000.0, 50000.0, 0.0, 50000.0)
+    put = Position('SPY', 'option', -1, -250.0, -200.0, 50.0, 0.0,
+                   strike=440.0, expiration=datetime.now() + timedelta(days=20), right='P')
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(main.time, 'monotonic', lambda: clock.now)
+
+    def analyze(positions):
+        return bot._cached_analysis('SPY', strategy, 450.0, [], positions, account)
+
+    first = analyze([put])
+    clock.now += 60 * 60  # next scheduled cycle
+    second = analyze([put])
+
+    assert strategy.calls == 1
+    assert second[0] is not first[0]
+    assert second[0].strike == first[0].strike
+
+    # A new mark on the held option is a new input
+    remarked = Position('SPY', 'option', -1, -250.0, -120.0, 130.0, 0.0,
+                        strike=put.strike, expiration=put.expiration, right='P')
+    analyze([remarked])
+    assert strategy.calls == 2
+
+    # Entries do not outlive the cycle after the one that stored them
+    clock.now += 2 * 60 * 60
+    analyze([remarked])
+    assert strategy.calls == 3
@@ -0,0 +1,225 @@
+"""
+Unit tests for order_executor module.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from ib_async import Option, Stock, MarketOrder
+
+import pytest
+
+from src.order_executor import OrderExecutor, OrderJournal, OrderRecord, OrderStatus
+from src.data_fetcher import Position
+from src.strategy_base import TradeRecommendation, Action, StrategyType
+
+
+@pytest.fixture
+def executor():
+    """Create a dry-run executor that records the contracts it qualifies."""
+    qualified = []
+
+    async def fake_qualify(*contracts):
+        qualified.extend(contracts)
+        return list(contracts)
+
+    executor = OrderExecutor(ib=SimpleNamespace(qualifyContractsAsync=fake_qualify), dry_run=True)
+    executor.qualified = qualified
+    return executor
+
+
+def _sell_put(strike):
+    return TradeRecommendation(
+        action=Action.SELL_PUT,
+        symbol='SPY',
+        quantity=1,
+        strategy_type=StrategyType.WHEEL,
+        strike=strike,
+        expiration=datetime.now() + timedelta(days=35),
+        right='P',
+        premium=2.50,
+        reasoning="Test put sale"
+    )
+
+
+def test_order_statistics_track_status_changes(executor):
+    """Test that statistics follow fills and cancellations."""
+    first = asyncio.run(executor.execute_recommendation(_sell_put(440.0)))
+    second = asyncio.run(executor.execute_recommendation(_sell_put(435.0)))
+    asyncio.run(executor.execute_recommendation(_sell_put(430.0)))
+
+    assert executor.get_order_statistics() == {
+        'total': 3, 'filled': 0, 'cancelled': 0, 'rejected': 0, 'pending': 3
+    }
+
+    asyncio.run(executor._wait_for_fill(first))
+    asyncio.run(executor.cancel_order(second))
+
+    assert executor.get_order_statistics() == {
+        'total': 3, 'filled': 1, 'cancelled': 1, 'rejected': 0, 'pending': 1
+    }
+
+
+def test_get_order_status_returns_first_record_for_id(executor):
+    """Test order lookup by ID."""
+    first = asyncio.run(executor.execute_recommendation(_sell_put(440.0)))
+    asyncio.run(executor.execute_recommendation(_sell_put(435.0)))
+
+    # Dry-run orders all carry ID 0; the earliest one is returned
+    assert executor.get_order_status(0) is first
+    assert first.status == OrderStatus.PENDING
+    assert executor.get_order_status(42) is None
+
+
+def test_order_history_is_bounded(executor):
+    """Test that old records leave the history but still count in statistics."""
+    executor = OrderExecutor(ib=executor.ib, dry_run=True, max_history=2)
+    orders = [
+        asyncio.run(executor.execute_recommendation(_sell_put(strike)))
+        for strike in (440.0, 435.0, 430.0)
+    ]
+
+    assert list(executor.order_history) == orders[1:]
+    assert executor.get_recent_orders(1) == orders[2:]
+    assert executor.get_recent_orders() == orders[1:]
+    assert executor.get_order_status(0) is not orders[0]
+    assert executor.get_order_statistics()['total'] == 3
+
+
+def test_wait_for_fill_wakes_on_fill_callback():
+    """Test that a live wait returns as soon as the fill callback fires."""
+    executor = OrderExecutor(ib=None, dry_run=False)
+    record = OrderRecord(
+        order_id=7, symbol='SPY', action='BUY', quantity=1, order_type='MARKET',
+        limit_price=None, status=OrderStatus.SUBMITTED, filled_quantity=0,
+        avg_fill_price=None, submitted_at=datetime.now(), filled_at=None,
+        commission=None, recommendation=_sell_put(440.0)
+    )
+    executor._record_order(record)
+    trade = SimpleNamespace(orderStatus=SimpleNamespace(filled=1, avgFillPrice=1.25))
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, executor._on_order_filled, record, trade)
+        start = loop.time()
+        filled = await executor._wait_for_fill(record, timeout=5)
+        return filled, loop.time() - start
+
+    filled, elapsed = asyncio.run(run())
+
+    assert filled
+    assert elapsed < 1
+    assert record.avg_fill_price == 1.25
+    assert executor.get_order_statistics()['filled'] == 1
+
+    # Already final: returns without waiting
+    assert asyncio.run(executor._wait_for_fill(record, timeout=0))
+
+
+def test_option_contracts_are_qualified_once(executor):
+    """Test that repeat sales of one option reuse its qualified contract."""
+    for strike in (440.0, 440.0, 435.0):
+        asyncio.run(executor.execute_recommendation(_sell_put(strike)))
+
+    assert [c.strike for c in executor.qualified] == [440.0, 435.0]
+    assert len(executor.order_history) == 3
+
+
+def test_unqualified_option_is_not_sold(executor):
+    """Test that a contract IBKR cannot qualify is skipped and not cached."""
+    async def fail_qualify(*contracts):
+        return [None for _ in contracts]
+
+    executor.ib = SimpleNamespace(qualifyContractsAsync=fail_qualify)
+
+    assert asyncio.run(executor.execute_recommendation(_sell_put(440.0))) is None
+    assert executor._contract_cache == {}
+    assert len(executor.order_history) == 0
+
+
+def test_journal_records_submissions_and_status_changes(executor, tmp_path):
+    """Test that the journal holds one line per order event."""
+    path = tmp_path / 'orders.jsonl'
+    executor.journal = OrderJournal(path)
+
+    record = asyncio.run(executor.execute_recommendation(_sell_put(440.0)))
+    asyncio.run(executor._wait_for_fill(record))
+    executor.journal.close()
+
+    entries = [json.loads(line) for line in path.read_text().splitlines()]
+
+    assert [e['event'] for e in entries] == ['submitted', 'status']
+    assert entries[0]['limit_price'] == record.limit_price
+    assert entries[0]['status'] == 'pending'
+    assert entries[1]['status'] == 'filled'
+
+
+def test_market_order_is_recorded_without_limit_price(executor):
+    """Test that order type and limit price come from the order class."""
+    record = asyncio.run(executor._submit_order(
+        Stock('SPY', 'SMART', 'USD'), MarketOrder('SELL', 100), _sell_put(440.0)
+    ))
+    limit = asyncio.run(executor.execute_recommendation(_sell_put(440.0)))
+
+    assert (record.order_type, record.limit_price) == ('MARKET', None)
+    assert limit.order_type == 'LIMIT'
+    assert limit.limit_price == 2.50
+
+
+def test_roll_is_one_combo_order(executor):
+    """Test that a roll closes and opens both legs in a single BAG order."""
+    expiration = datetime.now() + timedelta(days=5)
+    position = Position(
+        symbol='SPY', position_type='option', quantity=-2, avg_cost=-300.0,
+        market_value=-300.0, unrealized_pnl=0.0, realized_pnl=0.0,
+        strike=440.0, expiration=expiration, right='P',
+        contract=Option('SPY', expiration.strftime('%Y%m%d'), 440.0, 'P', 'SMART', conId=11)
+    )
+    roll = TradeRecommendation(
+        action=Action.ROLL_PUT,
+        symbol='SPY',
+        quantity=2,
+        strategy_type=StrategyType.WHEEL,
+        existing_position=position,
+        new_strike=435.0,
+        new_expiration=datetime.now() + timedelta(days=35),
+        premium=2.50,
+        reasoning="Test roll"
+    )
+
+    record = asyncio.run(executor.execute_recommendation(roll))
+
+    assert len(executor.order_history) == 1
+    assert record.recommendation is roll
+    assert record.quantity == 2
+    # Buy back at the 1.50 mark, sell the new put at 2.50: 1.00 net credit
+    assert record.limit_price == -1.00
+    assert [c.strike for c in executor.qualified] == [435.0]
+
+
+def test_roll_without_mark_is_not_submitted(executor):
+    """Test that a roll is refused when the old option has no mark to price it."""
+    expiration = datetime.now() + timedelta(days=5)
+    position = Position(
+        symbol='SPY', position_type='option', quantity=-2, avg_cost=-300.0,
+        market_value=0.0, unrealized_pnl=0.0, realized_pnl=0.0,
+        strike=440.0, expiration=expiration, right='P',
+        contract=Option('SPY', expiration.strftime('%Y%m%d'), 440.0, 'P', 'SMART', conId=11)
+    )
+    roll = TradeRecommendation(
+        action=Action.ROLL_PUT,
+        symbol='SPY',
+        quantity=2,
+        strategy_type=StrategyType.WHEEL,
+        existing_position=position,
+        new_strike=435.0,
+        new_expiration=datetime.now() + timedelta(days=35),
+        premium=2.50,
+        reasoning="Test roll"
+    )
+
+    assert asyncio.run(executor.execute_recommendation(roll)) is None
+    assert len(executor.order_history) == 0
+    assert executor.qualified == []
@@ -0,0 +1,203 @@
+"""
+Unit tests for risk_manager module.
+"""
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+
+from src.risk_manager import RiskManager, RiskViolation, PositionSummary, TradeEstimate
+from src.config_loader import RiskConfig, SymbolConfig
+from src.strategy_base import TradeRecommendation, Action, StrategyType
+from src.data_fetcher import Position, AccountInfo
+
+
+@pytest.fixture
+def risk_manager():
+    """Create a risk manager with two configured symbols."""
+    symbol_configs = {
+        'SPY': SymbolConfig(symbol='SPY', max_positions=2, max_position_size_percent=20.0),
+        'QQQ': SymbolConfig(symbol='QQQ', max_positions=1, max_position_size_percent=20.0),
+    }
+    return RiskManager(RiskConfig(max_total_positions=3), symbol_configs)
+
+
+@pytest.fixture
+def account_info():
+    """Create sample account info."""
+    return AccountInfo(
+        account_number='TEST123',
+        net_liquidation=100000.0,
+        total_cash=50000.0,
+        buying_power=50000.0,
+        available_funds=50000.0,
+        excess_liquidity=50000.0,
+        margin_used=10000.0,
+        margin_available=40000.0
+    )
+
+
+@pytest.fixture
+def positions():
+    """Create an open QQQ put and a closed SPY put."""
+    expiration = datetime.now() + timedelta(days=30)
+    return [
+        Position('QQQ', 'option', -1, 2.0, -150.0, 50.0, 0.0,
+                 strike=380.0, expiration=expiration, right='P'),
+        Position('SPY', 'option', 0, 2.5, 0.0, 0.0, 250.0,
+                 strike=440.0, expiration=expiration, right='P'),
+    ]
+
+
+def _sell_put(symbol, strike, quantity=1):
+    return TradeRecommendation(
+        action=Action.SELL_PUT,
+        symbol=symbol,
+        quantity=quantity,
+        strategy_type=StrategyType.WHEEL,
+        strike=strike,
+        expiration=datetime.now() + timedelta(days=35),
+        right='P',
+        premium=2.50
+    )
+
+
+def test_position_summary(positions):
+    """Test that closed positions count toward exposure but not open positions."""
+    summary = PositionSummary.from_positions(positions)
+
+    assert summary.open_positions == 1
+    assert summary.open_by_symbol == {'QQQ': 1}
+    assert summary.exposure_by_symbol == {'QQQ': 150.0, 'SPY': 0.0}
+
+
+def test_validate_trades_batch_matches_single_validation(risk_manager, positions, account_info):
+    """Test that batch validation flags the same violations as one-by-one validation."""
+    recommendations = [
+        _sell_put('SPY', 150.0),
+        _sell_put('QQQ', 100.0),  # QQQ already at its position limit
+        _sell_put('SPY', 450.0, quantity=2),  # Exceeds the margin limit
+    ]
+
+    batch = risk_manager.validate_trades_batch(recommendations, positions, account_info, 20.0)
+    single = [
+        risk_manager.validate_trade(rec, positions, account_info, 20.0)
+        for rec in recommendations
+    ]
+
+    assert [r.violations for r in batch] == [r.violations for r in single]
+    assert [result.approved for result in batch] == [True, False, False]
+    assert RiskViolation.POSITION_LIMIT_EXCEEDED in batch[1].violations
+    assert batch[2].violations == RiskViolation.MARGIN_EXCEEDED
+
+
+def test_calculate_portfolio_risk(risk_manager, positions, account_info):
+    """Test per-symbol concentration and open position count."""
+    positions = positions + [
+        Position('QQQ', 'stock', 10, 380.0, 3850.0, 50.0, 0.0)
+    ]
+
+    risk = risk_manager.calculate_portfolio_risk(positions, account_info)
+
+    assert risk.total_positions == 2
+    assert risk.margin_usage_percent == pytest.approx(0.10)
+    assert risk.concentration_by_symbol == pytest.approx({'QQQ': 0.04, 'SPY': 0.0})
+    assert risk.max_concentration == pytest.approx(0.04)
+
+    empty = risk_manager.calculate_portfolio_risk([], account_info)
+    assert empty.concentration_by_symbol == {}
+    assert empty.max_concentration == 0.0
+
+
+def test_position_summary_reused_for_same_positions(risk_manager, positions, account_info):
+    """Test that validations against one positions list share its summary."""
+    summary = risk_manager._get_summary(positions)
+
+    risk_manager.validate_trade(_sell_put('SPY', 150.0), positions, account_info)
+    assert risk_manager._get_summary(positions) is summary
+
+    # A new list, or one that changed size, is summarized again
+    assert risk_manager._get_summary(list(positions)) is not summary
+    positions.pop()
+    assert risk_manager._get_summary(positions).exposure_by_symbol == {'QQQ': 150.0}
+
+
+def test_fail_fast_stops_at_first_violation(positions, account_info):
+    """Test that fail_fast skips later checks and can be turned off."""
+    trade = _sell_put('SPY', 450.0, quantity=2)
+
+    fast = RiskManager(RiskConfig(), {}).validate_trade(trade, positions, account_info)
+    full = RiskManager(RiskConfig(fail_fast=False), {}).validate_trade(trade, positions, account_info)
+
+    assert fast.violations == RiskViolation.MARGIN_EXCEEDED
+    assert full.violation_list() == [
+        RiskViolation.MARGIN_EXCEEDED,
+        RiskViolation.CONCENTRATION_EXCEEDED,
+        RiskViolation.BUYING_POWER_INSUFFICIENT,
+    ]
+    assert full.reason_messages() == [
+        "Trade would increase margin usage to 100.0% (limit: 50.0%)",
+        "Trade would increase SPY concentration to 90.0% (limit: 25.0%)",
+        "Insufficient buying power: need $90,000.00, have $50,000.00",
+    ]
+
+
+def test_check_stop_losses(positions, account_info):
+    """Test that only short options past the loss limit trigger a stop."""
+    risk_manager = RiskManager(RiskConfig(enable_stop_loss=True, stop_loss_percent=50.0), {})
+    positions = positions + [
+        Position('SPY', 'stock', -100, 450.0, -90000.0, 0.0, 0.0)
+    ]
+
+    # QQQ short put: credit 2.00, now costs 3.50 (75% loss)
+    triggered = risk_manager.check_stop_losses(positions, np.array([-3.5, 0.0, -90000.0]))
+
+    assert triggered.tolist() == [True, False, False]
+    assert not risk_manager.check_stop_loss(positions[0], -2.9)
+    assert risk_manager.check_stop_loss(positions[0], -3.1)
+    assert not RiskManager(RiskConfig(), {}).check_stop_losses(positions).any()
+
+
+def test_checks_selected_from_config(risk_manager):
+    """Test that checks which cannot fail under the config are not run."""
+    bare = RiskManager(RiskConfig(reduce_size_when_vix_above=None), {})
+
+    assert bare._check_position_limits not in bare._checks
+    assert not bare._vix_enabled
+    assert risk_manager._check_position_limits in risk_manager._checks
+    assert risk_manager._vix_enabled
+
+
+def test_batch_counts_earlier_approvals_against_later_trades(risk_manager, positions, account_info):
+    """Test that approved trades use up concentration and position limits for later ones."""
+    recommendations = [
+        _sell_put('SPY', 150.0),
+        _sell_put('SPY', 150.0),  # SPY would reach 30% of the portfolio
+        _sell_put('IWM', 100.0),
+        _sell_put('IWM', 100.0),  # Fourth open position, limit is three
+    ]
+
+    results = risk_manager.validate_trades_batch(recommendations, positions, account_info)
+
+    assert [r.approved for r in results] == [True, False, True, False]
+    assert results[1].violations == RiskViolation.CONCENTRATION_EXCEEDED
+    assert results[3].violations == RiskViolation.POSITION_LIMIT_EXCEEDED
+    assert all(
+        risk_manager.validate_trade(rec, positions, account_info).approved
+        for rec in recommendations
+    )
+
+
+def test_approved_checks_share_one_result(risk_manager, positions, account_info):
+    """Test that checks finding nothing return the shared approved result."""
+    trade = _sell_put('SPY', 100.0)
+    estimate = TradeEstimate(margin=10000.0, position_value=10000.0)
+    summary = PositionSummary.from_positions(positions)
+
+    results = [check(trade, estimate, summary, account_info) for check in risk_manager._checks]
+    small = risk_manager._check_vix_limits(15.0, trade)
+
+    assert all(r is results[0] for r in results + [small])
+    assert results[0].approved
+    assert not results[0].violations
+    assert results[0].reasons == ()
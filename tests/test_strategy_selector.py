@@ -0,0 +1,248 @@
+"""
+Unit tests for strategy_selector module.
+"""
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+import src.strategy_selector as strategy_selector
+from src.strategy_selector import (
+    REGIMES,
+    MarketRegime,
+    StrategySelector,
+    classify_market_regime,
+    classify_market_regimes,
+)
+from src.strategy_base import StrategyType
+from src.config_loader import StrategyConfig, SymbolConfig
+from src.data_fetcher import Position, PositionBatch
+
+
+@pytest.fixture
+def selector():
+    """Create a selector with both strategies enabled for two symbols."""
+    symbol_configs = {
+        'SPY': SymbolConfig(symbol='SPY', max_positions=2),
+        'QQQ': SymbolConfig(symbol='QQQ', max_positions=1),
+    }
+    return StrategySelector(
+        StrategyConfig(wheel_enabled=True, iron_condor_enabled=True),
+        symbol_configs
+    )
+
+
+def test_strategy_instances_are_reused(selector):
+    """Test that each symbol and strategy type gets one shared instance."""
+    wheel = selector.select_best_strategy('SPY', 450.0, 0.30, 'bullish')
+    compatible = selector.get_strategies_for_symbol('SPY', 450.0, 0.30, 'neutral')
+
+    assert wheel.get_strategy_type() == StrategyType.WHEEL
+    assert selector.select_best_strategy('SPY', 450.0, 0.45, 'neutral') is wheel
+    assert compatible[0] is wheel
+    assert selector.select_best_strategy('QQQ', 380.0, 0.30, 'bullish') is not wheel
+
+
+def test_reload_configs_rebuilds_strategies(selector):
+    """Test that strategies are rebuilt from reloaded symbol configs."""
+    wheel = selector.select_best_strategy('SPY', 450.0, 0.30, 'bullish')
+    new_config = SymbolConfig(symbol='SPY', max_positions=5)
+
+    selector.reload_configs(selector.config, {'SPY': new_config})
+    reloaded = selector.select_best_strategy('SPY', 450.0, 0.30, 'bullish')
+
+    assert reloaded is not wheel
+    assert reloaded.config is new_config
+
+
+def test_replaced_symbol_config_gets_new_strategy(selector):
+    """Test that a swapped-in symbol config is not served a stale strategy."""
+    wheel = selector.select_best_strategy('SPY', 450.0, 0.30, 'bullish')
+    new_config = SymbolConfig(symbol='SPY', max_positions=5)
+
+    selector.symbol_configs['SPY'] = new_config
+    replaced = selector.select_best_strategy('SPY', 450.0, 0.30, 'bullish')
+
+    assert replaced is not wheel
+    assert replaced.config is new_config
+    assert selector.select_best_strategy('SPY', 450.0, 0.30, 'bullish') is replaced
+
+
+@pytest.mark.parametrize('volatility, trend, wheel, iron_condor, expected', [
+    (0.22, 'neutral', True, True, StrategyType.IRON_CONDOR),
+    (0.30, 'neutral', True, True, StrategyType.WHEEL),
+    (0.22, 'bullish', True, True, StrategyType.WHEEL),
+    (0.45, 'neutral', True, True, StrategyType.WHEEL),
+    (0.30, 'bullish', False, True, None),
+    (0.22, 'neutral', False, True, StrategyType.IRON_CONDOR),
+    (None, None, False, False, None),
+])
+def test_select_best_strategy_decision_table(volatility, trend, wheel, iron_condor, expected):
+    """Test regime-based selection for each enabled-strategy combination."""
+    selector = StrategySelector(
+        StrategyConfig(wheel_enabled=wheel, iron_condor_enabled=iron_condor),
+        {'SPY': SymbolConfig(symbol='SPY')}
+    )
+
+    strategy = selector.select_best_strategy('SPY', 450.0, volatility, trend)
+
+    assert (strategy.get_strategy_type() if strategy else None) == expected
+
+
+def _option(symbol, right, strike, quantity=-1):
+    return Position(symbol, 'option', quantity, 2.0, -200.0, 0.0, 0.0,
+                    strike=strike, expiration=datetime.now() + timedelta(days=30), right=right)
+
+
+def test_strategy_statistics(selector):
+    """Test per-symbol strategy counts across a mixed portfolio."""
+    positions = [
+        # Wheel: stock plus a covered call
+        Position('AAPL', 'stock', 100, 150.0, 15500.0, 500.0, 0.0),
+        _option('AAPL', 'C', 160.0),
+        # Wheel: a single short put
+        _option('SPY', 'P', 440.0),
+        # Iron condor: two puts, two calls
+        _option('QQQ', 'P', 360.0, 1), _option('QQQ', 'P', 370.0),
+        _option('QQQ', 'C', 400.0), _option('QQQ', 'C', 410.0, 1),
+        # Other: a put spread
+        _option('IWM', 'P', 190.0, 1), _option('IWM', 'P', 200.0),
+    ]
+
+    stats = selector.get_strategy_statistics(positions)
+
+    assert stats == {'wheel': 2, 'iron_condor': 1, 'other': 1}
+    assert selector.get_strategy_statistics(PositionBatch.from_positions(positions)) == stats
+
+    by_symbol = {'GLD': []}
+    for p in positions:
+        by_symbol.setdefault(p.symbol, []).append(p)
+    assert selector.get_strategy_statistics(by_symbol) == stats
+    assert selector.get_strategy_statistics([]) == {'wheel': 0, 'iron_condor': 0, 'other': 0}
+
+
+def test_detect_current_strategy_from_list_or_batch(selector):
+    """Test strategy detection for one symbol's positions in either form."""
+    condor = [_option('QQQ', 'P', 360.0, 1), _option('QQQ', 'P', 370.0),
+              _option('QQQ', 'C', 400.0), _option('QQQ', 'C', 410.0, 1)]
+    spread = condor[:2]
+
+    for positions, expected in ((condor, StrategyType.IRON_CONDOR), (condor[:1], StrategyType.WHEEL),
+                                (spread, None), ([], None)):
+        assert selector._detect_current_strategy(positions) == expected
+        assert selector._detect_current_strategy(PositionBatch.from_positions(positions)) == expected
+
+
+def test_allocate_strategies_matches_per_symbol_selection(selector):
+    """Test that batch screening agrees with get_strategies_for_symbol."""
+    selector.symbol_configs['IWM'] = SymbolConfig(symbol='IWM')
+    selector.symbol_configs['DIA'] = SymbolConfig(symbol='DIA')
+    market_data = {
+        'SPY': {'price': 450.0, 'volatility': 0.20, 'trend': 'neutral'},
+        'QQQ': {'price': 380.0, 'volatility': 0.40, 'trend': 'neutral'},
+        'IWM': {'price': 200.0, 'trend': 'bullish'},
+        'DIA': {'price': 350.0},
+        'XYZ': {'price': 10.0},
+    }
+
+    allocation = selector.allocate_strategies(['SPY', 'QQQ', 'IWM', 'DIA', 'XYZ', 'GLD'], market_data)
+
+    assert list(allocation) == ['SPY', 'QQQ', 'IWM', 'DIA']
+    for symbol, strategies in allocation.items():
+        data = market_data[symbol]
+        expected = selector.get_strategies_for_symbol(
+            symbol, data['price'], data.get('volatility'), data.get('trend')
+        )
+        assert strategies == expected
+    assert [s.get_strategy_type() for s in allocation['SPY']] == [
+        StrategyType.WHEEL, StrategyType.IRON_CONDOR
+    ]
+    assert [s.get_strategy_type() for s in allocation['QQQ']] == [StrategyType.WHEEL]
+
+
+def test_classify_market_regimes_matches_scalar():
+    """Test that batch regime codes agree with one-at-a-time classification."""
+    cases = [
+        (0.40, 'bullish', MarketRegime.HIGH_VOLATILITY),
+        (0.15, 'bearish', MarketRegime.LOW_VOLATILITY),
+        (0.25, 'Bullish', MarketRegime.BULLISH),
+        (0.25, 'BEARISH', MarketRegime.BEARISH),
+        (0.25, 'neutral', MarketRegime.NEUTRAL),
+        (0.0, 'bearish', MarketRegime.BEARISH),
+        (None, None, MarketRegime.NEUTRAL),
+        (None, 'sideways', MarketRegime.NEUTRAL),
+    ]
+    volatilities = np.array([np.nan if v is None else v for v, _, _ in cases])
+    trends = np.array([t or '' for _, t, _ in cases])
+
+    codes = classify_market_regimes(volatilities, trends)
+
+    assert [REGIMES[c] for c in codes] == [expected for _, _, expected in cases]
+    assert [classify_market_regime(v, t) for v, t, _ in cases] == [expected for _, _, expected in cases]
+    assert all(REGIMES[regime] is regime for regime in MarketRegime)
+
+
+def test_single_outcome_skips_regime_classification(monkeypatch):
+    """Test that a wheel-only config selects without classifying the regime."""
+    def fail(volatility, trend):
+        raise AssertionError("regime classified")
+
+    monkeypatch.setattr(strategy_selector, 'classify_market_regime', fail)
+    selector = StrategySelector(
+        StrategyConfig(wheel_enabled=True, iron_condor_enabled=False),
+        {'SPY': SymbolConfig(symbol='SPY')}
+    )
+
+    strategy = selector.select_best_strategy('SPY', 450.0, 0.22, 'neutral')
+
+    assert strategy.get_strategy_type() == StrategyType.WHEEL
+
+
+def test_existing_positions_keep_enabled_strategy():
+    """Test continuity with the detected strategy only while it is enabled."""
+    condor = [_option('SPY', 'P', 430.0, 1), _option('SPY', 'P', 440.0),
+              _option('SPY', 'C', 460.0), _option('SPY', 'C', 470.0, 1)]
+    both = StrategySelector(
+        StrategyConfig(wheel_enabled=True, iron_condor_enabled=True),
+        {'SPY': SymbolConfig(symbol='SPY')}
+    )
+    wheel_only = StrategySelector(StrategyConfig(), {'SPY': SymbolConfig(symbol='SPY')})
+
+    kept = both.select_best_strategy('SPY', 450.0, 0.40, 'bullish', existing_positions=condor)
+    switched = wheel_only.select_best_strategy('SPY', 450.0, 0.40, 'bullish', existing_positions=condor)
+
+    assert kept.get_strategy_type() == StrategyType.IRON_CONDOR
+    assert switched.get_strategy_type() == StrategyType.WHEEL
+
+
+@pytest.mark.parametrize('wheel, iron_condor', [(True, True), (True, False), (False, True)])
+def test_select_best_strategies_matches_single_selection(wheel, iron_condor):
+    """Test that batch selection agrees with selecting symbol by symbol."""
+    symbols = ['SPY', 'QQQ', 'IWM', 'DIA', 'GLD', 'TLT']
+    selector = StrategySelector(
+        StrategyConfig(wheel_enabled=wheel, iron_condor_enabled=iron_condor),
+        {symbol: SymbolConfig(symbol=symbol) for symbol in symbols}
+    )
+    market_data = {
+        'SPY': {'price': 450.0, 'volatility': 0.22, 'trend': 'neutral'},
+        'QQQ': {'price': 380.0, 'volatility': 0.40, 'trend': 'neutral'},
+        'IWM': {'price': 200.0, 'volatility': 0.22, 'trend': 'Bullish'},
+        'DIA': {'price': 350.0, 'volatility': 0.0, 'trend': 'neutral'},
+        'GLD': {'price': 180.0},
+        'TLT': {'price': 90.0, 'volatility': 0.22, 'trend': 'neutral'},
+        'XYZ': {'price': 10.0},
+    }
+    positions_by_symbol = {
+        'TLT': [_option('TLT', 'P', 85.0)],
+        'QQQ': [_option('QQQ', 'P', 360.0, 1), _option('QQQ', 'P', 370.0),
+                _option('QQQ', 'C', 400.0), _option('QQQ', 'C', 410.0, 1)],
+    }
+
+    selected = selector.select_best_strategies(market_data, positions_by_symbol)
+
+    assert list(selected) == list(market_data)
+    for symbol, data in market_data.items():
+        expected = selector.select_best_strategy(
+            symbol, data['price'], data.get('volatility'), data.get('trend'),
+            existing_positions=positions_by_symbol.get(symbol)
+        )
+        assert selected[symbol] is expected